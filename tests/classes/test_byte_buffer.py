@@ -47,3 +47,29 @@ def test_byte_buffer_basic():
 
     immut_buf = ByteBuffer(mutable=False)
     assert not immut_buf.write(Primitive.BOOLEAN, False)
+
+
+def test_byte_buffer_growth():
+    """Test that a buffer's capacity grows independently of its size."""
+
+    buf = ByteBuffer()
+    buf.reserve(16)
+    assert buf.capacity == 16
+    assert buf.size == 0
+
+    # appends and writes within the reserved capacity don't grow the buffer
+    assert buf.write(Primitive.UINT32, 1) == 4
+    assert buf.append(b"abcdef", 4) == 4
+    assert buf.capacity == 16
+    assert buf.size == 8
+
+    # growing beyond the current capacity at least doubles it
+    assert buf.append(bytes(9)) == 9
+    assert buf.capacity == 32
+    assert buf.size == 17
+
+    # consuming from the front retains the unread bytes
+    buf.set_pos(0)
+    assert buf.read(Primitive.UINT32, True) == 1
+    assert buf.size == 13
+    assert buf.read_bytes(4) == b"abcd"
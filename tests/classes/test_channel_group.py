@@ -33,3 +33,31 @@ def test_channel_group_basic():
 
     assert env.has_channel("test_group.test_chan")
     assert env.has_channel("test_group.test_enum")
+
+
+def test_channel_group_dirty():
+    """Test that only values that changed are written back."""
+
+    env = TelemetryEnvironment(2**8)
+    group = ChannelGroup("test_group", env)
+    assert env.add_from_enum(EnumA) >= 0
+    assert group.add_channel("a", Primitive.UINT32, 1.0, True)
+    assert group.add_channel("b", Primitive.UINT32, 1.0, True)
+    assert group.add_enum_channel("c", "enum_a", 1.0, True)
+    env.event_queue.consume()
+
+    env.advance_time(1.0)
+    with group.data() as data:
+        data["a"] += 1
+
+    channels = group.channels
+    assert channels["a"].channel.last_set == env.get_time()
+    assert channels["b"].channel.last_set != env.get_time()
+    assert channels["c"].channel.last_set != env.get_time()
+    assert [event[0] for event in env.event_queue.consume()] == [
+        channels["a"].id
+    ]
+
+    with group.data() as data:
+        data["c"] = "c"
+    assert group.read() == {"a": 1, "b": 0, "c": "c"}
@@ -0,0 +1,51 @@
+"""
+vtelem - Test the pre-compiled codec registry's correctness.
+"""
+
+# module under test
+from vtelem.classes import DEFAULTS
+from vtelem.classes.byte_buffer import ByteBuffer
+from vtelem.classes.codec import (
+    FRAME_COUNT_OFFSET,
+    FRAME_FOOTER,
+    FRAME_HEADER,
+    get_codec,
+    get_event_codec,
+)
+from vtelem.enums.primitive import Primitive, get_size
+
+
+def test_codec_sizes():
+    """Test that compiled codecs agree with primitive definitions."""
+
+    for inst in Primitive:
+        for order in "<>!":
+            assert get_codec(inst, order).size == get_size(inst)
+            assert get_event_codec(inst, order).size == 2 * (
+                get_size(inst) + get_size(DEFAULTS["timestamp"])
+            )
+
+    header_fields = ["id", "enum", "timestamp", "count"]
+    assert FRAME_HEADER.size == sum(
+        get_size(DEFAULTS[field]) for field in header_fields
+    )
+    assert FRAME_COUNT_OFFSET + get_size(DEFAULTS["count"]) == (
+        FRAME_HEADER.size
+    )
+    assert FRAME_FOOTER.size == get_size(DEFAULTS["crc"])
+
+
+def test_codec_buffer_pack_unpack():
+    """Test that multi-field codecs can be written to and read from buffers."""
+
+    buf = ByteBuffer()
+    assert buf.pack(FRAME_HEADER, 1, 2, 3, 4) == FRAME_HEADER.size
+    assert buf.write(Primitive.FLOAT, 1.5) == get_size(Primitive.FLOAT)
+
+    buf.set_pos(0)
+    assert buf.unpack(FRAME_HEADER) == (1, 2, 3, 4)
+    assert buf.read(Primitive.FLOAT) == 1.5
+    assert not buf.remaining
+
+    immut_buf = ByteBuffer(mutable=False)
+    assert not immut_buf.pack(FRAME_FOOTER, 0)
@@ -0,0 +1,76 @@
+"""
+vtelem - Test the event queue's correctness.
+"""
+
+# built-in
+import threading
+
+# module under test
+from vtelem.classes.event_queue import EventQueue
+from vtelem.enums.primitive import Primitive
+from vtelem.telemetry.environment import TelemetryEnvironment
+
+
+def test_event_queue_capacity():
+    """Test that events beyond the queue's capacity are counted as drops."""
+
+    queue = EventQueue(4)
+    for idx in range(6):
+        queue.enqueue(idx, (idx, 0.0), (idx + 1, 0.0))
+    assert queue.dropped == 2
+
+    events = queue.consume()
+    assert [event[0] for event in events] == [0, 1, 2, 3]
+    assert not queue.consume()
+    assert queue.enqueue(0, (0, 0.0), (1, 0.0))
+
+
+def test_event_queue_threads():
+    """Test that no events are lost while producing from many threads."""
+
+    queue = EventQueue()
+    count = 1000
+    consumed = []
+
+    def produce() -> None:
+        """Enqueue some events."""
+
+        for idx in range(count):
+            assert queue.enqueue(idx, (idx, 0.0), (idx + 1, 0.0))
+
+    threads = [threading.Thread(target=produce) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    while any(thread.is_alive() for thread in threads):
+        consumed.extend(queue.consume())
+    for thread in threads:
+        thread.join()
+    consumed.extend(queue.consume())
+
+    assert len(consumed) == len(threads) * count
+
+
+def test_event_queue_environment():
+    """Test that dropped events are published as a metric."""
+
+    env = TelemetryEnvironment(2**8, metrics_rate=1.0, event_capacity=8)
+    chan_id = env.add_channel("a", Primitive.UINT32, 1.0, True)
+    for idx in range(16):
+        env.set_now(chan_id, idx + 1)
+
+    assert env.dispatch_now() > 0
+    assert env.get_metric("events_dropped") >= 8
+
+
+def test_event_queue_unregistered():
+    """Test that events of unregistered channels are skipped."""
+
+    env = TelemetryEnvironment(2**8)
+    chan_id = env.add_channel("a", Primitive.UINT32, 1.0, True)
+    assert env.event_queue.enqueue(None, (1, 0.0), (2, 0.0))
+    assert env.event_queue.enqueue(chan_id + 100, (1, 0.0), (2, 0.0))
+    assert env.set_now(chan_id, 1)
+
+    frames, events = env.dispatch_events(env.get_time())
+    assert frames == 1
+    assert events == 1
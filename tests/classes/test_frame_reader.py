@@ -3,9 +3,11 @@ vtelem - Test the frame-reader class's correctness.
 """
 
 # built-in
+from struct import Struct
 import time
 
 # module under test
+from vtelem.classes.layout_cache import FrameLayout, LayoutCache
 from vtelem.enums.frame import FrameType
 from vtelem.enums.primitive import Primitive
 from vtelem.telemetry.environment import TelemetryEnvironment
@@ -45,3 +47,55 @@ def test_read_frame_basic():
     assert result is not None
     assert result.header.type == FrameType.DATA
     assert result.header.size == len(chan_ids)
+
+    # frames with the same channels share a (cached) layout
+    layouts = env.channel_registry.layouts
+    assert layouts.hits > 0
+    for frame in frames:
+        if frame is None or frame.header.type != FrameType.DATA:
+            continue
+        for chan in frame.body["channels"]:
+            assert chan["channel"] is env.channel_registry.get_item(chan["id"])
+
+
+def test_read_event_frame():
+    """Test that event frames can be correctly read."""
+
+    env = TelemetryEnvironment(2**8, time.time())
+    chan_ids = [
+        env.add_channel(f"chan{i}", Primitive.FLOAT, 1.0, True)
+        for i in range(5)
+    ]
+    for i in range(3):
+        for chan in chan_ids:
+            env.set_now(chan, float(i + 1))
+        env.advance_time(0.1)
+        env.dispatch_now()
+
+    events = []
+    while not env.frame_queue.empty():
+        frame = env.get_next_frame()
+        parsed = env.decode_frame(*frame.raw)
+        assert parsed is not None
+        if parsed.header.type == FrameType.EVENT:
+            events.extend(parsed.body["events"])
+
+    assert len(events) == 3 * len(chan_ids)
+    for event in events:
+        assert event["current"]["value"] == event["previous"]["value"] + 1.0
+
+
+def test_layout_cache_eviction():
+    """Test that the least recently used layouts are evicted."""
+
+    cache = LayoutCache(2)
+    layout = FrameLayout([], [], Struct(""))
+    cache.put("a", layout)
+    cache.put("b", layout)
+    assert cache.get("a") is layout
+    cache.put("c", layout)
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") is layout
+    cache.clear()
+    assert not cache
@@ -0,0 +1,90 @@
+"""
+vtelem - Test the metered (and policy) queue modules' correctness.
+"""
+
+# internal
+from tests import writer_environment
+
+# module under test
+from vtelem.classes.metered_queue import PolicyQueue, create
+from vtelem.enums.primitive import Primitive
+from vtelem.enums.queue import OverflowPolicy
+from vtelem.frame.channel import conflation_key
+from vtelem.frame.framer import build_dummy_frame
+from vtelem.mtu import DEFAULT_MTU
+
+
+def drain(queue: PolicyQueue) -> list:
+    """Get all of the elements currently in a queue."""
+
+    result = []
+    while not queue.empty():
+        result.append(queue.get_nowait())
+        queue.task_done()
+    return result
+
+
+def test_policy_queue_drops():
+    """Test the dropping overflow policies."""
+
+    queue = PolicyQueue(3, OverflowPolicy.DROP_NEWEST)
+    for idx in range(5):
+        queue.put(idx)
+    assert queue.dropped == 2
+    assert drain(queue) == [0, 1, 2]
+
+    queue = PolicyQueue(3, OverflowPolicy.DROP_OLDEST)
+    for idx in range(5):
+        queue.put(idx)
+    assert queue.dropped == 2
+    assert queue.unfinished_tasks == 3
+    assert drain(queue) == [2, 3, 4]
+
+    # the stop signal always makes it into the queue, and isn't dropped
+    for idx in range(3):
+        queue.put(idx)
+    queue.put(None)
+    queue.put(5)
+    assert drain(queue) == [1, 2, None]
+
+
+def test_policy_queue_conflate():
+    """Test that data frames for the same channels are conflated."""
+
+    def frame_builder(values: list):
+        """Create a function that adds channel values to a frame."""
+
+        def builder(frame) -> None:
+            """Add channel values to a frame."""
+
+            for idx, value in enumerate(values):
+                assert frame.add(idx, Primitive.UINT32, value)
+
+        return builder
+
+    frames = [
+        build_dummy_frame(DEFAULT_MTU, "data", frame_builder(values)).payload
+        for values in [[1, 2], [3], [4, 5], [6]]
+    ]
+    message = build_dummy_frame(DEFAULT_MTU).payload
+    assert conflation_key(message) is None
+    assert conflation_key(frames[0]) == conflation_key(frames[2])
+
+    queue = create(policy=OverflowPolicy.CONFLATE, key=conflation_key)
+    assert isinstance(queue, PolicyQueue)
+    for frame in frames + [message, message]:
+        queue.put(frame)
+    assert queue.conflated == 2
+    assert drain(queue) == [frames[2], frames[3], message, message]
+
+
+def test_metered_queue_policy():
+    """Test that a metered queue reports drops as metrics."""
+
+    writer, env = writer_environment()
+    queue = writer.get_queue("test", 2, OverflowPolicy.DROP_OLDEST)
+    for idx in range(5):
+        queue.put(idx)
+    assert queue.dropped == 3
+    assert env.get_metric("test_queue.dropped") == 3
+    assert env.get_metric("test_queue.elements") == 2
@@ -0,0 +1,37 @@
+"""
+vtelem - Test the stream-buffer class's correctness.
+"""
+
+# module under test
+from vtelem.classes.codec import FRAME_SIZE
+from vtelem.classes.stream_buffer import StreamBuffer
+
+
+def test_stream_buffer_basic():
+    """Test that bytes can be appended and consumed from a stream buffer."""
+
+    buf = StreamBuffer(compact_threshold=8)
+    assert buf.append(FRAME_SIZE.pack(4) + b"abcd")
+    assert buf.unpack(FRAME_SIZE) == (4,)
+
+    # consumed data remains valid even after the storage is compacted
+    view = buf.read(4)
+    assert not buf.remaining
+    for _ in range(4):
+        buf.append(b"efgh")
+        assert bytes(buf.read(4)) == b"efgh"
+    assert bytes(view) == b"abcd"
+
+    # storage is only compacted once enough has been consumed
+    buf.append(bytes(16))
+    assert buf.unpack(FRAME_SIZE) == (0,)
+    buf.append(b"ab")
+    assert buf.pos == 4
+    for _ in range(3):
+        assert buf.unpack(FRAME_SIZE) == (0,)
+    buf.append(b"cd")
+    assert buf.pos == 0
+    assert bytes(buf.read(buf.remaining)) == b"abcd"
+
+    buf.reset()
+    assert not buf.remaining
@@ -3,14 +3,24 @@ vtelem - Test the telemetry environment's correctness.
 """
 
 # built-in
+from array import array
+from queue import Queue
 import time
 
 # module under test
 from vtelem.channel import Channel
+from vtelem.channel.aggregate import AggregateChannels
 from vtelem.channel.framer import Framer
+from vtelem.channel.stream import StreamChannels
+from vtelem.channel.subscription import (
+    parse_subscription_query,
+    subscription,
+    subscription_query,
+)
 from vtelem.classes.user_enum import user_enum
 from vtelem.enums.frame import FrameType
 from vtelem.enums.primitive import Primitive
+from vtelem.frame import FRAME_SIZE
 from vtelem.telemetry.environment import TelemetryEnvironment
 
 # internal
@@ -108,6 +118,197 @@ def test_create_many_channels():
         env.dispatch_now()
 
 
+def test_environment_emit_schedule():
+    """Test that only channels that are due emit, in registration order."""
+
+    env = TelemetryEnvironment(2**8)
+    fast = env.add_channel("fast", Primitive.UINT32, 1.0)
+    slow = env.add_channel("slow", Primitive.UINT32, 5.0)
+    assert env.channel_registry.get_item(fast).id == fast
+
+    time_val = 0.0
+    emits = []
+    for _ in range(10):
+        time_val += 1.0
+        emits.append(env.framer.build_data_frames(time_val, env.frame_queue))
+    assert sum(emit[1] for emit in emits) == 10 + 2
+
+    # changing a rate takes effect on the next dispatch
+    env.set_channel_rate(slow, 1.0)
+    time_val += 1.0
+    assert env.framer.build_data_frames(time_val, env.frame_queue)[1] == 2
+    assert len(env.framer.due_channels(time_val + 0.5)) == 0
+    assert [chan.id for chan in env.framer.due_channels(time_val + 1.0)] == [
+        fast,
+        slow,
+    ]
+
+
+def test_environment_set_many():
+    """Test that many channels can be set at once."""
+
+    env = TelemetryEnvironment(2**8)
+    env.add_enum(user_enum("a", {0: "a", 1: "b", 2: "c"}))
+    ids = [
+        env.add_channel("a", Primitive.UINT8, 1.0, True),
+        env.add_channel("b", Primitive.FLOAT, 1.0),
+        env.add_channel("c", Primitive.INT8, 1.0, True),
+        env.add_enum_channel("d", "a", 1.0, True),
+    ]
+
+    # out-of-bounds and mistyped values are skipped
+    assert env.set_many(ids, [1, 2.0, 3, "c"], 1.0) == 4
+    assert env.set_many(ids, [256, 3, -1, "b"], 2.0) == 2
+    assert [env.get_value(chan_id) for chan_id in ids] == [1, 2.0, -1, 1]
+    assert env.get_enum_value(ids[3]) == "b"
+
+    # only changes produce events, in the order the channels were given
+    events = env.event_queue.consume()
+    expected = [ids[0], ids[2], ids[3], ids[2], ids[3]]
+    assert [event[0] for event in events] == expected
+    assert env.set_group_values({ids[0]: 1, ids[1]: 5.0}) == 2
+    assert not env.event_queue.consume()
+    assert env.get_value(ids[1]) == 5.0
+
+
+def test_environment_aggregate():
+    """Test that samples are aggregated between a channel's emissions."""
+
+    env = TelemetryEnvironment(2**8)
+    aggs = AggregateChannels(env)
+    agg = aggs.add_channel("agg", Primitive.INT16, 1.0)
+    names = [f"agg.{field}" for field in ["min", "max", "sum", "sum_sq"]]
+    ids = [agg] + [env.channel_registry.get_id(name) for name in names]
+
+    assert aggs.add(agg, -3)
+    assert not aggs.add(agg, 2**15)
+    assert not aggs.add(agg, 1.0)
+    assert aggs.add_many(agg, [4, 2**16, 1]) == 2
+    assert env.framer.build_data_frames(1.0, env.frame_queue) == (1, 5)
+    assert [env.get_value(chan_id) for chan_id in ids] == [
+        3,
+        -3,
+        4,
+        2.0,
+        26.0,
+    ]
+
+    # the aggregates are reset once they're emitted
+    assert env.framer.build_data_frames(1.5, env.frame_queue)[1] == 0
+    assert env.framer.build_data_frames(2.0, env.frame_queue)[1] == 5
+    assert [env.get_value(chan_id) for chan_id in ids] == [0, 0, 0, 0.0, 0.0]
+
+    # the group's channels always share a rate
+    env.set_channel_rate(agg, 0.5)
+    assert all(env.channel_registry.get_item(i).rate == 0.5 for i in ids)
+    assert aggs.add(agg, 7)
+    assert env.framer.build_data_frames(2.5, env.frame_queue)[1] == 5
+
+    # aggregates of the same type share a table
+    other = aggs.add_channel("other", Primitive.INT16, 1.0)
+    assert aggs.add_many(other, [5, 6]) == 2
+    assert len(aggs.tables[Primitive.INT16]) == 2
+    assert aggs.add_channel("float", Primitive.FLOAT, 1.0)
+
+
+def test_environment_subscriptions():
+    """Test that subscribers only receive the channels they subscribed to."""
+
+    env = TelemetryEnvironment(2**8)
+    ids = {
+        name: env.add_channel(name, Primitive.UINT32, 1.0, True)
+        for name in ["a", "b", "grp.a", "grp.b", "pre_a", "pre_b"]
+    }
+    sub = subscription(["a"], ["pre_"], ["grp"], {"b": 2.0})
+    queues = [Queue(), Queue()]
+    sub_ids = [env.subscriptions.subscribe(sub, queue) for queue in queues]
+    other: Queue = Queue()
+    other_id = env.subscriptions.subscribe(subscription(["b"]), other)
+    assert len(env.subscriptions) == 2
+
+    # subscriptions can be declared in a URL query string
+    assert parse_subscription_query(subscription_query(sub)) == sub
+    assert parse_subscription_query("") is None
+
+    def channels(queue: Queue) -> list:
+        """Get the channels from each frame in a subscriber's queue."""
+
+        result = []
+        while not queue.empty():
+            payload = queue.get()
+            frame = env.decode_frame(
+                payload[FRAME_SIZE.size :], len(payload) - FRAME_SIZE.size
+            )
+            assert frame is not None
+            body = frame.body.get("channels", frame.body.get("events"))
+            result.append(sorted(item["id"] for item in body))
+        return result
+
+    # 'b' is only sent to the first subscription every other emission
+    names = ["a", "b", "grp.a", "grp.b", "pre_a", "pre_b"]
+    assert env.dispatch(1.0) == 1
+    expected = [sorted(ids[name] for name in names)]
+    assert channels(queues[0]) == expected
+    assert channels(queues[1]) == expected
+    assert channels(other) == [[ids["b"]]]
+    env.dispatch(2.0)
+    expected = [sorted(ids[name] for name in names if name != "b")]
+    assert channels(queues[0]) == expected
+    assert channels(queues[1]) == expected
+    assert channels(other) == [[ids["b"]]]
+
+    # payloads are shared between subscribers with the same subscription
+    env.dispatch(3.0)
+    assert queues[0].get() is queues[1].get()
+    other.get()
+
+    # events are filtered too, new channels are resolved when dispatching
+    assert env.set_many([ids["a"], ids["grp.b"]], [1, 2], 3.5) == 2
+    new_id = env.add_channel("grp.c", Primitive.UINT32, 10.0, True)
+    assert env.set_now(new_id, 1)
+    env.dispatch(3.5)
+    assert not channels(other)
+    assert channels(queues[1]) == [[ids["a"], ids["grp.b"], new_id]]
+
+    assert env.subscriptions.unsubscribe(other_id)
+    assert not env.subscriptions.unsubscribe(other_id)
+    assert other.get() is None and len(env.subscriptions) == 1
+    for sub_id in sub_ids:
+        assert env.subscriptions.unsubscribe(sub_id, False)
+    assert not env.subscriptions
+
+
+def test_environment_subscribed_streams():
+    """Test that subscribers receive stream frames of subscribed channels."""
+
+    env = TelemetryEnvironment(2**6, use_crc=False)
+    streams = StreamChannels(env)
+    wave = streams.add_channel("wave", Primitive.UINT16)
+    other = streams.add_channel("other", Primitive.UINT16)
+
+    sub = subscription(["wave"])
+    queue: Queue = Queue()
+    full: Queue = Queue(1)
+    env.subscriptions.subscribe(sub, queue)
+    env.subscriptions.subscribe(sub, full)
+
+    frames = streams.write(wave, array("H", range(100)))[0]
+    assert frames > 1
+    assert streams.write(other, array("H", range(10)))[0] > 0
+    assert env.frame_queue.qsize() > frames
+    assert queue.qsize() == frames
+
+    # a full queue never blocks, its frames are dropped instead
+    assert full.qsize() == 1
+    assert env.subscriptions.sets[sub].dropped == frames - 1
+
+    # unsubscribing a full queue doesn't block either
+    full_id = env.subscriptions.subscribe(sub, full)
+    assert env.subscriptions.unsubscribe(full_id)
+    assert full.qsize() == 1
+    assert full.get_nowait() is None
+
+
 def test_telemetry_environment_basic():
     """Exercise some basic telemetry-environment operations."""
 
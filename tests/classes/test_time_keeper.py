@@ -9,7 +9,7 @@ import signal
 import time
 
 # module under test
-from vtelem.classes.time_entity import TimeEntity
+from vtelem.classes.time_entity import SharedClock, TimeEntity
 from vtelem.classes.time_keeper import TimeKeeper
 from vtelem.daemon import DaemonState
 
@@ -36,16 +36,62 @@ def test_time_keeper_basic():
     keeper.add_slave(slave_a)
     keeper.add_slave(slave_b)
     keeper.add_slave(slave_c)
-    assert slave_a.get_time() == slave_b.get_time()
-    assert slave_b.get_time() == slave_c.get_time()
-    assert slave_c.get_time() == slave_c.get_time()
-    assert keeper.get_time() >= slave_a.get_time()
-    assert keeper.get_time() >= slave_b.get_time()
-    assert keeper.get_time() >= slave_c.get_time()
+
+    # slaves read the keeper's clock, time advances without pushing it
+    assert slave_a.get_time() <= slave_b.get_time() <= slave_c.get_time()
+    assert slave_c.get_time() <= keeper.get_time()
+    assert slave_a.clock is keeper.shared_clock
     assert keeper.start()
+    start = slave_a.get_time()
     keeper.sleep(0.1)
+    assert slave_b.get_time() - start >= 0.1
     keeper.scale(2.0)
     keeper.sleep(0.1)
     keeper.scale(0.5)
     keeper.sleep(0.1)
     assert keeper.stop()
+
+
+def test_shared_clock_basic():
+    """Test that a shared clock scales time from a monotonic source."""
+
+    now = [0]
+    clock = SharedClock(10.0, time_ns_fn=lambda: now[0])
+    entity = TimeEntity()
+    entity.attach_clock(clock)
+
+    now[0] = 10**9
+    assert entity.get_time() == 11.0
+    clock.scale(2.0)
+    now[0] += 10**9
+    assert entity.get_time() == 13.0
+    clock.advance_time(1.0)
+    assert clock.get_time() == 14.0
+    clock.set_time(1.0)
+    now[0] += 5 * 10**8
+    assert entity.get_time() == 2.0
+
+    # detaching keeps the last time read from the clock
+    entity.attach_clock(None)
+    now[0] += 10**9
+    assert entity.get_time() == 2.0
+
+
+def test_time_keeper_time_fn():
+    """Test that a time keeper's clock advances with its time source."""
+
+    now = [100.0]
+    keeper = TimeKeeper("time", 0.05, 2.0, time_fn=lambda: now[0])
+    slave = TimeEntity()
+    keeper.add_slave(slave)
+    assert slave.get_time() == 100.0
+
+    now[0] += 1.0
+    assert slave.get_time() == 102.0
+
+    # setting a slave's time sets the shared clock
+    slave.set_time(50.0)
+    assert keeper.get_time() == 50.0
+    slave.advance_time(5.0)
+    now[0] += 0.5
+    assert keeper.get_time() == 56.0
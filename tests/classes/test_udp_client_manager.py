@@ -38,6 +38,8 @@ def test_udp_client_manager_basic():
     # remove clients
     for client in clients:
         manager.remove_client(client)
+    manager.close()
+    assert manager.sender.thread is None
 
     assert frame_queue.empty()
     frame_queue.join()
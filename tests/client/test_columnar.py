@@ -0,0 +1,58 @@
+"""
+vtelem - Test the columnar decoding mode's correctness.
+"""
+
+# built-in
+from queue import Queue
+
+# third-party
+import pytest
+
+# module under test
+from vtelem.client import TelemetryClient
+from vtelem.enums.primitive import Primitive
+from vtelem.telemetry.environment import TelemetryEnvironment
+
+np = pytest.importorskip("numpy")
+
+
+def test_columnar_decode():
+    """Test that data and event frames can be decoded into columns."""
+
+    env = TelemetryEnvironment(2**8, 0.0)
+    data_chan = env.add_channel("data", Primitive.INT32, 1.0)
+    event_chan = env.add_channel("event", Primitive.DOUBLE, 1000.0, True)
+
+    queue: Queue = Queue()
+    client = TelemetryClient("test", queue, env.channel_registry, env.app_id)
+    columns = client.enable_columns(capacity=2)
+    assert client.enable_columns() is columns
+
+    samples = 10
+    for i in range(samples):
+        env.set_now(data_chan, i)
+        env.set_now(event_chan, i / 2)
+        env.advance_time(1.0)
+        env.dispatch_now()
+
+    frames = []
+    while not env.frame_queue.empty():
+        frames.append(memoryview(env.get_next_frame().raw[0]))
+    assert client.handle_frames(frames) == len(frames)
+
+    # only frames that can't be stored as columns are published
+    assert queue.empty()
+
+    times, values = columns.get("data")
+    assert len(times) == len(values) >= samples
+    assert values.dtype == np.int32
+    assert list(values[-samples:]) == list(range(samples))
+    assert np.all(np.diff(times.astype(np.int64)) > 0)
+
+    times, values = columns.get(event_chan)
+    assert list(values) == [i / 2 for i in range(1, samples)]
+    assert "event" in columns.channels()
+    assert columns.get("not_a_channel") is None
+
+    columns.clear()
+    assert not columns.channels()
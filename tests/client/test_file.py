@@ -6,8 +6,9 @@ vtelem - Test the file client's correctness.
 from tests import writer_environment
 
 # module under test
-from vtelem.client.file import create
+from vtelem.client.file import FileDecodeTask, create
 from vtelem.stream import queue_get, queue_get_none
+from vtelem.stream.index import FrameIndex
 
 
 def test_file_client_frame_restrict():
@@ -53,3 +54,85 @@ def test_file_client_basic():
                     for _ in range(frame_count):
                         assert queue_get(queue) is not None
                 queue_get_none(queue)
+
+
+def test_file_client_index():
+    """Test that a file client can seek with a recording's index."""
+
+    mtu = 64
+    writer, env = writer_environment(mtu)
+    with create(writer, env, mtu, index=True) as (client, queue):
+        with writer.booted():
+            frame_count = 0
+            for _ in range(20):
+                env.advance_time(10)
+                frame_count += env.dispatch_now()
+            writer.await_empty()
+
+        # The index written alongside the recording matches one built by
+        # scanning it.
+        path = client.task.path
+        index = FrameIndex.get(path)
+        assert index is not None
+        assert len(index) == frame_count
+        scanned = FrameIndex.scan(path)
+        assert scanned.offsets == index.offsets
+        assert scanned.timestamps == index.timestamps
+        assert index.entry(0).offset == 0
+
+        # Skip to a specific frame.
+        client.task = FileDecodeTask(path, start_frame=frame_count - 2)
+        with client.booted(require_stop=False):
+            for _ in range(2):
+                assert queue_get(queue) is not None
+        assert queue.empty()
+
+        # Decode frames in a time range.
+        start, end = index.timestamps[1] / 1000, index.timestamps[-3] / 1000
+        first, last = index.frame_range(start, end)
+        assert first <= 1 and last >= frame_count - 2
+        client.task = FileDecodeTask(path, time_range=(start, end))
+        with client.booted(require_stop=False):
+            for _ in range(last - first):
+                frame = queue_get(queue)
+                assert frame is not None
+                assert start <= frame.header.timestamp / 1000 <= end
+        assert queue.empty()
+
+
+def test_file_client_mapped():
+    """Test that a file client can decode frames from a mapped file."""
+
+    mtu = 64
+    writer, env = writer_environment(mtu)
+    with create(writer, env, mtu) as (client, queue):
+        path = client.task.path
+        with writer.booted():
+            frame_count = 0
+            for _ in range(10):
+                env.advance_time(10)
+                frame_count += env.dispatch_now()
+            writer.await_empty()
+
+            # Decode all of the frames at once.
+            client.task = FileDecodeTask(path, mapped=True)
+            with client.booted(require_stop=False):
+                for _ in range(frame_count):
+                    assert queue_get(queue) is not None
+                queue_get_none(queue)
+            assert client.task.byte_index == path.stat().st_size
+
+            # Follow the file as more frames are written.
+            client.task = client.task._replace(
+                mapped=False, follow=True, poll_interval=0.01
+            )
+            with client.booted():
+                for _ in range(5):
+                    frame_count = 0
+                    for _ in range(10):
+                        env.advance_time(10)
+                        frame_count += env.dispatch_now()
+                    for _ in range(frame_count):
+                        assert queue_get(queue) is not None
+            queue_get_none(queue)
+            assert queue.empty()
@@ -147,3 +147,62 @@ def test_telemetry_proxy_basic():
         assert frame is not None
 
     assert testenv["proxy"].stop()
+
+
+def test_telemetry_proxy_batch():
+    """Test that datagrams already pending are all decoded, in batches."""
+
+    testenv = setup_environment()
+    proxy = testenv["proxy"]
+    proxy.batch = 2
+
+    # frames sent before the proxy starts are pending when it first reads
+    # (they're small, so that they all fit in the socket's receive buffer)
+    frame_count = 7
+    with testenv["writer"].booted():
+        for _ in range(frame_count):
+            testenv["frame_queue"].put(
+                build_dummy_frame(128, testenv["app_basis"])
+            )
+    testenv["manager"].remove_client(testenv["client"][0])
+
+    assert proxy.start()
+    for _ in range(frame_count):
+        assert queue_get(proxy.frames) is not None
+    assert proxy.stop()
+    assert len(proxy.buffer) == 2 * (proxy.mtu + 4)
+
+
+def test_udp_client_multicast():
+    """Test that every client joined to a multicast group gets each frame."""
+
+    manager, env = udp_client_environment()
+    client_id, mtu = manager.add_multicast(Host("239.255.0.1", 0))
+    group = Host("239.255.0.1", manager.clients[client_id].getpeername()[1])
+
+    clients = []
+    for _ in range(2):
+        client = UdpClient(
+            group,
+            manager.writer.get_queue(),
+            env.channel_registry,
+            env.app_id,
+            env,
+            mtu,
+            multicast=True,
+        )
+        assert client.start()
+        clients.append(client)
+
+    with manager.writer.booted():
+        time.sleep(0.2)
+        for _ in range(5):
+            env.advance_time(10)
+            frame_count = env.dispatch_now()
+            for client in clients:
+                for _ in range(frame_count):
+                    assert queue_get(client.frames) is not None
+
+    manager.close()
+    for client in clients:
+        assert client.stop()
@@ -3,6 +3,7 @@ vtelem - Test the correctness of the command-queue daemon.
 """
 
 # built-in
+from threading import Event
 from typing import Tuple
 
 # module under test
@@ -47,3 +48,30 @@ def test_command_queue_daemon_basic():
             daemon.enqueue({"command": "test"}, cmd_cb)
             daemon.enqueue({"command": "test_bad"}, cmd_cb)
             daemon.enqueue({"command": "test", "data": {}}, cmd_cb)
+
+
+def test_command_queue_daemon_async():
+    """Test that commands can be executed without blocking the caller."""
+
+    daemon = CommandQueueDaemon("test")
+    signal = Event()
+
+    def blocking_handler(_: dict) -> Tuple[bool, str]:
+        """A command handler that waits to be signaled."""
+        signal.wait()
+        return True, "done"
+
+    daemon.register_consumer("block", blocking_handler)
+
+    with daemon.booted():
+        futures = [daemon.execute_async({"command": "block"})]
+        futures.append(daemon.execute_async({"command": "unknown"}))
+        assert not any(future.done() for future in futures)
+
+        # a future can't be cancelled once its command is enqueued
+        assert not futures[0].cancel()
+
+        signal.set()
+        assert futures[0].result(1) == (True, "done")
+        assert not futures[1].result(1)[0]
+        assert daemon.execute({"command": "block"}) == (True, "done")
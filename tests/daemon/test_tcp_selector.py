@@ -0,0 +1,157 @@
+"""
+vtelem - Test the selector-based tcp telemetry daemon's correctness.
+"""
+
+# built-in
+import os
+import socket
+import time
+
+# internal
+from tests import writer_environment
+
+# module under test
+from vtelem.channel.framer import build_dummy_frame
+from vtelem.daemon.tcp_selector import SelectorTcpTelemetryDaemon
+from vtelem.stream import queue_get, queue_get_none
+from vtelem.stream.writer import default_writer
+from vtelem.telemetry.environment import TelemetryEnvironment
+
+
+def clients(daemon: SelectorTcpTelemetryDaemon) -> int:
+    """Get the number of clients connected to a daemon."""
+
+    return daemon.function["metrics_data"]["clients"]
+
+
+def recv_exactly(sock: socket.socket, size: int) -> bytes:
+    """Receive a specific number of bytes from a socket."""
+
+    data = b""
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        assert chunk
+        data += chunk
+    return data
+
+
+def test_tcp_selector_many_clients():
+    """Test that many clients are each sent every frame."""
+
+    writer, frame_queue = default_writer("frames")
+    env = TelemetryEnvironment(64, metrics_rate=1.0)
+    daemon = SelectorTcpTelemetryDaemon("test", writer, env)
+    frame_size = 1024
+    size = frame_size + writer.overhead
+
+    with writer.booted():
+        for _ in range(3):
+            with daemon.booted():
+                sockets = [
+                    socket.create_connection(daemon.address)
+                    for _ in range(100)
+                ]
+                while clients(daemon) != len(sockets):
+                    time.sleep(0.01)
+
+                frames = [build_dummy_frame(frame_size) for _ in range(5)]
+                for frame in frames:
+                    frame_queue.put(frame)
+                expected = b"".join(frame.payload for frame in frames)
+
+                for sock in sockets:
+                    sock.settimeout(2.0)
+                    assert recv_exactly(sock, 5 * size) == expected
+
+                # closed connections are removed
+                for sock in sockets[:50]:
+                    sock.close()
+                while clients(daemon) != 50:
+                    time.sleep(0.01)
+
+                assert daemon.close_clients() == 50
+                for sock in sockets[50:]:
+                    assert not sock.recv(1)
+                    sock.close()
+
+
+def test_tcp_selector_closes():
+    """Test that stopping the daemon closes everything it opened."""
+
+    writer, _ = default_writer("frames")
+    env = TelemetryEnvironment(64, metrics_rate=1.0)
+    daemon = SelectorTcpTelemetryDaemon("test", writer, env)
+    address = daemon.address
+
+    def serve_client() -> None:
+        """Serve a single client, until the daemon stops."""
+
+        with daemon.booted():
+            sock = socket.create_connection(address)
+            while clients(daemon) != 1:
+                time.sleep(0.01)
+        sock.close()
+
+    with writer.booted():
+        serve_client()
+        open_fds = len(os.listdir("/proc/self/fd"))
+
+        # restarting re-binds the same address without leaking descriptors
+        for _ in range(3):
+            serve_client()
+            assert daemon.address == address
+        assert len(os.listdir("/proc/self/fd")) == open_fds
+
+    assert daemon.listener.fileno() == -1
+    assert daemon.selector is None
+    assert daemon.inbox.sockets is None
+    assert clients(daemon) == 0
+
+
+def test_tcp_selector_high_water():
+    """Test that frames are dropped for a client that isn't reading."""
+
+    writer, frame_queue = default_writer("frames")
+    env = TelemetryEnvironment(64, metrics_rate=1.0)
+    daemon = SelectorTcpTelemetryDaemon(
+        "test", writer, env, high_water=256 * 1024
+    )
+
+    with writer.booted(), daemon.booted():
+        slow = socket.create_connection(daemon.address)
+        slow.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4096)
+        fast = socket.create_connection(daemon.address)
+        fast.settimeout(2.0)
+        while clients(daemon) != 2:
+            time.sleep(0.01)
+
+        # send enough data to fill the slow connection's socket buffers
+        frame_size = 64 * 1024
+        size = frame_size + writer.overhead
+        frame = build_dummy_frame(frame_size)
+        for _ in range(400):
+            frame_queue.put(frame)
+            assert len(recv_exactly(fast, size)) == size
+
+        assert daemon.function["metrics_data"]["frame_drops"] > 0
+        slow.close()
+        fast.close()
+
+
+def test_tcp_selector_client_fn():
+    """Test that a client created by the daemon decodes telemetry."""
+
+    writer, env = writer_environment()
+    daemon = SelectorTcpTelemetryDaemon("test", writer, env)
+    with writer.booted(), daemon.booted():
+        client, out_queue = daemon.client()
+        for _ in range(3):
+            with client.booted():
+                time.sleep(0.2)
+                for _ in range(10):
+                    env.advance_time(10)
+                    frame_count = env.dispatch_now()
+                    for _ in range(frame_count):
+                        assert queue_get(out_queue) is not None
+
+            queue_get_none(out_queue)
@@ -14,7 +14,10 @@ from tests import writer_environment
 
 # module under test
 from vtelem.channel.framer import build_dummy_frame
+from vtelem.channel.subscription import subscription, subscription_query
 from vtelem.daemon.websocket_telemetry import WebsocketTelemetryDaemon
+from vtelem.enums.primitive import Primitive
+from vtelem.frame import FRAME_SIZE
 from vtelem.mtu import get_free_tcp_port
 from vtelem.stream import queue_get
 from vtelem.stream.writer import default_writer
@@ -83,3 +86,114 @@ def test_websocket_telemetry_daemon_server_close_first():
                     pass
 
         asyncio.get_event_loop().run_until_complete(read_test())
+
+
+def test_websocket_telemetry_daemon_many_clients():
+    """Test that many connections are served frames concurrently."""
+
+    writer, frames = default_writer("frames")
+    port = get_free_tcp_port()
+    daemon = WebsocketTelemetryDaemon("test", writer, ("0.0.0.0", port))
+
+    num_clients = 20
+    num_frames = 10
+    with writer.booted(), daemon.booted():
+        time.sleep(0.1)
+
+        async def read_frames(websocket) -> int:
+            """Read frames until the server closes the connection."""
+
+            count = 0
+            try:
+                while True:
+                    assert await websocket.recv()
+                    count += 1
+            except websockets.exceptions.ConnectionClosedOK:
+                pass
+            return count
+
+        async def read_test():
+            """Connect many clients and read frames on all of them."""
+
+            uri = f"ws://localhost:{port}"
+            clients = [
+                await websockets.connect(uri, close_timeout=1)
+                for _ in range(num_clients)
+            ]
+            readers = asyncio.gather(*[read_frames(x) for x in clients])
+
+            await asyncio.sleep(0.1)
+            for elem in [build_dummy_frame(64) for _ in range(num_frames)]:
+                frames.put(elem)
+            writer.await_empty()
+            await asyncio.sleep(0.1)
+
+            assert daemon.close_clients() == num_clients
+            assert await readers == [num_frames] * num_clients
+
+        asyncio.get_event_loop().run_until_complete(read_test())
+
+
+def test_websocket_telemetry_daemon_subscription():
+    """
+    Test that a connection that declares a subscription is only served
+    frames of the channels it subscribed to.
+    """
+
+    writer, env = writer_environment(2**8)
+    ids = {
+        name: env.add_channel(name, Primitive.UINT32, 1.0, True)
+        for name in ["a", "b", "grp.a"]
+    }
+    port = get_free_tcp_port()
+    daemon = WebsocketTelemetryDaemon("test", writer, ("0.0.0.0", port), env)
+
+    with writer.booted(), daemon.booted():
+        time.sleep(0.1)
+
+        async def read_test():
+            """Read a subscribed connection's frames."""
+
+            query = subscription_query(subscription(["a"], groups=["grp"]))
+            uri = f"ws://localhost:{port}/?{query}"
+            async with websockets.connect(uri, close_timeout=1) as websocket:
+                await asyncio.sleep(0.1)
+                assert daemon.subscriber_ids
+                env.advance_time(10)
+                assert env.dispatch_now() > 0
+
+                payload = await asyncio.wait_for(websocket.recv(), 5)
+                frame = env.decode_frame(
+                    payload[FRAME_SIZE.size :], len(payload) - FRAME_SIZE.size
+                )
+                assert frame is not None
+                assert sorted(x["id"] for x in frame.body["channels"]) == [
+                    ids["a"],
+                    ids["grp.a"],
+                ]
+
+                # the subscription is removed when the server closes
+                assert daemon.close_clients() == 1
+                try:
+                    await websocket.recv()
+                    assert False
+                except websockets.exceptions.ConnectionClosedOK:
+                    pass
+            await asyncio.sleep(0.1)
+            assert not env.subscriptions
+
+        asyncio.get_event_loop().run_until_complete(read_test())
+
+    # the client helper declares its subscription when connecting
+    daemon = WebsocketTelemetryDaemon("test", writer, env=env)
+    client, queue = daemon.client(sub=subscription(["b"]))
+    with writer.booted(), daemon.booted():
+        time.sleep(0.2)
+        with client.booted():
+            time.sleep(0.5)
+            assert daemon.subscriber_ids
+            env.advance_time(10)
+            assert env.dispatch_now() > 0
+            frame = queue_get(queue)
+            assert frame is not None
+            assert [x["id"] for x in frame.body["channels"]] == [ids["b"]]
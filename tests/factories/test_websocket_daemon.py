@@ -0,0 +1,81 @@
+"""
+vtelem - Test the websocket daemon factories' correctness.
+"""
+
+# built-in
+import asyncio
+import json
+from threading import Event
+import time
+from typing import Tuple
+
+# third-party
+import websockets
+
+# module under test
+from vtelem.daemon.command_queue import CommandQueueDaemon
+from vtelem.factories.websocket_daemon import commandable_websocket_daemon
+from vtelem.mtu import get_free_tcp_port
+
+
+def test_commandable_websocket_daemon():
+    """
+    Test that a command waiting to complete doesn't block commands from other
+    connections.
+    """
+
+    commands = CommandQueueDaemon("commands")
+    signal = Event()
+
+    def blocking_handler(_: dict) -> Tuple[bool, str]:
+        """A command handler that waits to be signaled."""
+        return signal.wait(1), "done"
+
+    commands.register_consumer("block", blocking_handler)
+    commands.register_consumer("ping", lambda _: (True, "pong"))
+
+    port = get_free_tcp_port()
+    daemon = commandable_websocket_daemon("test", commands, ("0.0.0.0", port))
+
+    with commands.booted(), daemon.booted():
+        time.sleep(0.1)
+
+        async def command(websocket, cmd: str) -> dict:
+            """Send a command and get its result."""
+
+            await websocket.send(json.dumps({"command": cmd}))
+            return json.loads(await websocket.recv())
+
+        async def command_test():
+            """Send commands from two connections."""
+
+            uri = f"ws://localhost:{port}"
+            async with websockets.connect(uri, close_timeout=1) as first:
+                async with websockets.connect(uri, close_timeout=1) as second:
+                    blocked = asyncio.ensure_future(command(first, "block"))
+                    await asyncio.sleep(0.1)
+
+                    # the server's event loop can still accept connections
+                    # while the command is executing
+                    third = await asyncio.wait_for(
+                        websockets.connect(uri, close_timeout=1), 0.5
+                    )
+                    await third.close()
+
+                    # the command queue is occupied
+                    ping = asyncio.ensure_future(command(second, "ping"))
+                    await asyncio.sleep(0.1)
+                    assert not blocked.done()
+                    assert not ping.done()
+
+                    signal.set()
+                    assert await blocked == {
+                        "success": True,
+                        "message": "done",
+                    }
+                    assert await ping == {"success": True, "message": "pong"}
+
+                    result = await command(second, "nope")
+                    assert not result["success"]
+
+        asyncio.get_event_loop().run_until_complete(command_test())
@@ -24,3 +24,34 @@ def test_frame_processor_bogus_size():
     temp.set(mtu * 2)
     data = temp.buffer() + build_dummy_frame(mtu).with_size_header()[0]
     assert len(proc.process(data, frame_size, mtu)) == 0
+
+
+def test_frame_processor_many_frames():
+    """Test that many frames arriving in arbitrary chunks are all processed."""
+
+    proc = FrameProcessor()
+    mtu = 64
+    frame_size = new_default("count")
+    frame = build_dummy_frame(mtu).with_size_header()[0]
+    data = frame * 100
+
+    frames = []
+    for idx in range(0, len(data), 100):
+        frames.extend(proc.process(data[idx : idx + 100], frame_size, mtu))
+
+    assert len(frames) == 100
+    assert all(bytes(item) == frame[len(frame) - mtu :] for item in frames)
+
+
+def test_frame_payload():
+    """Test that a frame's size-prefixed payload is built once."""
+
+    mtu = 64
+    frame_size = new_default("count")
+    frame = build_dummy_frame(mtu)
+    payload = frame.payload
+    assert frame.payload is payload
+    assert frame.with_size_header(frame_size) == (payload, len(payload))
+
+    frames = FrameProcessor().process(payload, frame_size, mtu)
+    assert bytes(frames[0]) == payload[frame_size.size() :]
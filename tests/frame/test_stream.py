@@ -0,0 +1,79 @@
+"""
+vtelem - Test stream frames' correctness.
+"""
+
+# built-in
+from array import array
+import struct
+
+# third-party
+import pytest
+
+# module under test
+from vtelem.channel.stream import StreamChannels
+from vtelem.enums.primitive import Primitive
+from vtelem.frame.stream import sample_bytes
+from vtelem.telemetry.environment import TelemetryEnvironment
+from vtelem.types.frame import FrameType
+
+
+def test_sample_bytes():
+    """Test that blocks of samples are converted to network byte order."""
+
+    values = [0.5, -1.25, 3.0]
+    expected = struct.pack("!3f", *values)
+    assert sample_bytes(array("f", values), Primitive.FLOAT) == expected
+    assert sample_bytes(array("d", values), Primitive.FLOAT) == expected
+    assert sample_bytes(bytes([1, 2, 255]), Primitive.UINT8) == bytes(
+        [1, 2, 255]
+    )
+
+    assert sample_bytes(array("h", [1, -2]), Primitive.INT16) == struct.pack(
+        "!2h", 1, -2
+    )
+    assert sample_bytes(array("b", [1, -2]), Primitive.INT32) == struct.pack(
+        "!2i", 1, -2
+    )
+    assert sample_bytes(array("B", [1, 0]), Primitive.BOOLEAN) == b"\x01\x00"
+
+    # samples that can't be converted are rejected up front
+    with pytest.raises(TypeError):
+        sample_bytes(array("f", values), Primitive.UINT8)
+    with pytest.raises(TypeError):
+        sample_bytes(memoryview(b"ab").cast("c"), Primitive.UINT8)
+    with pytest.raises(TypeError):
+        sample_bytes(array("b", [-1]), Primitive.UINT8)
+    with pytest.raises(TypeError):
+        sample_bytes(array("b", [1]), Primitive.BOOLEAN)
+    with pytest.raises(TypeError):
+        sample_bytes(array("B", [1, 5]), Primitive.BOOLEAN)
+    with pytest.raises(TypeError):
+        sample_bytes(array("l", [2**20]), Primitive.INT16)
+
+
+def test_stream_frames():
+    """Test that a block of samples is split into consecutive frames."""
+
+    env = TelemetryEnvironment(2**6, use_crc=False)
+    streams = StreamChannels(env)
+    chan_id = streams.add_channel("wave", Primitive.UINT16)
+    samples = array("H", range(100))
+
+    frames, count = streams.write(chan_id, samples, 1000)
+    assert count == len(samples)
+    assert frames > 1
+
+    index = 1000
+    data = b""
+    while not env.frame_queue.empty():
+        payload = env.frame_queue.get().raw
+        frame = env.decode_frame(payload[0], payload[1], env.app_id)
+        assert frame is not None
+        assert frame.header.type == FrameType.STREAM
+        assert frame.body["id"] == chan_id
+        assert frame.body["index"] == index
+        index += frame.header.size
+        data += frame.body["data"]
+
+    assert index == 1000 + len(samples)
+    assert data == struct.pack(f"!{len(samples)}H", *samples)
@@ -0,0 +1,60 @@
+"""
+vtelem - Test the parallel recording decoder's correctness.
+"""
+
+# built-in
+from pathlib import Path
+import tempfile
+
+# internal
+from tests import writer_environment
+
+# module under test
+from vtelem.channel.registry import ChannelRegistry
+from vtelem.client.file import TELEM_SUFFIX
+from vtelem.parsing.parallel import decode_parallel, shard_ranges
+
+
+def test_registry_snapshot():
+    """Test that a channel registry can be re-built from a snapshot."""
+
+    _, env = writer_environment()
+    registry = env.channel_registry
+    rebuilt = ChannelRegistry.from_snapshot(registry.snapshot())
+    assert rebuilt.count() == registry.count()
+    assert rebuilt.describe() == registry.describe()
+
+
+def test_decode_parallel():
+    """Test that a recording can be decoded by multiple processes."""
+
+    mtu = 64
+    writer, env = writer_environment(mtu)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir, "test" + TELEM_SUFFIX)
+        path.touch()
+        assert not decode_parallel(path, env.channel_registry)
+
+        frame_count = 0
+        with writer.booted(), writer.add_file(path):
+            for _ in range(20):
+                env.advance_time(10)
+                frame_count += env.dispatch_now()
+            writer.await_empty()
+
+        assert len(shard_ranges(path, 4)) == 4
+        frames = decode_parallel(path, env.channel_registry, 4, mtu)
+        assert len(frames) == frame_count
+        assert frames == sorted(frames, key=lambda x: x.header.timestamp)
+
+        # Channel references are restored from the parent's registry.
+        for frame in frames:
+            for chan in frame.body.get("channels", []):
+                assert chan["channel"] is env.channel_registry.get_item(
+                    chan["id"]
+                )
+
+        # The same frames are decoded with any number of workers.
+        assert [x.header for x in frames] == [
+            x.header for x in decode_parallel(path, env.channel_registry, 1)
+        ]
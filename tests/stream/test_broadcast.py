@@ -0,0 +1,54 @@
+"""
+vtelem - Test the event-loop broadcaster's correctness.
+"""
+
+# built-in
+import asyncio
+import threading
+
+# module under test
+from vtelem.stream.broadcast import LoopBroadcaster
+
+
+def test_loop_broadcaster_basic():
+    """Test that elements put from another thread reach all subscribers."""
+
+    eloop = asyncio.new_event_loop()
+    drops = []
+    broadcaster = LoopBroadcaster(eloop, 4, lambda: drops.append(1))
+
+    async def subscribe():
+        """Subscribe, then publish elements from another thread."""
+
+        queues = [broadcaster.subscribe() for _ in range(2)]
+
+        def publish() -> None:
+            """Publish some elements."""
+
+            for idx in range(8):
+                broadcaster.put(idx)
+            broadcaster.put(None)
+
+        thread = threading.Thread(target=publish)
+        thread.start()
+        thread.join()
+
+        # allow the published elements to be delivered
+        await asyncio.sleep(0)
+
+        result = []
+        for queue in queues:
+            result.append([queue.get_nowait() for _ in range(queue.qsize())])
+            broadcaster.unsubscribe(queue)
+        return result
+
+    result = eloop.run_until_complete(subscribe())
+    eloop.close()
+
+    # subscribers that fall behind only have the newest elements
+    assert result == [[5, 6, 7, None], [5, 6, 7, None]]
+    assert len(drops) == 10
+    assert not broadcaster.subscribers
+
+    # putting to a closed loop is ignored
+    broadcaster.put(None)
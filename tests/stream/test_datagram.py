@@ -0,0 +1,81 @@
+"""
+vtelem - Test the datagram sender's correctness.
+"""
+
+# built-in
+import socket
+
+# module under test
+from vtelem.channel.framer import build_dummy_frame
+from vtelem.frame import FRAME_SIZE
+from vtelem.mtu import DEFAULT_MTU, create_udp_socket
+from vtelem.stream.datagram import DatagramSender
+from vtelem.stream.writer import default_writer
+
+
+def test_datagram_sender_basic():
+    """Test that each frame is sent as exactly one datagram."""
+
+    writer, frame_queue = default_writer("test_writer")
+    sender = DatagramSender("test_sender", writer)
+
+    receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    receiver.bind(("localhost", 0))
+    receiver.settimeout(2)
+    sock_id = sender.add_socket(create_udp_socket(receiver.getsockname()))
+
+    # a peer that isn't listening only produces send errors
+    unbound = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    unbound.bind(("localhost", 0))
+    closed_addr = unbound.getsockname()
+    unbound.close()
+    closed_id = sender.add_socket(create_udp_socket(closed_addr))
+
+    frames = [build_dummy_frame(DEFAULT_MTU) for _ in range(10)]
+    with writer.booted():
+        for frame in frames:
+            frame_queue.put(frame)
+        frame_queue.join()
+    assert sender.await_empty()
+
+    for frame in frames:
+        data = receiver.recv(DEFAULT_MTU * 2)
+        assert data == frame.payload
+        assert FRAME_SIZE.unpack(data[: FRAME_SIZE.size])[0] == frame.used
+
+    metrics = writer.function["metrics_data"]
+    assert metrics["datagrams_sent"] >= len(frames)
+    assert metrics["datagram_errors"] > 0
+    assert sender.dropped == 0
+
+    sender.remove_socket(closed_id).close()
+    sender.remove_socket(sock_id).close()
+
+    # the thread only runs while there are sockets
+    assert sender.queue_id is None
+    assert sender.thread is None
+    assert sender.remove_socket(sock_id) is None
+    assert sender.close()
+    receiver.close()
+
+
+def test_datagram_sender_drops():
+    """Test that frames are dropped when the sender falls behind."""
+
+    writer, _ = default_writer("test_writer")
+    sender = DatagramSender("test_sender", writer, maxsize=4)
+
+    receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    receiver.bind(("localhost", 0))
+    sock_id = sender.add_socket(create_udp_socket(receiver.getsockname()))
+
+    # hold the lock so that the sender can't make progress
+    with sender.lock:
+        for _ in range(10):
+            sender.queue.put(b"\x00")
+    assert sender.await_empty()
+    assert sender.dropped > 0
+
+    sender.remove_socket(sock_id).close()
+    assert sender.close()
+    receiver.close()
@@ -6,7 +6,13 @@ vtelem - Test the stream-writer class's correctness.
 from os import unlink
 from os.path import getsize
 from pathlib import Path
+from queue import Queue
 import tempfile
+import threading
+import time
+
+# third-party
+import pytest
 
 # internal
 from tests import writer_environment
@@ -14,7 +20,7 @@ from tests import writer_environment
 # module under test
 from vtelem.frame.framer import build_dummy_frame
 from vtelem.mtu import DEFAULT_MTU
-from vtelem.stream.writer import default_writer
+from vtelem.stream.writer import StreamWriter, default_writer
 
 
 def test_stream_writer_file():
@@ -74,3 +80,120 @@ def test_stream_writer_basic():
     stream_c.close()
 
     writer.remove_queue(queue_id)
+
+
+class BlockingStream:
+    """A stream that blocks on write until released."""
+
+    def __init__(self) -> None:
+        """Construct a new blocking stream."""
+
+        self.name = "blocking"
+        self.release = threading.Event()
+        self.writes = 0
+        self.closed = False
+
+    def write(self, data: bytes) -> int:
+        """Wait to be released, then count the write."""
+
+        self.release.wait()
+        if self.closed:
+            raise ValueError("I/O operation on closed file.")
+        self.writes += 1
+        return len(data)
+
+    def close(self) -> None:
+        """Close this stream, releasing any blocked write."""
+
+        self.closed = True
+        self.release.set()
+
+    def flush(self) -> None:
+        """Nothing to flush."""
+
+
+def test_stream_writer_slow_stream():
+    """Test that a blocked stream doesn't stall other streams."""
+
+    frame_queue: Queue = Queue()
+    writer = StreamWriter("test_writer", frame_queue, stream_buffer=10)
+    assert writer.start()
+
+    blocked = BlockingStream()
+    blocked_id = writer.add_stream(blocked)
+    with tempfile.TemporaryFile() as output:
+        output_id = writer.add_stream(output)
+
+        # the healthy stream keeps up with every frame, the blocked stream
+        # only buffers up to its limit
+        for _ in range(50):
+            frame_queue.put(build_dummy_frame(DEFAULT_MTU))
+            frame_queue.join()
+            while writer.stream_lag()[output_id]:
+                time.sleep(0.01)
+        assert writer.function["metrics_data"]["stream_writes"] == 50
+        assert writer.stream_lag()[blocked_id] == 10
+        assert writer.function["metrics_data"]["stream_drops"] == 40
+
+        # frames already buffered are written when the stream is removed
+        blocked.release.set()
+        assert writer.remove_stream(blocked_id)
+        assert blocked.writes == 10
+
+        assert writer.stop()
+        writer.remove_stream(output_id)
+
+
+def test_stream_writer_lag_disconnect():
+    """Test that streams that fall too far behind are removed."""
+
+    frame_queue: Queue = Queue()
+    errors = []
+    writer = StreamWriter("test_writer", frame_queue, errors.append, max_lag=5)
+    assert writer.start()
+
+    blocked = BlockingStream()
+    blocked_id = writer.add_stream(blocked)
+    for _ in range(10):
+        frame_queue.put(build_dummy_frame(DEFAULT_MTU))
+    writer.await_empty()
+    blocked.release.set()
+
+    assert errors == [blocked_id]
+    assert blocked_id not in writer.stream_lag()
+    assert writer.function["metrics_data"]["stream_lag_disconnects"] == 1
+    assert writer.stop()
+
+
+def test_stream_writer_lag_closed(monkeypatch):
+    """
+    Test that a stream that's removed (and closed) for falling behind isn't
+    written to again.
+    """
+
+    uncaught: list = []
+    monkeypatch.setattr(threading, "excepthook", uncaught.append)
+
+    frame_queue: Queue = Queue()
+    writer = StreamWriter("test_writer", frame_queue, max_lag=5)
+    assert writer.start()
+
+    blocked = BlockingStream()
+    writer.add_stream(blocked, blocked.close)
+    sender = writer.get_senders()[0]
+    for _ in range(10):
+        frame_queue.put(build_dummy_frame(DEFAULT_MTU))
+    frame_queue.join()
+
+    sender.thread.join(2)
+    assert writer.stop()
+    assert not sender.thread.is_alive()
+    assert not uncaught
+    assert blocked.closed and blocked.writes == 0
+
+
+def test_stream_writer_limits():
+    """Test that a stream's lag limit must be below its buffer limit."""
+
+    with pytest.raises(AssertionError):
+        StreamWriter("test_writer", Queue(), stream_buffer=5, max_lag=5)
@@ -16,6 +16,7 @@ import netifaces  # type: ignore
 # module under test
 from vtelem import PKG_NAME
 from vtelem.entry import main as vt_main
+from vtelem.mtu import DEFAULT_MULTICAST_PORT
 
 
 def test_entry():
@@ -23,13 +24,17 @@ def test_entry():
 
     assert vt_main([PKG_NAME, "-u", "1"]) == 0
     assert vt_main([PKG_NAME, "-u", "1", "-i", netifaces.interfaces()[0]]) == 0
+    assert (
+        vt_main([PKG_NAME, "-u", "1", "--multicast-group", "239.255.0.1"]) == 0
+    )
     assert vt_main([PKG_NAME, "bad_arg"]) != 0
 
 
 def test_package_entry():
     """Test the command-line entry through the 'python -m' invocation."""
 
-    check_output([executable, "-m", PKG_NAME, "-h"])
+    output = check_output([executable, "-m", PKG_NAME, "-h"]).decode()
+    assert str(DEFAULT_MULTICAST_PORT) in output
 
 
 def test_entry_sigint():
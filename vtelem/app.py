@@ -10,9 +10,10 @@ import socket
 import netifaces  # type: ignore
 
 # internal
-from vtelem.mtu import Host
+from vtelem.mtu import DEFAULT_MULTICAST_PORT, DEFAULT_MULTICAST_TTL, Host
 from vtelem.telemetry.server import TelemetryServer
 from vtelem.types.telemetry_server import (
+    MulticastService,
     Service,
     TelemetryServices,
     default_services,
@@ -28,6 +29,15 @@ def entry(args: argparse.Namespace) -> int:
         iface = netifaces.ifaddresses(args.interface)[socket.AF_INET]
         ip_address = iface[0]["addr"]
 
+    multicast = None
+    if args.multicast_group is not None:
+        multicast = MulticastService(
+            "multicast",
+            Host(args.multicast_group, args.multicast_port),
+            args.multicast_ttl,
+            ip_address if args.interface is not None else None,
+        )
+
     defaults = default_services()
     services = TelemetryServices(
         Service(defaults.http.name, Host(ip_address, args.port)),
@@ -38,6 +48,7 @@ def entry(args: argparse.Namespace) -> int:
             defaults.websocket_tlm.name, Host(ip_address, args.ws_tlm_port)
         ),
         Service(defaults.tcp_tlm.name, Host(ip_address, args.tcp_tlm_port)),
+        multicast=multicast,
     )
 
     # instantiate the server
@@ -93,6 +104,27 @@ def add_app_args(parser: argparse.ArgumentParser) -> None:
         type=int,
         help="tcp telemetry-interface port",
     )
+    parser.add_argument(
+        "--multicast-group",
+        type=str,
+        help="multicast group to publish telemetry to",
+        required=False,
+    )
+    parser.add_argument(
+        "--multicast-port",
+        default=DEFAULT_MULTICAST_PORT,
+        type=int,
+        help="multicast telemetry port (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--multicast-ttl",
+        default=DEFAULT_MULTICAST_TTL,
+        type=int,
+        help=(
+            "number of hops multicast telemetry is forwarded "
+            "(default: %(default)s)"
+        ),
+    )
     parser.add_argument(
         "-t",
         "--tick",
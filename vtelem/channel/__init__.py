@@ -4,7 +4,7 @@ vtelem - A storage class that emits on an interval.
 
 # built-in
 from json import JSONEncoder
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 # internal
 from vtelem.classes import EventType
@@ -42,17 +42,23 @@ class Channel(TypePrimitive):
             def new_changed_cb(prev: EventType, curr: EventType) -> None:
                 """Create a function specific to this channel."""
                 assert event_queue is not None
-                event_queue.enqueue(name, prev, curr)
+                event_queue.enqueue(self.id, prev, curr)
 
             changed_cb = new_changed_cb
 
         super().__init__(instance, changed_cb)
+        self.event_queue = event_queue
         self.name = name
         self.rate = rate
         self.commandable = commandable
         self.is_stream = is_stream
         self.last_emitted: float = float()
 
+        # assigned on registration, and by whatever schedules emissions
+        self.id: Optional[int] = None  # pylint:disable=invalid-name
+        self.generation: int = 0
+        self.rescheduled: Optional[Callable[["Channel"], None]] = None
+
     def command(
         self, value: Any, time: float = None, add: bool = False
     ) -> bool:
@@ -67,6 +73,15 @@ class Channel(TypePrimitive):
         """Set a channel's rate post-initialization."""
 
         self.rate = rate
+        self.generation += 1
+        if self.rescheduled is not None:
+            self.rescheduled(self)
+
+    @property
+    def next_emit(self) -> float:
+        """Get the earliest time that this channel will emit again."""
+
+        return self.last_emitted + self.rate
 
     def emit(self, time: float) -> Optional[Any]:
         """
@@ -75,7 +90,7 @@ class Channel(TypePrimitive):
         """
 
         result = None
-        if time >= (self.last_emitted + self.rate):
+        if time >= self.next_emit:
             result = self.get()
             self.last_emitted = time
         return result
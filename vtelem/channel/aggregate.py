@@ -0,0 +1,273 @@
+"""
+vtelem - A module for channels that aggregate samples between emissions.
+"""
+
+# built-in
+from array import array
+import logging
+from operator import mul
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# internal
+from vtelem.channel import Channel
+from vtelem.channel.environment import ChannelEnvironment
+from vtelem.classes.type_primitive import invalid_values
+from vtelem.enums.primitive import Primitive, default_val
+from vtelem.frame.stream import array_code
+
+LOG = logging.getLogger(__name__)
+
+# the values produced for every aggregate, in channel-registration order
+AGGREGATE_FIELDS = ("count", "min", "max", "sum", "sum_sq")
+AggregateValues = Tuple[int, Any, Any, float, float]
+
+
+def field_type(instance: Primitive, field: str) -> Primitive:
+    """Get the primitive type of an aggregate field's channel."""
+
+    if field == "count":
+        return Primitive.UINT32
+    if field in ("min", "max"):
+        return instance
+    return Primitive.DOUBLE
+
+
+class AggregateTable:
+    """
+    Running aggregates (count, minimum, maximum, sum and sum of squares) of
+    samples for any number of sources of one primitive type, stored in
+    compact arrays with one row per source.
+    """
+
+    def __init__(self, instance: Primitive) -> None:
+        """Construct an empty table for a primitive type."""
+
+        self.type = instance
+        code = array_code(instance)
+        self.counts = array("Q")
+        self.mins = array(code)
+        self.maxs = array(code)
+        self.sums = array("d")
+        self.sum_sqs = array("d")
+
+        # the values a row is reset to, any sample replaces them
+        if instance.value.type is float:
+            self.bounds: Tuple[Any, Any] = (float("inf"), float("-inf"))
+        elif instance.value.type is bool:
+            self.bounds = (True, False)
+        else:
+            self.bounds = (instance.value.max, instance.value.min)
+
+    def __len__(self) -> int:
+        """Get the number of rows in this table."""
+
+        return len(self.counts)
+
+    def add_row(self) -> int:
+        """Add a new (empty) row, returns its index."""
+
+        self.counts.append(0)
+        self.mins.append(self.bounds[0])
+        self.maxs.append(self.bounds[1])
+        self.sums.append(0.0)
+        self.sum_sqs.append(0.0)
+        return len(self.counts) - 1
+
+    def reset(self, row: int) -> None:
+        """Discard a row's samples."""
+
+        self.counts[row] = 0
+        self.mins[row] = self.bounds[0]
+        self.maxs[row] = self.bounds[1]
+        self.sums[row] = 0.0
+        self.sum_sqs[row] = 0.0
+
+    def add(self, row: int, value: Any) -> bool:
+        """Add a sample to a row, returns False if it wasn't valid."""
+
+        prim = self.type.value
+        if not isinstance(value, prim.type) or not prim.validate(prim, value):
+            LOG.warning("value '%s' not valid for type '%s'", value, self.type)
+            return False
+
+        self.counts[row] += 1
+        if value < self.mins[row]:
+            self.mins[row] = value
+        if value > self.maxs[row]:
+            self.maxs[row] = value
+        self.sums[row] += value
+        self.sum_sqs[row] += value * value
+        return True
+
+    def add_many(self, row: int, values: Sequence[Any]) -> int:
+        """
+        Add a block of samples to a row, returns the number of samples added
+        (invalid values are skipped).
+        """
+
+        invalid = invalid_values(self.type, values)
+        if invalid:
+            for bad in invalid:
+                LOG.warning(
+                    "value '%s' not valid for type '%s'",
+                    values[bad],
+                    self.type,
+                )
+            skip = set(invalid)
+            values = [val for idx, val in enumerate(values) if idx not in skip]
+        if not values:
+            return 0
+
+        self.counts[row] += len(values)
+        low = min(values)
+        if low < self.mins[row]:
+            self.mins[row] = low
+        high = max(values)
+        if high > self.maxs[row]:
+            self.maxs[row] = high
+        self.sums[row] += sum(values)
+        self.sum_sqs[row] += sum(map(mul, values, values))
+        return len(values)
+
+    def flush(self, row: int) -> AggregateValues:
+        """
+        Get a row's aggregates and reset it. The minimum and maximum of a row
+        without samples are the type's default value.
+        """
+
+        count = self.counts[row]
+        if count:
+            to_type = self.type.value.type
+            low = to_type(self.mins[row])
+            high = to_type(self.maxs[row])
+        else:
+            low = default_val(self.type)
+            high = low
+
+        result = (count, low, high, self.sums[row], self.sum_sqs[row])
+        self.reset(row)
+        return result
+
+
+class AggregateChannel(Channel):
+    """
+    A channel that counts the samples of a source, and sets it (and channels
+    for the source's other aggregates) from a table row whenever it's due to
+    emit.
+    """
+
+    def __init__(
+        self, name: str, table: AggregateTable, row: int, rate: float
+    ) -> None:
+        """Construct a new aggregate-count channel for a table row."""
+
+        super().__init__(name, Primitive.UINT32, rate, commandable=False)
+        self.table = table
+        self.row = row
+        self.fields: List[Channel] = []
+
+    def add_field(self, channel: Channel) -> None:
+        """
+        Add a channel for one of the source's other aggregates, it must have
+        the same rate as this channel so that it emits at the same time.
+        """
+
+        assert channel.rate == self.rate
+        self.fields.append(channel)
+
+    def set_rate(self, rate: float) -> None:
+        """Set the rate of this channel and the other aggregate channels."""
+
+        super().set_rate(rate)
+        for chan in self.fields:
+            chan.set_rate(rate)
+
+    def emit(self, time: float) -> Optional[Any]:
+        """
+        Set this channel and the other aggregate channels, then emit this
+        channel (if it's due).
+        """
+
+        if time >= self.next_emit:
+            values = self.table.flush(self.row)
+            max_count = self.type.value.max
+            assert self.set(min(values[0], max_count), time)
+            for chan, value in zip(self.fields, values[1:]):
+                assert chan.set(value, time)
+        return super().emit(time)
+
+
+class AggregateChannels:
+    """
+    A class for registering aggregate channels with an environment, and for
+    adding samples to them. Aggregates of the same primitive type share a
+    table.
+    """
+
+    def __init__(self, env: ChannelEnvironment) -> None:
+        """Construct a new aggregate-channel manager for an environment."""
+
+        self.env = env
+        self.tables: Dict[Primitive, AggregateTable] = {}
+        self.channels: Dict[int, AggregateChannel] = {}
+
+    def add_channel(self, name: str, instance: Primitive, rate: float) -> int:
+        """
+        Register a group of channels ('<name>.count', '<name>.min',
+        '<name>.max', '<name>.sum' and '<name>.sum_sq') that are set from the
+        samples aggregated since they last emitted, returns the identifier
+        used to add samples (that of the count channel).
+        """
+
+        env = self.env
+        with env.lock:
+            table = self.tables.get(instance)
+            if table is None:
+                table = AggregateTable(instance)
+                self.tables[instance] = table
+
+            count_chan = AggregateChannel(
+                f"{name}.count", table, table.add_row(), rate
+            )
+            result = env.channel_registry.add_channel(count_chan)
+            assert result[0]
+            env.framer.add_channel(count_chan)
+            self.channels[result[1]] = count_chan
+
+            # the other channels are registered after the count channel, so
+            # they emit after it (with the same rate) and see fresh values
+            for field in AGGREGATE_FIELDS[1:]:
+                chan_id = env.add_channel(
+                    f"{name}.{field}",
+                    field_type(instance, field),
+                    rate,
+                    commandable=False,
+                )
+                chan = env.channel_registry.get_item(chan_id)
+                assert chan is not None
+                count_chan.add_field(chan)
+
+        env.metric_add("channel_count", 1)
+        return result[1]
+
+    def add(self, chan_id: int, value: Any) -> bool:
+        """
+        Add a sample to an aggregate channel, returns False if it wasn't
+        valid.
+        """
+
+        chan = self.channels[chan_id]
+        with self.env.lock:
+            result = chan.table.add(chan.row, value)
+        return result
+
+    def add_many(self, chan_id: int, values: Sequence[Any]) -> int:
+        """
+        Add a block of samples to an aggregate channel, returns the number of
+        samples added.
+        """
+
+        chan = self.channels[chan_id]
+        with self.env.lock:
+            result = chan.table.add_many(chan.row, values)
+        return result
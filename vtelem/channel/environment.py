@@ -5,17 +5,27 @@ vtelem - Exposes a runtime environment for managing sets of channels.
 # built-in
 from collections import defaultdict
 import logging
-from typing import Any, Dict, List, Optional, Tuple
+from typing import (
+    Any,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
 
 # internal
 from vtelem.channel import Channel
 from vtelem.channel.framer import ChannelFramer
 from vtelem.channel.registry import ChannelRegistry
+from vtelem.channel.subscription import Subscriptions
 from vtelem.classes import LOG_PERIOD
-from vtelem.classes.event_queue import EventQueue
+from vtelem.classes.event_queue import DEFAULT_CAPACITY, Event, EventQueue
 from vtelem.classes.metered_queue import MeteredQueue
 from vtelem.classes.time_entity import TimeEntity
-from vtelem.classes.type_primitive import TypePrimitive
+from vtelem.classes.type_primitive import TypePrimitive, invalid_values
 from vtelem.enums.primitive import Primitive
 from vtelem.frame.channel import ChannelFrame
 from vtelem.parsing.encapsulation import ParsedFrame, decode_frame
@@ -24,12 +34,39 @@ from vtelem.registry import Registry
 LOG = logging.getLogger(__name__)
 
 
+def invalid_indices(
+    channels: Sequence[Optional[Channel]], values: Sequence[Any]
+) -> Set[int]:
+    """
+    Get the indices of values that aren't valid for their channels, values
+    for each primitive type are validated together.
+    """
+
+    by_type: Dict[Primitive, List[int]] = defaultdict(list)
+    for idx, chan in enumerate(channels):
+        assert chan is not None
+        by_type[chan.type].append(idx)
+
+    result = set()
+    for instance, indices in by_type.items():
+        for bad in invalid_values(instance, [values[i] for i in indices]):
+            LOG.warning(
+                "value '%s' not valid for type '%s'",
+                values[indices[bad]],
+                instance,
+            )
+            result.add(indices[bad])
+    return result
+
+
 class ChannelEnvironment(TimeEntity):
     """
     An environment for managing channels and building outgoing event and data
     frames.
     """
 
+    # pylint: disable=too-many-public-methods
+
     def __init__(
         self,
         mtu: int,
@@ -38,6 +75,8 @@ class ChannelEnvironment(TimeEntity):
         init_time: float = None,
         app_id_basis: float = None,
         use_crc: bool = True,
+        *,
+        event_capacity: int = DEFAULT_CAPACITY,
     ) -> None:
         """Construct a new channel environment."""
 
@@ -58,10 +97,12 @@ class ChannelEnvironment(TimeEntity):
         self.write_crc = True
 
         self.metrics: Optional[Dict[str, int]] = None
-        self.event_queue = EventQueue()
+        self.event_queue = EventQueue(event_capacity)
         if metrics_rate is not None:
             self.register_base_metrics(metrics_rate)
         self.frame_queue: MeteredQueue = MeteredQueue("frame", self)
+
+        self.subscriptions = Subscriptions(self.framer, self.lock)
         self.log_data: dict = defaultdict(lambda: 0.0)
 
     @property
@@ -92,6 +133,9 @@ class ChannelEnvironment(TimeEntity):
             self.add_metric(
                 "emits_captured", Primitive.UINT32, True, (0, None)
             )
+            self.add_metric(
+                "events_dropped", Primitive.UINT32, True, (0, None)
+            )
             self.add_metric(
                 "dispatch_count", Primitive.UINT32, True, (0, None)
             )
@@ -130,6 +174,54 @@ class ChannelEnvironment(TimeEntity):
         assert chan is not None
         return chan.set(data, self.get_time())
 
+    def set_many(
+        self, ids: Sequence[int], values: Sequence[Any], time: float = None
+    ) -> int:
+        """
+        Set many channels at once, returns the number of channels that were
+        set (invalid values are skipped).
+        """
+
+        assert len(ids) == len(values)
+        if time is None:
+            time = self.get_time()
+        channels = self.channel_registry.get_items(ids)
+        invalid = invalid_indices(channels, values)
+
+        events: List[Event] = []
+        count = 0
+        with self.lock:
+            for idx, chan in enumerate(channels):
+                if idx in invalid:
+                    continue
+                assert chan is not None
+                prev = (chan.data, chan.last_set)
+                chan.data = chan.type.value.type(values[idx])
+                chan.last_set = time
+                count += 1
+
+                # events for this environment's queue are enqueued together
+                if chan.changed_cb is not None and prev[0] != chan.data:
+                    curr = (chan.data, time)
+                    if chan.event_queue is self.event_queue:
+                        events.append((chan.id, prev, curr))
+                    else:
+                        chan.changed_cb(prev, curr)
+
+            self.event_queue.extend(events)
+
+        return count
+
+    def set_group_values(
+        self, values: Mapping[int, Any], time: float = None
+    ) -> int:
+        """
+        Set channels from a mapping of integer identifiers to values, returns
+        the number of channels that were set.
+        """
+
+        return self.set_many(list(values.keys()), list(values.values()), time)
+
     def get_value(self, chan_id: int) -> Any:
         """Get the current value of a channel, by integer identifier."""
 
@@ -207,10 +299,10 @@ class ChannelEnvironment(TimeEntity):
         with self.lock:
             queue = None if not track_change else self.event_queue
             new_chan = Channel(name, instance, rate, queue, commandable)
-            if initial is not None:
-                assert new_chan.set(initial[0], initial[1])
             result = self.channel_registry.add_channel(new_chan)
             assert result[0]
+            if initial is not None:
+                assert new_chan.set(initial[0], initial[1])
             self.framer.add_channel(new_chan)
 
         self.metric_add("channel_count", 1)
@@ -264,18 +356,23 @@ class ChannelEnvironment(TimeEntity):
     def dispatch_events(self, time: float) -> Tuple[int, int]:
         """Process all queued events (build frames)."""
 
-        result = self.framer.build_event_frames(
-            time, self.event_queue, self.frame_queue, self.write_crc
+        events = self.event_queue.consume()
+        result = self.framer.frames_from_events(
+            time, events, self.frame_queue, self.write_crc
         )
+        self.subscriptions.build_event_frames(time, events, self.write_crc)
         self.metric_add("events_captured", result[1], time)
+        self.set_metric("events_dropped", self.event_queue.dropped, time)
         return result
 
     def dispatch_data(self, time: float) -> Tuple[int, int]:
         """Process all channel emissions for the specified, absolute time."""
 
-        result = self.framer.build_data_frames(
-            time, self.frame_queue, self.write_crc
+        emits = self.framer.emit_due(time)
+        result = self.framer.frames_from_emits(
+            time, emits, self.frame_queue, self.write_crc
         )
+        self.subscriptions.build_emit_frames(time, emits, self.write_crc)
         self.metric_add("emits_captured", result[1], time)
         return result
 
@@ -3,23 +3,56 @@ vtelem - A module for building frames of channel data from emissions.
 """
 
 # built-in
+import heapq
 import logging
 from queue import Queue
-from typing import List, Tuple
+from typing import Any, Dict, Iterable, List, Tuple
+
+# third-party
+from typing_extensions import Protocol
 
 # internal
 from vtelem.channel import Channel
 from vtelem.channel.registry import ChannelRegistry
-from vtelem.classes.event_queue import EventQueue
+from vtelem.classes.event_queue import Event, EventQueue
 from vtelem.classes.time_entity import OptionalRLock
 from vtelem.enums.primitive import Primitive
 from vtelem.frame import Frame
 from vtelem.frame.channel import ChannelFrame
 from vtelem.frame.framer import Framer
 from vtelem.frame.framer import build_dummy_frame as dummy_frame
+from vtelem.frame.stream import StreamFrame, sample_bytes
 
 LOG = logging.getLogger(__name__)
 
+# (next emit time, channel identifier, channel generation, channel)
+ScheduleEntry = Tuple[float, int, int, Channel]
+
+# (channel identifier, channel type, emitted value)
+Emit = Tuple[int, Primitive, Any]
+
+
+class FrameSink(Protocol):  # pylint: disable=too-few-public-methods
+    """Anything that built frames can be put into, such as a queue."""
+
+    def put(self, item: Frame) -> None:
+        """Put a frame into this sink."""
+
+
+class FrameFanout:  # pylint: disable=too-few-public-methods
+    """A frame sink that puts every frame into each of a set of sinks."""
+
+    def __init__(self, sinks: Iterable[FrameSink]) -> None:
+        """Construct a new fan-out for some sinks."""
+
+        self.sinks = list(sinks)
+
+    def put(self, item: Frame) -> None:
+        """Put a frame into every sink."""
+
+        for sink in self.sinks:
+            sink.put(item)
+
 
 class ChannelFramer(Framer):
     """
@@ -39,9 +72,15 @@ class ChannelFramer(Framer):
 
         super().__init__(mtu, app_id_basis, use_crc)
         self.registry = registry
-        self.channels = channels
+        self.channels: List[Channel] = []
         self.lock = channel_lock
 
+        # channels ordered by when they're next due to emit, so that
+        # dispatching only visits channels that emit
+        self.schedule: List[ScheduleEntry] = []
+        for channel in channels:
+            self.add_channel(channel)
+
     def new_event_frame(self, time: float = None) -> ChannelFrame:
         """Construct a new event-frame object."""
 
@@ -56,10 +95,55 @@ class ChannelFramer(Framer):
         assert isinstance(frame, ChannelFrame)
         return frame
 
+    def new_stream_frame(
+        self, chan_id: int, index: int, time: float = None
+    ) -> StreamFrame:
+        """Construct a new stream-frame object."""
+
+        frame = self.new_frame("stream", time)
+        assert isinstance(frame, StreamFrame)
+        frame.initialize(chan_id, index)
+        return frame
+
     def add_channel(self, channel: Channel) -> None:
         """Add another managed channel."""
 
-        self.channels.append(channel)
+        if channel.id is None:
+            channel.id = self.registry.get_id(channel.name)
+        assert channel.id is not None
+
+        with self.lock:
+            self.channels.append(channel)
+            channel.rescheduled = self.reschedule
+            self.reschedule(channel)
+
+    def reschedule(self, channel: Channel) -> None:
+        """
+        Schedule a channel's next emission, entries from before its rate
+        last changed are discarded when they come due.
+        """
+
+        assert channel.id is not None
+        with self.lock:
+            heapq.heappush(
+                self.schedule,
+                (channel.next_emit, channel.id, channel.generation, channel),
+            )
+
+    def due_channels(self, time: float) -> List[Channel]:
+        """
+        Remove all channels that are due to emit at the provided time from the
+        schedule, in registration order.
+        """
+
+        due: List[ScheduleEntry] = []
+        while self.schedule and self.schedule[0][0] <= time:
+            entry = heapq.heappop(self.schedule)
+            if entry[2] == entry[3].generation:
+                due.append(entry)
+
+        due.sort(key=lambda entry: entry[1])
+        return [entry[3] for entry in due]
 
     def build_event_frames(
         self,
@@ -73,15 +157,42 @@ class ChannelFramer(Framer):
         events.
         """
 
+        return self.frames_from_events(
+            time, event_queue.consume(), queue, write_crc
+        )
+
+    def frames_from_events(
+        self,
+        time: float,
+        events: List[Event],
+        queue: FrameSink,
+        write_crc: bool = True,
+    ) -> Tuple[int, int]:
+        """
+        Build frames from a list of events. Events of channels that aren't
+        registered are skipped.
+        """
+
         frame_count = 0
-        events = event_queue.consume()
-        event_count = len(events)
+        event_count = 0
+        skipped = 0
 
         curr_frame = self.new_event_frame(time)
+        chan_types: Dict[int, Primitive] = {}
         for event in events:
-            chan_id = self.registry.get_id(event[0])
-            assert chan_id is not None
-            chan_type = self.registry.get_channel_type(chan_id)
+            chan_id = event[0]
+            if chan_id is None:
+                skipped += 1
+                continue
+            chan_type = chan_types.get(chan_id)
+            if chan_type is None:
+                channel = self.registry.get_item(chan_id)
+                if channel is None:
+                    skipped += 1
+                    continue
+                chan_type = channel.type
+                chan_types[chan_id] = chan_type
+            event_count += 1
 
             # add this event, start a new frame if necessary
             if not curr_frame.add_event(
@@ -95,6 +206,9 @@ class ChannelFramer(Framer):
                     chan_id, chan_type, event[1], event[2]
                 )
 
+        if skipped:
+            LOG.warning("skipped %d events of unregistered channels", skipped)
+
         # finalize the last frame if necessary
         if event_count and not curr_frame.finalized:
             curr_frame.finalize(write_crc and self.use_crc)
@@ -103,6 +217,40 @@ class ChannelFramer(Framer):
 
         return (frame_count, event_count)
 
+    def build_stream_frames(
+        self,
+        channel: Channel,
+        samples: Any,
+        index: int,
+        time: float,
+        queue: FrameSink,
+        *,
+        write_crc: bool = True,
+    ) -> Tuple[int, int]:
+        """
+        Pack a block of samples for a stream channel into as many consecutive
+        stream frames as necessary, starting at a sample index.
+        """
+
+        assert channel.is_stream and channel.id is not None
+        data = sample_bytes(samples, channel.type)
+        sample_size = channel.size()
+        sample_count = len(data) // sample_size
+
+        frame_count = 0
+        offset = 0
+        while offset < len(data):
+            frame = self.new_stream_frame(channel.id, index, time)
+            added = frame.add_samples(data[offset:], sample_size)
+            assert added > 0
+            frame.finalize(write_crc and self.use_crc)
+            queue.put(frame)
+            frame_count += 1
+            index += added
+            offset += added * sample_size
+
+        return (frame_count, sample_count)
+
     def build_data_frames(
         self, time: float, queue: Queue, write_crc: bool = True
     ) -> Tuple[int, int]:
@@ -111,36 +259,51 @@ class ChannelFramer(Framer):
         wire-level transport.
         """
 
-        frame_count = 0
-        emit_count = 0
+        return self.frames_from_emits(
+            time, self.emit_due(time), queue, write_crc
+        )
 
-        curr_frame = self.new_data_frame(time)
+    def emit_due(self, time: float) -> List[Emit]:
+        """Get the emissions of all channels that are due at a time."""
+
+        emits: List[Emit] = []
         with self.lock:
-            for channel in self.channels:
+            for channel in self.due_channels(time):
                 result = channel.emit(time)
-
-                # if the channel emitted, add it to the current frame
+                self.reschedule(channel)
                 if result is not None:
-                    emit_count += 1
-                    chan_id = self.registry.get_id(channel.name)
-                    assert chan_id is not None
-
-                    # if we failed to add this emit to the current frame,
-                    # finalize it and start a new one
-                    if not curr_frame.add(chan_id, channel.type, result):
-                        curr_frame.finalize(write_crc and self.use_crc)
-                        queue.put(curr_frame)
-                        frame_count += 1
-                        curr_frame = self.new_data_frame()
-                        assert curr_frame.add(chan_id, channel.type, result)
+                    assert channel.id is not None
+                    emits.append((channel.id, channel.type, result))
+        return emits
+
+    def frames_from_emits(
+        self,
+        time: float,
+        emits: List[Emit],
+        queue: FrameSink,
+        write_crc: bool = True,
+    ) -> Tuple[int, int]:
+        """Build frames from a list of channel emissions."""
+
+        frame_count = 0
+        curr_frame = self.new_data_frame(time)
+        for chan_id, chan_type, value in emits:
+            # if we failed to add this emit to the current frame, finalize it
+            # and start a new one
+            if not curr_frame.add(chan_id, chan_type, value):
+                curr_frame.finalize(write_crc and self.use_crc)
+                queue.put(curr_frame)
+                frame_count += 1
+                curr_frame = self.new_data_frame()
+                assert curr_frame.add(chan_id, chan_type, value)
 
         # finalize the last frame if necessary
-        if emit_count and not curr_frame.finalized:
+        if emits and not curr_frame.finalized:
             curr_frame.finalize(write_crc and self.use_crc)
             queue.put(curr_frame)
             frame_count += 1
 
-        return (frame_count, emit_count)
+        return (frame_count, len(emits))
 
 
 def build_dummy_frame(
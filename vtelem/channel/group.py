@@ -5,13 +5,23 @@ vtelem - Simplify management of logical groups of channels and synchronize
 
 # built-in
 from contextlib import contextmanager
-from typing import Any, Dict, Iterator
+from typing import Any, Dict, Iterator, NamedTuple, Optional
 
 # internal
+from vtelem.channel import Channel
+from vtelem.classes.user_enum import UserEnum
 from vtelem.enums.primitive import Primitive, default_val
 from vtelem.telemetry.environment import TelemetryEnvironment
 
 
+class GroupChannel(NamedTuple):
+    """A channel (and its enum definition, if any) resolved for a group."""
+
+    id: int
+    channel: Channel
+    enum: Optional[UserEnum] = None
+
+
 class ChannelGroup:
     """
     A class for managing groups of channels with atomic syncs to the
@@ -23,7 +33,7 @@ class ChannelGroup:
 
         self.env = env
         self.name = name
-        self.channels: Dict[str, Dict[str, Any]] = {}
+        self.channels: Dict[str, GroupChannel] = {}
 
     def add_channel(
         self,
@@ -50,7 +60,7 @@ class ChannelGroup:
         except AssertionError:
             return False
 
-        self.channels[name] = {"id": chan_id, "value": val, "is_enum": False}
+        self.channels[name] = GroupChannel(chan_id, self.resolve(chan_id))
         return True
 
     def add_enum_channel(
@@ -88,9 +98,18 @@ class ChannelGroup:
         except AssertionError:
             return False
 
-        self.channels[name] = {"id": chan_id, "is_enum": True}
+        self.channels[name] = GroupChannel(
+            chan_id, self.resolve(chan_id), enum
+        )
         return True
 
+    def resolve(self, chan_id: int) -> Channel:
+        """Get a channel object from the environment."""
+
+        chan = self.env.channel_registry.get_item(chan_id)
+        assert chan is not None
+        return chan
+
     @contextmanager
     def data(self) -> Iterator[Dict[str, Any]]:
         """
@@ -98,32 +117,45 @@ class ChannelGroup:
         synced with the environment.
         """
 
+        data = self.read()
+        initial = dict(data)
         try:
-            data = self.read()
             yield data
         finally:
-            self.write(data)
+            self.write(
+                {
+                    name: value
+                    for name, value in data.items()
+                    if name not in initial or initial[name] != value
+                }
+            )
 
     def read(self) -> Dict[str, Any]:
         """Read all channel values from the environment, atomically."""
 
-        values = {}
         with self.env.lock:
-            for name, channel in self.channels.items():
-                if channel["is_enum"]:
-                    values[name] = self.env.get_enum_value(channel["id"])
-                else:
-                    values[name] = self.env.get_value(channel["id"])
+            raw = [entry.channel.data for entry in self.channels.values()]
+
+        values: Dict[str, Any] = {}
+        for (name, entry), value in zip(self.channels.items(), raw):
+            values[name] = (
+                value if entry.enum is None else entry.enum.get_str(int(value))
+            )
         return values
 
     def write(self, values: Dict[str, Any]) -> None:
         """Write the values into the environment."""
 
-        with self.env.lock:
-            for name, value in values.items():
-                assert name in self.channels
-                chan = self.channels[name]
-                if chan["is_enum"]:
-                    self.env.set_enum_now(chan["id"], value)
-                else:
-                    self.env.set_now(chan["id"], value)
+        if not values:
+            return
+
+        ids = []
+        raw = []
+        for name, value in values.items():
+            assert name in self.channels
+            entry = self.channels[name]
+            ids.append(entry.id)
+            raw.append(
+                value if entry.enum is None else entry.enum.get_value(value)
+            )
+        self.env.set_many(ids, raw)
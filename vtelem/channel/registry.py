@@ -7,9 +7,14 @@ from typing import List, Tuple
 
 # internal
 from vtelem.channel import Channel, ChannelEncoder
+from vtelem.classes.layout_cache import LayoutCache
 from vtelem.enums.primitive import Primitive
 from vtelem.registry import Registry
 
+# (name, primitive name, rate, commandable, is-stream) for each channel, in
+# identifier order
+ChannelSnapshot = List[Tuple[str, str, float, bool, bool]]
+
 
 class ChannelRegistry(Registry[Channel]):
     """
@@ -21,6 +26,11 @@ class ChannelRegistry(Registry[Channel]):
         """Construct a new channel registry."""
 
         super().__init__("channels", None)
+
+        # compiled frame layouts (for decoding), channels can't be
+        # re-assigned to different identifiers so these never go stale
+        self.layouts = LayoutCache()
+
         if initial_channels is not None:
             for channel in initial_channels:
                 self.add_channel(channel)
@@ -35,7 +45,52 @@ class ChannelRegistry(Registry[Channel]):
     def add_channel(self, channel: Channel) -> Tuple[bool, int]:
         """Attempt to register a channel."""
 
-        return self.add(channel.name, channel)
+        result = self.add(channel.name, channel)
+        if result[0]:
+            channel.id = result[1]
+        return result
+
+    def snapshot(self) -> ChannelSnapshot:
+        """
+        Get a (serializable) description of every registered channel, from
+        which an equivalent registry can be constructed.
+        """
+
+        result: ChannelSnapshot = []
+        with self.lock:
+            for chan_id in range(self.count()):
+                channel = self.get_item(chan_id)
+                assert channel is not None
+                result.append(
+                    (
+                        channel.name,
+                        channel.type.name,
+                        channel.rate,
+                        channel.commandable,
+                        channel.is_stream,
+                    )
+                )
+        return result
+
+    @staticmethod
+    def from_snapshot(snapshot: ChannelSnapshot) -> "ChannelRegistry":
+        """
+        Construct a registry (with the same channel identifiers) from a
+        snapshot.
+        """
+
+        return ChannelRegistry(
+            [
+                Channel(
+                    name,
+                    Primitive[type_name],
+                    rate,
+                    commandable=commandable,
+                    is_stream=is_stream,
+                )
+                for name, type_name, rate, commandable, is_stream in snapshot
+            ]
+        )
 
     def describe(self, indented: bool = False) -> str:
         """Obtain a JSON String of the channel registry's current state."""
@@ -0,0 +1,75 @@
+"""
+vtelem - A module for channels whose samples are produced in blocks.
+"""
+
+# built-in
+from typing import Any, List, Tuple
+
+# internal
+from vtelem.channel import Channel
+from vtelem.channel.environment import ChannelEnvironment
+from vtelem.channel.framer import FrameFanout, FrameSink
+from vtelem.enums.primitive import Primitive
+
+
+class StreamChannels:
+    """
+    A class for registering stream channels with an environment, and for
+    producing stream frames (blocks of consecutive samples) for them.
+    """
+
+    def __init__(self, env: ChannelEnvironment) -> None:
+        """Construct a new stream-channel manager for an environment."""
+
+        self.env = env
+
+    def add_channel(self, name: str, instance: Primitive) -> int:
+        """
+        Register a channel whose samples are only produced in blocks (it's
+        never scheduled for data frames), returns its integer identifier.
+        """
+
+        with self.env.lock:
+            new_chan = Channel(
+                name, instance, float(), commandable=False, is_stream=True
+            )
+            result = self.env.channel_registry.add_channel(new_chan)
+            assert result[0]
+
+        self.env.metric_add("channel_count", 1)
+        return result[1]
+
+    def write(
+        self,
+        chan_id: int,
+        samples: Any,
+        index: int = 0,
+        time: float = None,
+    ) -> Tuple[int, int]:
+        """
+        Produce stream frames for a block of samples (an 'array.array', NumPy
+        array or any other buffer-protocol object) of a stream channel, the
+        first of which has the provided sample index. Returns the number of
+        frames and samples produced. Frames are also written to the clients
+        subscribed to the channel.
+        """
+
+        env = self.env
+        chan = env.channel_registry.get_item(chan_id)
+        assert chan is not None
+        if time is None:
+            time = env.get_time()
+
+        # subscribers of the channel are sent the same frames
+        with env.lock:
+            sinks: List[FrameSink] = [env.frame_queue]
+            sinks.extend(env.subscriptions.stream_sinks(chan_id))
+            result = env.framer.build_stream_frames(
+                chan,
+                samples,
+                index,
+                time,
+                FrameFanout(sinks),
+                write_crc=env.write_crc,
+            )
+        return result
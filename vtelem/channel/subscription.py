@@ -0,0 +1,311 @@
+"""
+vtelem - A module for describing (and tracking) the subset of channels that
+         clients want to receive.
+"""
+
+# built-in
+from queue import Empty, Full, Queue
+from typing import (
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+from urllib.parse import parse_qsl, urlencode
+
+# third-party
+from typing_extensions import Protocol
+
+# internal
+from vtelem.channel.framer import ChannelFramer, Emit
+from vtelem.channel.registry import ChannelRegistry
+from vtelem.classes.event_queue import Event
+from vtelem.classes.time_entity import OptionalRLock
+from vtelem.frame import Frame
+
+
+class Subscription(NamedTuple):
+    """
+    The channels a client wants to receive, by name or name prefix, and the
+    shortest interval (in seconds) at which specific channels should be
+    received. Equal subscriptions are served the same frames.
+    """
+
+    names: FrozenSet[str] = frozenset()
+    prefixes: FrozenSet[str] = frozenset()
+    rates: FrozenSet[Tuple[str, float]] = frozenset()
+
+    def matches(self, name: str) -> bool:
+        """Determine if a channel name is part of this subscription."""
+
+        return name in self.names or any(
+            name.startswith(prefix) for prefix in self.prefixes
+        )
+
+    def rate(self, name: str) -> float:
+        """Get the shortest interval a channel should be received at."""
+
+        for chan_name, rate in self.rates:
+            if chan_name == name:
+                return rate
+        return float()
+
+
+def subscription(
+    names: Iterable[str] = (),
+    prefixes: Iterable[str] = (),
+    groups: Iterable[str] = (),
+    rates: Mapping[str, float] = None,
+) -> Subscription:
+    """
+    Create a subscription to channels by name, name prefix and channel group
+    (by group name). Channels with a rate are also subscribed to.
+    """
+
+    if rates is None:
+        rates = {}
+    return Subscription(
+        frozenset(names) | frozenset(rates.keys()),
+        frozenset(prefixes) | frozenset(f"{group}." for group in groups),
+        frozenset(rates.items()),
+    )
+
+
+def subscription_query(sub: Subscription) -> str:
+    """
+    Encode a subscription as a URL query string, so that clients can declare
+    it when connecting.
+    """
+
+    items = [("name", name) for name in sorted(sub.names)]
+    items.extend(("prefix", prefix) for prefix in sorted(sub.prefixes))
+    items.extend(
+        ("rate", f"{name}={rate}") for name, rate in sorted(sub.rates)
+    )
+    return urlencode(items)
+
+
+def parse_subscription_query(query: str) -> Optional[Subscription]:
+    """
+    Decode a subscription from a URL query string, returns None if the query
+    doesn't declare one.
+    """
+
+    names = []
+    prefixes = []
+    rates = {}
+    for key, value in parse_qsl(query):
+        if key == "name":
+            names.append(value)
+        elif key == "prefix":
+            prefixes.append(value)
+        elif key == "rate":
+            name, rate = value.rsplit("=", 1)
+            rates[name] = float(rate)
+
+    if not names and not prefixes and not rates:
+        return None
+    return subscription(names, prefixes, rates=rates)
+
+
+class SubscriberQueue(Protocol):  # pylint: disable=too-few-public-methods
+    """
+    Anything that a subscriber's (size-prefixed) frame payloads can be put
+    into without blocking, such as a queue. None is put when no more payloads
+    will follow.
+    """
+
+    def put_nowait(self, item: Optional[bytes]) -> None:
+        """Put a payload, raise 'queue.Full' if there's no room for it."""
+
+
+class SubscribedSet:
+    """
+    Clients that share a subscription. Frames built for the set are written
+    to every client's queue as the same (size-prefixed) payload.
+    """
+
+    def __init__(self, sub: Subscription) -> None:
+        """Construct a new, empty set of clients for a subscription."""
+
+        self.subscription = sub
+        self.queues: Dict[int, SubscriberQueue] = {}
+        self.dropped: int = 0
+
+        # subscribed channel identifiers, and their rates
+        self.channels: Dict[int, float] = {}
+        self.last_sent: Dict[int, float] = {}
+        self.resolved: int = 0
+
+    def resolve(self, registry: ChannelRegistry) -> None:
+        """Find the subscribed channels added since this was last called."""
+
+        count = registry.count()
+        for chan_id in range(self.resolved, count):
+            channel = registry.get_item(chan_id)
+            assert channel is not None
+            if self.subscription.matches(channel.name):
+                self.channels[chan_id] = self.subscription.rate(channel.name)
+        self.resolved = count
+
+    def filter_emits(self, time: float, emits: List[Emit]) -> List[Emit]:
+        """
+        Get the emissions of subscribed channels that are due to be sent at
+        the provided time.
+        """
+
+        result = []
+        for emit in emits:
+            rate = self.channels.get(emit[0])
+            if rate is None:
+                continue
+            if rate:
+                last_sent: Optional[float] = self.last_sent.get(emit[0])
+                if last_sent is not None and time - last_sent < rate:
+                    continue
+                self.last_sent[emit[0]] = time
+            result.append(emit)
+        return result
+
+    def filter_events(self, events: List[Event]) -> List[Event]:
+        """Get the events of subscribed channels."""
+
+        return [event for event in events if event[0] in self.channels]
+
+    def put(self, item: Frame) -> None:
+        """
+        Write a frame to every client's queue. Frames are written from the
+        thread that builds them (with the environment locked), so a client
+        whose queue is full misses the frame instead of blocking it.
+        """
+
+        payload = item.payload
+        for queue in self.queues.values():
+            try:
+                queue.put_nowait(payload)
+            except Full:
+                self.dropped += 1
+
+
+class Subscriptions:
+    """
+    Clients that only receive frames for the channels they subscribed to,
+    frames are built once for each distinct subscription.
+    """
+
+    def __init__(self, framer: ChannelFramer, lock: OptionalRLock) -> None:
+        """Construct a new set of subscriptions for a channel framer."""
+
+        self.framer = framer
+        self.lock = lock
+        self.sets: Dict[Subscription, SubscribedSet] = {}
+        self.subscribers: Dict[int, Subscription] = {}
+        self.subscriber_id: int = 0
+
+    def __len__(self) -> int:
+        """Get the number of distinct subscriptions."""
+
+        return len(self.sets)
+
+    def subscribe(self, sub: Subscription, queue: SubscriberQueue) -> int:
+        """
+        Start writing frames for subscribed channels to a queue (as
+        size-prefixed bytes, like stream-writer queues), returns an integer
+        identifier for the subscriber. Frames are never put into a full
+        queue, they're dropped (and counted) instead.
+        """
+
+        with self.lock:
+            subscribed = self.sets.get(sub)
+            if subscribed is None:
+                subscribed = SubscribedSet(sub)
+                self.sets[sub] = subscribed
+
+            result = self.subscriber_id
+            subscribed.queues[result] = queue
+            self.subscribers[result] = sub
+            self.subscriber_id += 1
+        return result
+
+    def unsubscribe(self, sub_id: int, inject_none: bool = True) -> bool:
+        """
+        Remove a subscriber, if one is present with this identifier. Unless
+        disabled, None is put into its queue (without blocking) to signal
+        that no more frames will follow.
+        """
+
+        with self.lock:
+            sub = self.subscribers.pop(sub_id, None)
+            if sub is None:
+                return False
+            subscribed = self.sets[sub]
+            queue = subscribed.queues.pop(sub_id)
+            if not subscribed.queues:
+                del self.sets[sub]
+
+        # make room for the final None (dropping the oldest frame) rather
+        # than blocking on a full queue
+        if inject_none:
+            try:
+                queue.put_nowait(None)
+            except Full:
+                # only the subscriber takes from the queue now
+                assert isinstance(queue, Queue)
+                try:
+                    queue.get_nowait()
+                except Empty:
+                    pass
+                queue.put_nowait(None)
+        return True
+
+    def resolved(self) -> List[SubscribedSet]:
+        """
+        Get every subscription's set of clients, with the channels added
+        since they were last resolved.
+        """
+
+        with self.lock:
+            result = list(self.sets.values())
+            for subscribed in result:
+                subscribed.resolve(self.framer.registry)
+        return result
+
+    def build_emit_frames(
+        self, time: float, emits: List[Emit], write_crc: bool = True
+    ) -> None:
+        """Build frames of each subscription's (due) channel emissions."""
+
+        for subscribed in self.resolved():
+            self.framer.frames_from_emits(
+                time,
+                subscribed.filter_emits(time, emits),
+                subscribed,
+                write_crc,
+            )
+
+    def build_event_frames(
+        self, time: float, events: List[Event], write_crc: bool = True
+    ) -> None:
+        """Build frames of each subscription's channel events."""
+
+        for subscribed in self.resolved():
+            self.framer.frames_from_events(
+                time, subscribed.filter_events(events), subscribed, write_crc
+            )
+
+    def stream_sinks(self, chan_id: int) -> List[SubscribedSet]:
+        """
+        Get the sets of clients that stream frames of a channel are written
+        to. Every stream frame is sent, subscribed rates only apply to
+        channel emissions.
+        """
+
+        return [
+            subscribed
+            for subscribed in self.resolved()
+            if chan_id in subscribed.channels
+        ]
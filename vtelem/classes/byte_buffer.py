@@ -4,11 +4,12 @@ vtelem - A buffer implementation for serializing and de-serializing primitives.
 
 # built-in
 from contextlib import contextmanager
-import struct
-from typing import Any, Iterator
+from struct import Struct
+from typing import Any, Iterator, Tuple, Union
 import zlib
 
 # internal
+from vtelem.classes.codec import DEFAULT_ORDER, get_codec
 from vtelem.enums.primitive import Primitive, get_fstring, get_size
 
 
@@ -17,7 +18,7 @@ def crc(data: bytes, size: int = None, initial_val: int = 0) -> int:
 
     if size is None:
         size = len(data)
-    return zlib.crc32(data[0:size], initial_val)
+    return zlib.crc32(memoryview(data)[0:size], initial_val)
 
 
 class ByteBuffer:
@@ -31,7 +32,7 @@ class ByteBuffer:
         data: bytearray = None,
         mutable: bool = True,
         size: int = 0,
-        order: str = "!",
+        order: str = DEFAULT_ORDER,
     ) -> None:
         """Construct a new, managed buffer."""
 
@@ -69,11 +70,29 @@ class ByteBuffer:
             if pos is not None:
                 self.set_pos(orig_pos)
 
+    @property
+    def capacity(self) -> int:
+        """Get the size of the backing buffer."""
+
+        return len(self.data)
+
+    def reserve(self, capacity: int) -> None:
+        """
+        Ensure that the backing buffer is at least a certain size, so that
+        writes up to that size don't need to re-allocate it.
+        """
+
+        if capacity > len(self.data):
+            self.data += bytes(capacity - len(self.data))
+
     def expand_to(self, size: int) -> None:
-        """Extend the backing buffer if requested."""
+        """
+        Extend the backing buffer if requested (at least doubling its
+        capacity, so that repeated small writes have amortized cost).
+        """
 
         if size > len(self.data):
-            self.data += bytearray(size - len(self.data))
+            self.reserve(max(size, 2 * len(self.data)))
 
     def set_pos(self, pos: int) -> None:
         """Set the current buffer position."""
@@ -115,10 +134,21 @@ class ByteBuffer:
     def read(self, inst: Primitive, chomp: bool = False) -> Any:
         """Read a primitive out of a buffer, at its current position."""
 
-        assert self.can_read(inst)
-        result = struct.unpack(
-            self.fstring(inst), self.read_bytes(get_size(inst), chomp)
-        )[0]
+        codec = get_codec(inst, self.order)
+        if chomp:
+            assert self.remaining >= codec.size
+            return codec.unpack(self.read_bytes(codec.size, chomp))[0]
+        return self.unpack(codec)[0]
+
+    def unpack(self, codec: Struct) -> Tuple[Any, ...]:
+        """
+        Read all of the fields of a compiled codec out of the buffer, at its
+        current position.
+        """
+
+        assert self.remaining >= codec.size
+        result = codec.unpack_from(self.data, self.get_pos())
+        self.advance(codec.size)
         return result
 
     def read_bytes(self, count: int, chomp: bool = False) -> bytes:
@@ -133,18 +163,24 @@ class ByteBuffer:
         # buffer
         if chomp:
             assert pos == 0
-            self.data = self.data[pos + count :]
+            del self.data[0:count]
             self.size = self.remaining
             self.set_pos(0)
 
         return result
 
-    def append(self, other: bytes, data_len: int = None) -> int:
+    def append(
+        self, other: Union[bytes, bytearray, memoryview], data_len: int = None
+    ) -> int:
         """Add raw data to the end of this set."""
 
         if data_len is None:
             data_len = len(other)
-        self.data = self.data[0 : self.size] + other[0:data_len]
+
+        # copy the new data into the backing buffer in-place
+        end = self.size + data_len
+        self.expand_to(end)
+        self.data[self.size : end] = memoryview(other)[0:data_len]
 
         if not self.remaining and self.size != 0:
             self.advance(data_len, True)
@@ -164,10 +200,17 @@ class ByteBuffer:
         position.
         """
 
+        return self.pack(get_codec(inst, self.order), data)
+
+    def pack(self, codec: Struct, *data: Any) -> int:
+        """
+        Write values for all of the fields of a compiled codec into the buffer
+        at its current position.
+        """
+
         if not self.mutable:
             return 0
-        size = get_size(inst)
-        self.expand_to(self.get_pos() + size)
-        struct.pack_into(self.fstring(inst), self.data, self.get_pos(), data)
-        self.advance(size, True)
-        return size
+        self.expand_to(self.get_pos() + codec.size)
+        codec.pack_into(self.data, self.get_pos(), *data)
+        self.advance(codec.size, True)
+        return codec.size
@@ -0,0 +1,65 @@
+"""
+vtelem - Pre-compiled 'struct' codecs for primitives and fixed frame fields.
+"""
+
+# built-in
+import struct
+from typing import Dict, Tuple
+
+# internal
+from vtelem.classes import DEFAULTS
+from vtelem.enums.primitive import Primitive, get_fstring
+
+DEFAULT_ORDER = "!"
+BYTE_ORDERS = "@=<>!"
+
+CODECS: Dict[Tuple[str, Primitive], struct.Struct] = {
+    (order, inst): struct.Struct(order + get_fstring(inst))
+    for order in BYTE_ORDERS
+    for inst in Primitive
+}
+
+# An event element is a (value, timestamp) pair for both the previous and
+# current value of a channel.
+EVENT_CODECS: Dict[Tuple[str, Primitive], struct.Struct] = {
+    (order, inst): struct.Struct(
+        order + (get_fstring(inst) + get_fstring(DEFAULTS["timestamp"])) * 2
+    )
+    for order in BYTE_ORDERS
+    for inst in Primitive
+}
+
+
+def get_codec(inst: Primitive, order: str = DEFAULT_ORDER) -> struct.Struct:
+    """Get the compiled codec for a primitive in a specific byte order."""
+
+    return CODECS[(order, inst)]
+
+
+def get_event_codec(
+    inst: Primitive, order: str = DEFAULT_ORDER
+) -> struct.Struct:
+    """Get the compiled codec for an event element of a given primitive."""
+
+    return EVENT_CODECS[(order, inst)]
+
+
+def fields_codec(
+    *fields: Primitive, order: str = DEFAULT_ORDER
+) -> struct.Struct:
+    """Compile a codec for a sequence of primitive fields."""
+
+    return struct.Struct(order + "".join(get_fstring(inst) for inst in fields))
+
+
+# frame header: (application) id, type, timestamp, element count
+FRAME_HEADER = fields_codec(
+    DEFAULTS["id"], DEFAULTS["enum"], DEFAULTS["timestamp"], DEFAULTS["count"]
+)
+FRAME_COUNT_OFFSET = FRAME_HEADER.size - get_codec(DEFAULTS["count"]).size
+
+# frame footer: crc
+FRAME_FOOTER = fields_codec(DEFAULTS["crc"])
+
+# inter-frame size header
+FRAME_SIZE = get_codec(DEFAULTS["count"])
@@ -4,38 +4,67 @@ vtelem - A queue that stores change events that can be completely drained on
 """
 
 # built-in
-from queue import Full, Queue
-import threading
-from typing import List, Tuple
+from collections import deque
+from typing import Deque, List, Optional, Tuple
 
 # internal
 from . import EventType
-from .metered_queue import create
+
+DEFAULT_CAPACITY = 2**16
+Event = Tuple[Optional[int], EventType, EventType]
 
 
 class EventQueue:
-    """A queue for storing primitive-data change events."""
+    """
+    A queue for storing primitive-data change events. Events can be enqueued
+    from any thread without locking, and are consumed all at once.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY) -> None:
+        """
+        Construct an empty queue, events are dropped (and counted) while it
+        holds 'capacity' events.
+        """
 
-    def __init__(self) -> None:
-        """Construct an empty queue."""
+        self.capacity = capacity
+        self.events: Deque[Event] = deque()
+        self.dropped: int = 0
 
-        self.queue: Queue = create()
-        self.lock = threading.Lock()
+    def __len__(self) -> int:
+        """Get the number of events currently queued."""
 
-    def enqueue(self, channel: str, prev: EventType, curr: EventType) -> bool:
+        return len(self.events)
+
+    def enqueue(
+        self, chan_id: Optional[int], prev: EventType, curr: EventType
+    ) -> bool:
         """Put an event into the queue."""
 
-        try:
-            self.queue.put_nowait((channel, prev, curr))
-            return True
-        except Full:
+        if len(self.events) >= self.capacity:
+            self.dropped += 1
             return False
 
-    def consume(self) -> List[Tuple[str, EventType, EventType]]:
+        self.events.append((chan_id, prev, curr))
+        return True
+
+    def extend(self, events: List[Event]) -> int:
+        """
+        Put many events into the queue at once, returns the number of events
+        that were enqueued.
+        """
+
+        room = max(self.capacity - len(self.events), 0)
+        if len(events) > room:
+            self.dropped += len(events) - room
+            events = events[:room]
+
+        self.events.extend(events)
+        return len(events)
+
+    def consume(self) -> List[Event]:
         """Get all of the current events in the queue as a list."""
 
-        result = []
-        with self.lock:
-            while not self.queue.empty():
-                result.append(self.queue.get())
-        return result
+        # only the events present now are removed (each removal is atomic),
+        # events enqueued meanwhile are left for the next consumer
+        events = self.events
+        return [events.popleft() for _ in range(len(events))]
@@ -0,0 +1,68 @@
+"""
+vtelem - A bounded cache of compiled frame layouts, keyed by id sequence.
+"""
+
+# built-in
+from collections import OrderedDict
+from struct import Struct
+import threading
+from typing import Any, Hashable, List, NamedTuple, Optional
+
+DEFAULT_LAYOUTS = 128
+
+
+class FrameLayout(NamedTuple):
+    """A compiled description of a frame's element block."""
+
+    ids: List[int]
+    channels: List[Any]
+    codec: Struct
+
+
+class LayoutCache:
+    """
+    A least-recently-used cache of frame layouts, so that frames containing
+    a previously observed sequence of channel identifiers can be decoded
+    with a single (pre-compiled) unpack.
+    """
+
+    def __init__(self, max_layouts: int = DEFAULT_LAYOUTS) -> None:
+        """Construct an empty layout cache."""
+
+        self.max_layouts = max_layouts
+        self.layouts: OrderedDict = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def __len__(self) -> int:
+        """Get the number of cached layouts."""
+
+        return len(self.layouts)
+
+    def get(self, key: Hashable) -> Optional[FrameLayout]:
+        """Look up a layout, marking it as the most recently used."""
+
+        with self.lock:
+            result = self.layouts.get(key)
+            if result is None:
+                self.misses += 1
+            else:
+                self.layouts.move_to_end(key)
+                self.hits += 1
+        return result
+
+    def put(self, key: Hashable, layout: FrameLayout) -> None:
+        """Add a layout, evicting the least recently used if necessary."""
+
+        with self.lock:
+            self.layouts[key] = layout
+            self.layouts.move_to_end(key)
+            while len(self.layouts) > self.max_layouts:
+                self.layouts.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached layouts."""
+
+        with self.lock:
+            self.layouts.clear()
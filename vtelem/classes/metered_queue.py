@@ -3,25 +3,145 @@ vtelem - Allows queues to publish telemetry metrics.
 """
 
 # built-in
+from collections import deque
 from queue import Queue
-from typing import Any
+from typing import Any, Callable, Deque, Hashable, Optional
 
 # internal
 from vtelem.enums.primitive import Primitive
+from vtelem.enums.queue import OverflowPolicy
 
 MAX_SIZE = 256
+QueueKey = Callable[[Any], Optional[Hashable]]
 
 
-class MeteredQueue(Queue):
+class PolicyQueue(Queue):
+    """
+    Extends the standard queue so that putting elements into a full queue
+    can drop elements (or replace queued elements) instead of blocking.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = MAX_SIZE,
+        policy: OverflowPolicy = OverflowPolicy.BLOCK,
+        key: QueueKey = None,
+    ) -> None:
+        """
+        Construct a new queue. When conflating, elements replace a queued
+        element with the same (non-None) key.
+        """
+
+        super().__init__(maxsize)
+        self.policy = policy
+        self.key = key
+        self.dropped: int = 0
+        self.conflated: int = 0
+
+        # keys of queued elements, in queue order
+        self.keys: Deque[Optional[Hashable]] = deque()
+
+    def _put(self, item: Any) -> None:
+        """Add an element (and its key) to the queue."""
+
+        super()._put(item)
+        if self.policy == OverflowPolicy.CONFLATE:
+            self.keys.append(
+                self.key(item)
+                if self.key is not None and item is not None
+                else None
+            )
+
+    def _get(self) -> Any:
+        """Remove an element (and its key) from the queue."""
+
+        if self.policy == OverflowPolicy.CONFLATE:
+            self.keys.popleft()
+        return super()._get()
+
+    def overflowed(self, conflated: bool) -> None:
+        """Can be overridden to handle an element being dropped or replaced."""
+
+    def conflate(self, item: Any) -> bool:
+        """Attempt to replace a queued element with the same key."""
+
+        if self.key is None:
+            return False
+        key = self.key(item)
+        if key is None:
+            return False
+
+        for idx, queued in enumerate(self.keys):
+            if queued == key:
+                self.queue[idx] = item
+                return True
+        return False
+
+    def put(
+        self, item: Any, block: bool = True, timeout: float = None
+    ) -> None:
+        """Enqueue an element, according to this queue's overflow policy."""
+
+        if self.policy == OverflowPolicy.BLOCK:
+            super().put(item, block, timeout)
+            return
+
+        # None is used to signal consumers, so it's never dropped
+        overflow: Optional[bool] = None
+        with self.not_full:
+            full = 0 < self.maxsize <= self._qsize()
+            if (
+                item is not None
+                and self.policy == OverflowPolicy.CONFLATE
+                and self.conflate(item)
+            ):
+                overflow = True
+                self.conflated += 1
+
+            # elements behind a stop signal will never be consumed
+            elif (
+                full
+                and item is not None
+                and (
+                    self.policy == OverflowPolicy.DROP_NEWEST
+                    or self.queue[-1] is None
+                )
+            ):
+                overflow = False
+                self.dropped += 1
+
+            else:
+                # make room by dropping the oldest element
+                if full:
+                    self._get()
+                    self.unfinished_tasks -= 1
+                    overflow = False
+                    self.dropped += 1
+                self._put(item)
+                self.unfinished_tasks += 1
+                self.not_empty.notify()
+
+        if overflow is not None:
+            self.overflowed(overflow)
+
+
+class MeteredQueue(PolicyQueue):
     """
     Extends the standard queue so that metrics can be tracked in a
     telemetry-capable environment.
     """
 
-    def __init__(self, name: str, env: Any, maxsize: int = MAX_SIZE) -> None:
+    def __init__(
+        self,
+        name: str,
+        env: Any,
+        maxsize: int = MAX_SIZE,
+        policy: OverflowPolicy = OverflowPolicy.BLOCK,
+        key: QueueKey = None,
+    ) -> None:
         """Construct a new queue that publishes metrics to an environment."""
 
-        super().__init__(maxsize)
+        super().__init__(maxsize, policy, key)
         self.env = env
         self.name = f"{name}_queue"
         initial = (0, self.env.get_time())
@@ -40,6 +160,14 @@ class MeteredQueue(Queue):
             False,
             initial,
         )
+        if self.policy != OverflowPolicy.BLOCK:
+            self.env.add_metric(
+                f"{self.name}.dropped", Primitive.UINT32, False, initial
+            )
+        if self.policy == OverflowPolicy.CONFLATE:
+            self.env.add_metric(
+                f"{self.name}.conflated", Primitive.UINT32, False, initial
+            )
 
     def get(self, block: bool = True, timeout: float = None) -> Any:
         """Dequeue an element."""
@@ -60,13 +188,27 @@ class MeteredQueue(Queue):
         self.env.metric_add(f"{self.name}.total_enqueued", 1, time)
         super().put(item, block, timeout)
 
+    def overflowed(self, conflated: bool) -> None:
+        """Update metrics when an element is dropped or replaced."""
+
+        time = self.env.get_time()
+        self.env.metric_add(f"{self.name}.elements", -1, time)
+        name = "conflated" if conflated else "dropped"
+        self.env.metric_add(f"{self.name}.{name}", 1, time)
+
 
 def create(
-    name: str = None, env: Any = None, maxsize: int = MAX_SIZE
+    name: str = None,
+    env: Any = None,
+    maxsize: int = MAX_SIZE,
+    policy: OverflowPolicy = OverflowPolicy.BLOCK,
+    key: QueueKey = None,
 ) -> Queue:
     """Create a metered queue or regular queue depending on the arguments."""
 
     if env is None:
-        return Queue(maxsize=maxsize)
+        if policy == OverflowPolicy.BLOCK:
+            return Queue(maxsize=maxsize)
+        return PolicyQueue(maxsize, policy, key)
     assert name is not None
-    return MeteredQueue(name, env, maxsize)
+    return MeteredQueue(name, env, maxsize, policy, key)
@@ -0,0 +1,86 @@
+"""
+vtelem - A buffer for re-assembling frames out of a stream of bytes.
+"""
+
+# built-in
+from struct import Struct
+from typing import Any, Tuple, Union
+
+DEFAULT_COMPACT_THRESHOLD = 64 * 1024
+
+
+class StreamBuffer:
+    """
+    An append-only storage object that bytes are consumed from the front of.
+    Consumed bytes are tracked with an offset (instead of re-allocating the
+    remaining data on every read) and the backing storage is only compacted
+    when enough of it has been consumed.
+    """
+
+    def __init__(
+        self, compact_threshold: int = DEFAULT_COMPACT_THRESHOLD
+    ) -> None:
+        """Construct a new, empty stream buffer."""
+
+        self.compact_threshold = compact_threshold
+        self.data = bytearray()
+        self.pos: int = 0
+
+        # Whether or not views into the backing storage have been handed out,
+        # if so it can't be re-sized (and must be replaced instead).
+        self.exported: bool = False
+
+    def reset(self) -> None:
+        """Discard all buffered data."""
+
+        self.data = bytearray()
+        self.pos = 0
+        self.exported = False
+
+    @property
+    def remaining(self) -> int:
+        """Determine the amount of data that hasn't been consumed yet."""
+
+        return len(self.data) - self.pos
+
+    def compact(self) -> None:
+        """Drop consumed bytes from the front of the backing storage."""
+
+        # Views that were already handed out reference the current storage,
+        # so only the un-consumed bytes are moved to new storage.
+        if self.exported:
+            self.data = self.data[self.pos :]
+            self.exported = False
+        else:
+            del self.data[: self.pos]
+        self.pos = 0
+
+    def append(self, data: Union[bytes, memoryview]) -> int:
+        """Add new bytes to the end of the buffer."""
+
+        # Re-using the existing storage is only possible if it hasn't been
+        # exported, otherwise only the (un-consumed) tail is copied.
+        if self.exported or (
+            self.pos >= self.compact_threshold and self.pos >= self.remaining
+        ):
+            self.compact()
+
+        self.data += data
+        return len(data)
+
+    def unpack(self, codec: Struct) -> Tuple[Any, ...]:
+        """Consume all of the fields of a compiled codec."""
+
+        assert self.remaining >= codec.size
+        result = codec.unpack_from(self.data, self.pos)
+        self.pos += codec.size
+        return result
+
+    def read(self, count: int) -> memoryview:
+        """Consume some number of bytes (without copying them)."""
+
+        assert self.remaining >= count
+        result = memoryview(self.data)[self.pos : self.pos + count]
+        self.pos += count
+        self.exported = True
+        return result
@@ -5,7 +5,8 @@ vtelem - Implements an interface for getting and setting time on an object.
 # built-in
 from contextlib import AbstractContextManager
 from threading import RLock
-from typing import Any, Optional, Type
+import time
+from typing import Any, Callable, Optional, Tuple, Type
 
 from typing_extensions import Literal
 
@@ -55,28 +56,124 @@ class LockEntity:  # pylint: disable=too-few-public-methods
             self.lock: OptionalRLock = OptionalRLock(make_lock)
 
 
+class SharedClock(LockEntity):
+    """
+    A clock that computes (scaled) time on demand from a monotonic source, so
+    that any number of entities can read the current time without it being
+    pushed to them.
+    """
+
+    def __init__(
+        self,
+        init_time: float = None,
+        scalar: float = 1.0,
+        time_ns_fn: Callable[[], int] = None,
+    ) -> None:
+        """
+        Construct a new clock that starts at the provided time (or the current
+        wall-clock time).
+        """
+
+        super().__init__()
+        if init_time is None:
+            init_time = time.time()
+        if time_ns_fn is None:
+            time_ns_fn = time.monotonic_ns
+        self.time_ns_fn = time_ns_fn
+
+        # (time, source reading at that time, scalar) is replaced as a whole
+        # so that it can be read without locking
+        assert scalar >= 0.0
+        self.basis: Tuple[float, int, float] = (
+            init_time,
+            self.time_ns_fn(),
+            scalar,
+        )
+
+    @property
+    def scalar(self) -> float:
+        """Get this clock's current time scaling."""
+
+        return self.basis[2]
+
+    def get_time(self) -> float:
+        """Return the current time."""
+
+        start, reference, scalar = self.basis
+        return start + (self.time_ns_fn() - reference) * scalar / 1e9
+
+    def set_time(self, time_val: float) -> None:
+        """Set the current time."""
+
+        with self.lock:
+            self.basis = (time_val, self.time_ns_fn(), self.basis[2])
+
+    def advance_time(self, amount: float) -> None:
+        """Advance the current time by a specified amount."""
+
+        with self.lock:
+            self.set_time(self.get_time() + amount)
+
+    def scale(self, scalar: float) -> None:
+        """Change the time scaling, from the current time onwards."""
+
+        assert scalar >= 0.0
+        with self.lock:
+            reference = self.time_ns_fn()
+            start, prev_reference, prev_scalar = self.basis
+            start += (reference - prev_reference) * prev_scalar / 1e9
+            self.basis = (start, reference, scalar)
+
+
 class TimeEntity(LockEntity):
-    """A simple class for adding time-keeping to a parent."""
+    """
+    A simple class for adding time-keeping to a parent. Time is read from a
+    shared clock while one is attached.
+    """
 
     def __init__(self, init_time: float = None) -> None:
         """Construct a new time entity."""
 
         super().__init__()
         self.time: float = init_time if init_time is not None else float()
+        self.clock: Optional[SharedClock] = None
+
+    def attach_clock(self, clock: Optional[SharedClock]) -> None:
+        """Read time from a shared clock (or stop, if it's None)."""
+
+        with self.lock:
+            if clock is None and self.clock is not None:
+                self.time = self.clock.get_time()
+            self.clock = clock
 
     def advance_time(self, amount: float) -> None:
-        """Advance this entity's time by a specified amount."""
+        """
+        Advance this entity's time by a specified amount (that of its clock,
+        and every other entity reading it, while one is attached).
+        """
 
         with self.lock:
-            self.time += amount
+            if self.clock is not None:
+                self.clock.advance_time(amount)
+            else:
+                self.time += amount
 
-    def set_time(self, time: float) -> None:
-        """Set this entity's current time."""
+    def set_time(self, time_val: float) -> None:
+        """
+        Set this entity's current time (that of its clock, and every other
+        entity reading it, while one is attached).
+        """
 
         with self.lock:
-            self.time = time
+            if self.clock is not None:
+                self.clock.set_time(time_val)
+            else:
+                self.time = time_val
 
     def get_time(self) -> float:
         """Return this entity's current time."""
 
+        clock = self.clock
+        if clock is not None:
+            return clock.get_time()
         return self.time
@@ -7,12 +7,26 @@ import time
 from typing import Any, Callable, List
 
 # internal
+from vtelem.classes.time_entity import SharedClock
 from vtelem.daemon.synchronous import Daemon
 
 
+def time_ns_source(time_fn: Callable[[], float]) -> Callable[[], int]:
+    """Create a source of nanoseconds from a source of seconds."""
+
+    def time_ns() -> int:
+        """Get the current time in nanoseconds."""
+
+        return int(time_fn() * 1e9)
+
+    return time_ns
+
+
 class TimeKeeper(Daemon):
     """
     A class for managing a notion of time for an arbitrary number of slaves.
+    Slaves read time from a shared clock on demand, so time isn't quantized
+    to this daemon's rate (and nothing is pushed to slaves while it runs).
     """
 
     def __init__(
@@ -25,53 +39,47 @@ class TimeKeeper(Daemon):
     ):
         """Construct a new time keeper."""
 
+        # the clock advances with the provided time source, by default it
+        # starts at the wall-clock time and advances monotonically
+        time_ns_fn = None
         if time_fn is None:
             time_fn = time.time
+        else:
+            time_ns_fn = time_ns_source(time_fn)
         if sleep_fn is None:
             sleep_fn = time.sleep
 
         self.time_function = time_fn
         self.sleep_function = sleep_fn
-        self.scalar = real_scalar
-        assert self.scalar >= 0.0
-        self.time = self.time_function()
-        self.last_time_eval = self.time
+        self.shared_clock = SharedClock(
+            self.time_function(), real_scalar, time_ns_fn
+        )
         super().__init__(name, self.iteration, rate)
-        self.time = self.last_time_eval
+        self.attach_clock(self.shared_clock)
         self.function["sleep"] = self.sleep_function
         self.slaves: List[Any] = []
 
-    def iteration(self, *_, **__) -> None:
-        """On every iteration, advance time for all slaves."""
+    @property
+    def scalar(self) -> float:
+        """Get the current time scaling."""
 
-        with self.lock:
-            curr = self.time_function()
-            self.advance_time((curr - self.last_time_eval) * self.scalar)
-            self.last_time_eval = curr
+        return self.shared_clock.scalar
 
-        self.set_slaves()
+    def iteration(self, *_, **__) -> None:
+        """Time is computed when it's read, there's nothing to do."""
 
     def add_slave(self, slave: Any) -> None:
         """Add a new slave under this keeper's management."""
 
         with self.lock:
-            slave.set_time(self.get_time())
+            slave.attach_clock(self.shared_clock)
             self.slaves.append(slave)
 
-    def set_slaves(self) -> None:
-        """Set slave time."""
-
-        with self.lock:
-            curr_time = self.get_time()
-            for slave in self.slaves:
-                slave.set_time(curr_time)
-
     def scale(self, scalar: float) -> None:
         """Change the current time scaling."""
 
         if scalar >= 0.0:
-            with self.lock:
-                self.scalar = scalar
+            self.shared_clock.scale(scalar)
 
     def sleep(self, amount: float) -> None:
         """Sleep for the specified amount, scaled appropriately."""
@@ -4,10 +4,10 @@ vtelem - A generic element that can be read from and written to buffers.
 
 # built-in
 import logging
-import struct
-from typing import Callable, Tuple
+from typing import Any, Callable, List, Sequence, Tuple
 
 # internal
+from vtelem.classes.codec import DEFAULT_ORDER, get_codec
 from vtelem.enums.primitive import (
     Primitive,
     PrimitiveValue,
@@ -126,10 +126,10 @@ class TypePrimitive:
         self.data = result
         return result
 
-    def buffer(self, order: str = "!") -> bytes:
+    def buffer(self, order: str = DEFAULT_ORDER) -> bytes:
         """Get this primitive as a buffer of bytes."""
 
-        return struct.pack(order + self.type.value.fmt, self.data)
+        return get_codec(self.type, order).pack(self.data)
 
 
 def new_default(
@@ -139,3 +139,24 @@ def new_default(
 
     assert default in DEFAULTS
     return TypePrimitive(DEFAULTS[default], changed_cb)
+
+
+def invalid_values(instance: Primitive, values: Sequence[Any]) -> List[int]:
+    """
+    Find the positions of values that can't be assigned to a primitive type.
+    Integer bounds are checked for the whole batch at once, individual values
+    are only validated if that fails.
+    """
+
+    prim = instance.value
+    if all(isinstance(value, prim.type) for value in values):
+        if not values or (prim.min == 0 and prim.max == 0):
+            return []
+        if prim.min <= min(values) and max(values) <= prim.max:
+            return []
+
+    return [
+        idx
+        for idx, value in enumerate(values)
+        if not isinstance(value, prim.type) or not prim.validate(prim, value)
+    ]
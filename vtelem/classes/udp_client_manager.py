@@ -5,10 +5,19 @@ vtelem - An interface for setting up and tearing down outgoing udp streams.
 # built-in
 import logging
 import socket
-from typing import Any, Dict, List, Tuple, cast
+from typing import Dict, List, Tuple
 
 # internal
-from vtelem.mtu import Host, create_udp_socket, discover_mtu
+from vtelem.mtu import (
+    DEFAULT_MULTICAST_TTL,
+    Host,
+    create_multicast_socket,
+    create_udp_socket,
+    discover_mtu,
+    host_resolve_zero,
+    socket_mtu,
+)
+from vtelem.stream.datagram import DatagramSender
 from vtelem.stream.writer import StreamWriter
 
 from .time_entity import LockEntity
@@ -21,62 +30,36 @@ class UdpClientManager(LockEntity):
 
     def __init__(self, writer: StreamWriter) -> None:
         """
-        Construct a new client manager, which will produce streams to the
-        provided stream-writer.
+        Construct a new client manager, which will send datagrams of frames
+        produced by the provided stream-writer.
         """
 
         super().__init__()
         self.writer = writer
-
-        self.clients: Dict[int, Tuple[socket.SocketType, Any]] = {}
-        self.stream_ids: Dict[int, int] = {}
-
-        assert self.writer.error_handle is None
-
-        def closer(stream_id: int) -> None:
-            """
-            Close a client socket, based on its stream-writer stream
-            identifier.
-            """
-
-            with self.lock:
-                sock, sock_file = self.clients[stream_id]
-                del self.clients[stream_id]
-            name = sock.getsockname()
-            LOG.info("closing stream client '%s:%d'", name[0], name[1])
-            try:
-                sock_file.close()
-            except ConnectionRefusedError:  # pragma: no cover
-                pass
-            finally:
-                sock.close()
-
-        self.closer = closer
-        self.writer.error_handle = self.closer
+        self.sender = DatagramSender(f"{writer.name}.udp", writer)
+        self.clients: Dict[int, socket.SocketType] = {}
 
     def client_name(self, sock_id: int) -> Host:
         """Get the host and port of a client."""
 
         assert sock_id in self.clients
-        return Host(*self.clients[sock_id][0].getsockname())
+        return Host(*self.clients[sock_id].getsockname())
 
     def add_clients(self, hosts: List[Host]) -> Dict[Host, Tuple[int, int]]:
         """Add multiple clients at once."""
 
         return {host: self.add_client(host) for host in hosts}
 
-    def add_client(self, host: Host, flush: bool = False) -> Tuple[int, int]:
-        """Add a new client connection by hostname and port."""
+    def add_socket(
+        self, sock: socket.SocketType, host: Host, mtu: int
+    ) -> Tuple[int, int]:
+        """Start sending frames to a socket connected to a host."""
 
-        sock = create_udp_socket(host)
-        mtu = discover_mtu(sock)
         mtu -= 60 + 8  # subtract ip and udp header space
-        sock_file = cast(socket.socket, sock).makefile("wb")
-        sock_file.flush()
 
         with self.lock:
-            sock_id = self.writer.add_stream(sock_file, flush=flush)
-            self.clients[sock_id] = (sock, sock_file)
+            sock_id = self.sender.add_socket(sock)
+            self.clients[sock_id] = sock
 
         name = sock.getsockname()
         LOG.info(
@@ -88,6 +71,39 @@ class UdpClientManager(LockEntity):
         )
         return sock_id, mtu
 
+    def add_client(self, host: Host, flush: bool = False) -> Tuple[int, int]:
+        """
+        Add a new client connection by hostname and port. Every frame is sent
+        as its own datagram as soon as it's written, so there's never any
+        buffered data to flush.
+        """
+
+        del flush
+        sock = create_udp_socket(host)
+        return self.add_socket(sock, host, discover_mtu(sock))
+
+    def add_multicast(
+        self,
+        group: Host,
+        ttl: int = DEFAULT_MULTICAST_TTL,
+        interface_ip: str = None,
+    ) -> Tuple[int, int]:
+        """
+        Send frames to a multicast group, so that any number of clients that
+        join it are served by a single datagram per frame.
+        """
+
+        # an mtu probe would be delivered to every member of the group
+        group = host_resolve_zero(socket.SOCK_DGRAM, group)
+        sock = create_multicast_socket(group, ttl, interface_ip)
+        return self.add_socket(sock, group, socket_mtu(sock))
+
+    def close(self) -> None:
+        """Remove all active clients and stop sending datagrams."""
+
+        self.remove_all()
+        self.sender.close()
+
     def remove_all(self) -> None:
         """Remove all active clients."""
 
@@ -99,5 +115,11 @@ class UdpClientManager(LockEntity):
         """Remove a client connection by integer identifier, closes it."""
 
         with self.lock:
-            if self.writer.remove_stream(sock_id):
-                self.closer(sock_id)
+            sock = self.clients.pop(sock_id, None)
+            if sock is None:
+                return
+            self.sender.remove_socket(sock_id)
+
+        name = sock.getsockname()
+        LOG.info("closing stream client '%s:%d'", name[0], name[1])
+        sock.close()
@@ -5,11 +5,12 @@ vtelem - A module exposing a common interface for telemetry clients.
 # built-in
 import logging
 from queue import Queue
-from typing import List
+from typing import Optional, Sequence
 
 # internal
 from vtelem.channel.registry import ChannelRegistry
 from vtelem.classes.type_primitive import TypePrimitive
+from vtelem.client.columnar import DEFAULT_CAPACITY, ColumnStore
 from vtelem.frame.processor import FrameProcessor
 from vtelem.mtu import DEFAULT_MTU
 from vtelem.parsing.encapsulation import decode_frame
@@ -36,6 +37,17 @@ class TelemetryClient:
         self.frames = output_stream
         self.expected_id = app_id
         self.processor = FrameProcessor()
+        self.columns: Optional[ColumnStore] = None
+
+    def enable_columns(self, capacity: int = DEFAULT_CAPACITY) -> ColumnStore:
+        """
+        Decode data and event frames directly into per-channel columns
+        (instead of publishing parsed frames to the output stream).
+        """
+
+        if self.columns is None:
+            self.columns = ColumnStore(self.channel_registry, capacity)
+        return self.columns
 
     def update_mtu(self, new_mtu: int) -> None:
         """
@@ -46,7 +58,7 @@ class TelemetryClient:
         self.mtu = new_mtu
         LOG.info("%s: mtu set to %d", self.name, new_mtu)
 
-    def handle_frames(self, new_frames: List[bytes]) -> int:
+    def handle_frames(self, new_frames: Sequence[memoryview]) -> int:
         """
         Attempt to decode any new frames and publish them to the upstream
         consumer.
@@ -56,6 +68,12 @@ class TelemetryClient:
 
         count = 0
         for frame in new_frames:
+            if self.columns is not None:
+                status = self.columns.ingest(frame, self.expected_id)
+                if status is not None:
+                    count += int(status)
+                    continue
+
             new_frame = decode_frame(
                 self.channel_registry,
                 frame,
@@ -0,0 +1,203 @@
+"""
+vtelem - Storage for decoded channel data as per-channel (NumPy) columns.
+"""
+
+# built-in
+import logging
+import threading
+from typing import Any, Dict, List, Optional, Tuple, Union, cast
+
+# internal
+from vtelem.channel import Channel
+from vtelem.channel.registry import ChannelRegistry
+from vtelem.classes.byte_buffer import ByteBuffer, crc
+from vtelem.classes.codec import FRAME_FOOTER
+from vtelem.classes.type_primitive import TypePrimitive
+from vtelem.enums.primitive import get_fstring
+from vtelem.parsing.encapsulation import (
+    parse_frame_footer,
+    parse_frame_header,
+)
+from vtelem.parsing.frames import data_element, event_element, get_layout
+from vtelem.types.frame import FrameType
+
+LOG = logging.getLogger(__name__)
+DEFAULT_CAPACITY = 1024
+
+
+def numpy() -> Any:
+    """
+    Import NumPy (an optional dependency) only once columnar storage is
+    actually used.
+    """
+
+    try:
+        import numpy as np  # pylint:disable=import-outside-toplevel
+    except ImportError as exc:
+        raise ImportError("columnar decoding requires 'numpy'") from exc
+    return np
+
+
+class Column:
+    """A growable time series of values for a single channel."""
+
+    def __init__(
+        self, channel: Channel, capacity: int = DEFAULT_CAPACITY
+    ) -> None:
+        """Construct an empty column for a channel."""
+
+        np = numpy()
+        self.channel = channel
+        self.size: int = 0
+        self.times = np.empty(capacity, dtype=np.uint64)
+        self.values = np.empty(
+            capacity, dtype=np.dtype(get_fstring(channel.type))
+        )
+
+    def grow(self) -> None:
+        """Double the capacity of this column."""
+
+        np = numpy()
+        capacity = 2 * len(self.times)
+        times = np.empty(capacity, dtype=self.times.dtype)
+        values = np.empty(capacity, dtype=self.values.dtype)
+        times[: self.size] = self.times[: self.size]
+        values[: self.size] = self.values[: self.size]
+        self.times = times
+        self.values = values
+
+    def append(self, time: int, value: Any) -> None:
+        """Add a sample to the end of this column."""
+
+        if self.size == len(self.times):
+            self.grow()
+        self.times[self.size] = time
+        self.values[self.size] = value
+        self.size += 1
+
+    def get(self) -> Tuple[Any, Any]:
+        """Get views of the timestamp and value arrays for this column."""
+
+        return self.times[: self.size], self.values[: self.size]
+
+
+class ColumnStore:
+    """
+    Storage for data and event frames decoded directly into per-channel
+    columns, instead of into parsed frames.
+    """
+
+    def __init__(
+        self,
+        channel_registry: ChannelRegistry,
+        capacity: int = DEFAULT_CAPACITY,
+    ) -> None:
+        """Construct a new, empty column store."""
+
+        # fail early if the optional dependency isn't available
+        numpy()
+
+        self.channel_registry = channel_registry
+        self.capacity = capacity
+        self.columns: Dict[int, Column] = {}
+        self.lock = threading.Lock()
+
+    def column(self, chan_id: int, channel: Channel) -> Column:
+        """Get a channel's column, creating it if necessary."""
+
+        result = self.columns.get(chan_id)
+        if result is None:
+            result = Column(channel, self.capacity)
+            self.columns[chan_id] = result
+        return result
+
+    def ingest(
+        self,
+        data: Union[bytes, memoryview],
+        expected_id: Optional[TypePrimitive] = None,
+    ) -> Optional[bool]:
+        """
+        Decode a frame into columns. Returns None if the frame isn't a data
+        or event frame (so it should be decoded normally), otherwise whether
+        or not the frame was valid.
+        """
+
+        buf = ByteBuffer(cast(bytearray, data), False, len(data))
+        app_id, header = parse_frame_header(buf, expected_id)
+        if header is None:
+            assert expected_id is not None
+            LOG.error("id mismatch: %d != %d", app_id, expected_id.get())
+            return False
+
+        if header.type == FrameType.DATA:
+            element = data_element
+        elif header.type == FrameType.EVENT:
+            element = event_element
+        else:
+            return None
+
+        layout = get_layout(header, buf, self.channel_registry, element)
+        values = buf.unpack(layout.codec)
+
+        footer = parse_frame_footer(buf)
+        if footer.crc is not None:
+            expected = crc(
+                cast(bytes, data), buf.get_pos() - FRAME_FOOTER.size
+            )
+            if footer.crc != expected:
+                LOG.error(
+                    "invalid crc on frame: %d != %d", footer.crc, expected
+                )
+                return False
+
+        with self.lock:
+            if header.type == FrameType.DATA:
+                for chan_id, channel, value in zip(
+                    layout.ids, layout.channels, values
+                ):
+                    self.column(chan_id, channel).append(
+                        header.timestamp, value
+                    )
+            else:
+                # only the current value (and its time) of each event is
+                # stored
+                for idx, (chan_id, channel) in enumerate(
+                    zip(layout.ids, layout.channels)
+                ):
+                    self.column(chan_id, channel).append(
+                        values[idx * 4 + 3], values[idx * 4 + 2]
+                    )
+
+        return True
+
+    def resolve(self, chan: Union[int, str]) -> Optional[int]:
+        """Resolve a channel name (or identifier) to an identifier."""
+
+        if isinstance(chan, str):
+            return self.channel_registry.get_id(chan)
+        return chan
+
+    def get(self, chan: Union[int, str]) -> Optional[Tuple[Any, Any]]:
+        """
+        Get the timestamp and value arrays for a channel (by name or
+        identifier), if any values have been stored for it.
+        """
+
+        chan_id = self.resolve(chan)
+        with self.lock:
+            column = self.columns.get(cast(int, chan_id))
+            result = column.get() if column is not None else None
+        return result
+
+    def channels(self) -> List[str]:
+        """Get the names of all channels that have stored values."""
+
+        with self.lock:
+            result = [column.channel.name for column in self.columns.values()]
+        return result
+
+    def clear(self) -> None:
+        """Remove all stored values."""
+
+        with self.lock:
+            self.columns = {}
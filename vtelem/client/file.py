@@ -6,6 +6,8 @@ vtelem - A daemon that provides decoded telemetry frames into a queue, from a
 # built-in
 from contextlib import contextmanager
 import logging
+import mmap
+import os
 from pathlib import Path
 from queue import Queue
 from tempfile import NamedTemporaryFile
@@ -13,15 +15,20 @@ from typing import Iterator, List, NamedTuple, Optional, Tuple
 
 # internal
 from vtelem.channel.registry import ChannelRegistry
+from vtelem.classes.codec import FRAME_SIZE
 from vtelem.classes.type_primitive import TypePrimitive, new_default
 from vtelem.client import TelemetryClient
 from vtelem.daemon import DaemonBase, DaemonState
+from vtelem.frame.processor import FrameProcessor, walk_frames
 from vtelem.mtu import DEFAULT_MTU
+from vtelem.stream.index import FrameIndex, index_path
 from vtelem.stream.writer import StreamWriter
 from vtelem.telemetry.environment import TelemetryEnvironment
 
 LOG = logging.getLogger(__name__)
 TELEM_SUFFIX = ".vtelem"
+MAPPED_BATCH = 256
+DEFAULT_POLL = 0.1
 
 
 class FileDecodeTask(NamedTuple):
@@ -31,6 +38,56 @@ class FileDecodeTask(NamedTuple):
     byte_index: int = 0
     max_frames: Optional[int] = None
 
+    # resolved (with the recording's index) to a byte index when the task
+    # is run
+    start_frame: Optional[int] = None
+    time_range: Optional[Tuple[Optional[float], Optional[float]]] = None
+
+    # decode frames in place from a memory-mapped file, optionally waiting
+    # for new frames (instead of stopping) at the end of the file
+    mapped: bool = False
+    follow: bool = False
+    poll_interval: float = DEFAULT_POLL
+
+
+def resolve_task(task: FileDecodeTask) -> FileDecodeTask:
+    """
+    Use a recording's index to resolve a starting frame or time range into
+    a byte index and a maximum number of frames.
+    """
+
+    index = FrameIndex.get(task.path)
+    assert index is not None
+
+    first, last = 0, len(index)
+    if task.time_range is not None:
+        first, last = index.frame_range(*task.time_range)
+    if task.start_frame is not None:
+        first = max(first, task.start_frame)
+    last = max(first, last)
+
+    max_frames = last - first
+    if task.max_frames is not None:
+        max_frames = min(max_frames, task.max_frames)
+
+    byte_index = 0
+    if first < len(index):
+        byte_index = index.offsets[first]
+
+    LOG.info(
+        "%s: decoding frames %d - %d (byte index %d)",
+        task.path.name,
+        first,
+        first + max_frames,
+        byte_index,
+    )
+    return task._replace(
+        byte_index=byte_index,
+        max_frames=max_frames,
+        start_frame=None,
+        time_range=None,
+    )
+
 
 class FileClient(DaemonBase, TelemetryClient):
     """A class for decoding telemetry frames found in files."""
@@ -52,7 +109,7 @@ class FileClient(DaemonBase, TelemetryClient):
         DaemonBase.__init__(self, task.path.name, env)
         self.task = task
         self.frame_count: int = 0
-        self.to_process: List[bytes] = []
+        self.to_process: List[memoryview] = []
 
     def process_raw_frames(self, task: FileDecodeTask) -> bool:
         """
@@ -70,7 +127,8 @@ class FileClient(DaemonBase, TelemetryClient):
 
         # Consume the desired number of payloads from our process list.
         if process_count:
-            to_process = [self.to_process.pop(0) for _ in range(process_count)]
+            to_process = self.to_process[:process_count]
+            del self.to_process[:process_count]
             self.frame_count += self.handle_frames(to_process)
 
         # Determine if we've reached the limit of desired frames, if one was
@@ -91,6 +149,20 @@ class FileClient(DaemonBase, TelemetryClient):
     def run(self, *_, **__) -> None:
         """Read from the file and enqueue decoded frames."""
 
+        # Seek to a specific frame (or time) in the recording, if requested.
+        if (
+            self.task.start_frame is not None
+            or self.task.time_range is not None
+        ):
+            self.task = resolve_task(self.task)
+            self.frame_count = 0
+            self.to_process = []
+            self.processor = FrameProcessor()
+
+        if self.task.mapped or self.task.follow:
+            self.run_mapped()
+            return
+
         with self.task.path.open("rb") as stream:
             stream.seek(self.task.byte_index)
 
@@ -118,9 +190,70 @@ class FileClient(DaemonBase, TelemetryClient):
                     pass
 
             # Update the byte index.
-            self.task = FileDecodeTask(
-                self.task.path, stream.tell(), self.task.max_frames
-            )
+            self.task = self.task._replace(byte_index=stream.tell())
+
+    def frames_wanted(self) -> int:
+        """
+        Determine how many frames can be staged for processing at once
+        (without exceeding the maximum requested).
+        """
+
+        result = MAPPED_BATCH
+        if self.task.max_frames is not None:
+            result = min(result, self.task.max_frames - self.frame_count)
+        return result
+
+    def run_mapped(self) -> None:
+        """
+        Decode frames in place from a memory-mapped file, optionally
+        following the file (as it's written) until stopped.
+        """
+
+        offset = self.task.byte_index
+        keep_reading = True
+
+        with self.task.path.open("rb") as stream:
+            while keep_reading and self.state != DaemonState.STOPPING:
+                size = os.fstat(stream.fileno()).st_size
+                found = 0
+
+                # The mapping is released once all views into it (handed out
+                # for decoding) are released.
+                if size > offset:
+                    data = memoryview(
+                        mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+                    )
+                    for frame, offset in walk_frames(data, offset, self.mtu):
+                        self.to_process.append(frame)
+                        found += 1
+                        if len(self.to_process) >= self.frames_wanted():
+                            keep_reading = self.process_raw_frames(self.task)
+                            if (
+                                not keep_reading
+                                or self.state == DaemonState.STOPPING
+                            ):
+                                break
+                    keep_reading = self.process_raw_frames(self.task)
+
+                if not found and keep_reading:
+                    # Any complete frame fits within the mtu, if there's
+                    # enough data but no frame then it can't be decoded.
+                    corrupt = size - offset >= self.mtu + FRAME_SIZE.size
+                    if corrupt:
+                        LOG.error("%s: invalid frame at %d", self.name, offset)
+
+                    if corrupt or not self.task.follow:
+                        LOG.info("%s: reached end-of-file", self.name)
+                        self.frames.put(None)
+                        break
+                    self.function["sleep"](self.task.poll_interval)
+
+        # Signal the end of frames if we stopped following the file.
+        if self.task.follow and self.state == DaemonState.STOPPING:
+            self.frames.put(None)
+
+        # Update the byte index.
+        self.task = self.task._replace(byte_index=offset)
 
 
 @contextmanager
@@ -129,6 +262,7 @@ def create(
     env: TelemetryEnvironment,
     mtu: int = DEFAULT_MTU,
     max_frames: int = None,
+    index: bool = False,
 ) -> Iterator[Tuple[FileClient, Queue]]:
     """
     Using a temporary file, create a file-client and register the file to the
@@ -142,5 +276,10 @@ def create(
         client = FileClient(
             task, queue, env.channel_registry, env.app_id, env, mtu
         )
-        with writer.add_file(path, flush=True):
-            yield client, queue
+        try:
+            with writer.add_file(path, flush=True, index=index):
+                yield client, queue
+        finally:
+            sidecar = index_path(path)
+            if sidecar.is_file():
+                sidecar.unlink()
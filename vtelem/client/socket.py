@@ -6,18 +6,20 @@ vtelem - A daemon that provides decoded telemetry frames into a queue, from a
 # built-in
 import logging
 from queue import Queue
-from socket import SocketType, timeout
-from typing import Callable
+from socket import MSG_DONTWAIT, SOCK_DGRAM, SocketType, timeout
+from typing import Callable, List
 
 # internal
 from vtelem.channel.registry import ChannelRegistry
 from vtelem.classes.type_primitive import TypePrimitive, new_default
 from vtelem.client import TelemetryClient
 from vtelem.daemon import DaemonBase, DaemonState
+from vtelem.frame.processor import walk_frames
 from vtelem.mtu import DEFAULT_MTU
 from vtelem.telemetry.environment import TelemetryEnvironment
 
 LOG = logging.getLogger(__name__)
+DEFAULT_BATCH = 32
 
 
 class SocketClient(DaemonBase, TelemetryClient):
@@ -34,10 +36,17 @@ class SocketClient(DaemonBase, TelemetryClient):
         app_id: TypePrimitive = None,
         env: TelemetryEnvironment = None,
         mtu: int = DEFAULT_MTU,
+        *,
+        batch: int = DEFAULT_BATCH,
     ) -> None:
-        """Construct a new socket client."""
+        """
+        Construct a new socket client. Received data is stored in a buffer
+        that can hold 'batch' maximum-size frames.
+        """
 
         self.socket = sock
+        self.batch = batch
+        self.buffer = memoryview(bytearray())
         TelemetryClient.__init__(
             self, "", output_stream, channel_registry, app_id, mtu
         )
@@ -77,6 +86,73 @@ class SocketClient(DaemonBase, TelemetryClient):
 
         self.function["close"]()
 
+    def receive_buffer(self, frame_max: int) -> memoryview:
+        """
+        Get storage for received data that can hold a batch of datagrams (of
+        at most 'frame_max' bytes each), it's only re-allocated if the mtu
+        grows.
+        """
+
+        size = frame_max * self.batch
+        if len(self.buffer) < size:
+            self.buffer = memoryview(bytearray(size))
+        return self.buffer
+
+    def receive_datagrams(self, frame_max: int) -> bool:
+        """
+        Wait for a datagram, then receive any others that are already pending
+        (without blocking) and decode all of their frames as one batch.
+        Returns False if the stream has ended.
+        """
+
+        buffer = self.receive_buffer(frame_max)
+        size = self.socket.recv_into(buffer, frame_max)
+        if not size:
+            return False
+
+        ends = [size]
+        offset = size
+        while offset + frame_max <= len(buffer):
+            try:
+                size = self.socket.recv_into(
+                    buffer[offset:], frame_max, MSG_DONTWAIT
+                )
+            except BlockingIOError:
+                break
+            if not size:
+                break
+            offset += size
+            ends.append(offset)
+
+        # each datagram holds complete frames, they're decoded directly out
+        # of the receive buffer
+        frames: List[memoryview] = []
+        start = 0
+        for end in ends:
+            frames.extend(
+                frame
+                for frame, _ in walk_frames(buffer[:end], start, self.mtu)
+            )
+            start = end
+        self.handle_frames(frames)
+        return bool(size)
+
+    def receive_stream(
+        self, frame_max: int, frame_size: TypePrimitive
+    ) -> bool:
+        """
+        Receive and decode some bytes from a stream. Returns False if the
+        stream has ended.
+        """
+
+        buffer = self.receive_buffer(frame_max)
+        size = self.socket.recv_into(buffer)
+        if size:
+            self.handle_frames(
+                self.processor.process(buffer[:size], frame_size, self.mtu)
+            )
+        return bool(size)
+
     def run(self, *_, **__) -> None:
         """Read from the listener and enqueue decoded frames."""
 
@@ -87,18 +163,18 @@ class SocketClient(DaemonBase, TelemetryClient):
 
         frame_size = new_default("count")
         assert self.env is not None
+        datagram = self.socket.type == SOCK_DGRAM
 
         while self.state != DaemonState.STOPPING:
+            frame_max = self.mtu + frame_size.type.value.size
             try:
-                raw_data = self.socket.recv(
-                    self.mtu + frame_size.type.value.size
-                )
-                if not raw_data:
+                if datagram:
+                    receiving = self.receive_datagrams(frame_max)
+                else:
+                    receiving = self.receive_stream(frame_max, frame_size)
+                if not receiving:
                     LOG.info("%s: stream ended", self.name)
                     break
-                self.handle_frames(
-                    self.processor.process(raw_data, frame_size, self.mtu)
-                )
             except timeout:
                 pass
             except OSError as exc:
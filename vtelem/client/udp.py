@@ -20,6 +20,7 @@ from vtelem.mtu import (
     create_udp_socket,
     get_free_port,
     host_resolve_zero,
+    join_multicast_socket,
 )
 from vtelem.telemetry.environment import TelemetryEnvironment
 
@@ -38,17 +39,40 @@ class UdpClient(SocketClient):
         app_id: TypePrimitive = None,
         env: TelemetryEnvironment = None,
         mtu: int = DEFAULT_MTU,
+        *,
+        multicast: bool = False,
     ) -> None:
-        """Construct a new udp client."""
+        """
+        Construct a new udp client, optionally one that joins the multicast
+        group at the provided host.
+        """
 
         host = host_resolve_zero(socket.SOCK_DGRAM, host)
-        sock = create_udp_socket(host, False)
+
+        def open_socket() -> socket.SocketType:
+            """Create a socket that receives datagrams sent to the host."""
+
+            if multicast:
+                return join_multicast_socket(host)
+            return create_udp_socket(host, False)
+
+        sock = open_socket()
 
         def stop_server() -> None:
             """
             Close this listener by sending a final, zero-length payload to
             un-block recv, then closing the socket.
             """
+
+            # a payload sent to the group would stop every member, shutting
+            # down the socket un-blocks recv instead
+            if multicast:
+                try:
+                    self.socket.shutdown(socket.SHUT_RD)
+                except OSError:
+                    pass
+                return
+
             self.socket.sendto(bytearray(), self.socket.getsockname())
 
         super().__init__(
@@ -68,7 +92,7 @@ class UdpClient(SocketClient):
 
             result = curr_sock
             if result.fileno() == -1:
-                result = create_udp_socket(host, False)
+                result = open_socket()
             return result
 
         self.function["init"] = bind
@@ -89,7 +113,7 @@ def create(
     )
     queue = manager.writer.get_queue()
     client = UdpClient(host, queue, env.channel_registry, env.app_id, env, mtu)
-    client_id, new_mtu = manager.add_client(host, True)
+    client_id, new_mtu = manager.add_client(host)
     client.update_mtu(new_mtu)
     try:
         yield client, queue
@@ -4,7 +4,8 @@ vtelem - A daemon that provides decoded telemetry frames into a queue, from a
 """
 
 # built-in
-from asyncio import Task, ensure_future
+from asyncio import Task, ensure_future, run_coroutine_threadsafe
+from concurrent.futures import TimeoutError as FutureTimeout
 import logging
 from queue import Queue
 from typing import Any, Optional
@@ -13,6 +14,7 @@ from typing import Any, Optional
 import websockets
 
 # internal
+from vtelem import DEFAULT_TIMEOUT
 from vtelem.channel.registry import ChannelRegistry
 from vtelem.classes.type_primitive import TypePrimitive, new_default
 from vtelem.client import TelemetryClient
@@ -51,21 +53,7 @@ class WebsocketClient(EventLoopDaemon, TelemetryClient):
         )
         self.connected: bool = False
         self.task: Optional[Task] = None
-
-        async def connection_handle(websocket, _) -> None:
-            """Handle a websocket-client connection."""
-
-            frame_size = new_default("count")
-            assert self.env is not None
-            try:
-                while self.state != DaemonState.STOPPING:
-                    self.handle_frames(
-                        self.processor.process(
-                            await websocket.recv(), frame_size, self.mtu
-                        )
-                    )
-            except websockets.exceptions.WebSocketException as exc:
-                LOG.error("Exception while awaiting frames: %s.", exc)
+        self.websocket: Any = None
 
         async def connect() -> None:
             """Establish a connection and wait for the handler to complete."""
@@ -80,8 +68,10 @@ class WebsocketClient(EventLoopDaemon, TelemetryClient):
                 async with websockets.connect(  # type: ignore
                     uri, close_timeout=1
                 ) as websocket:
-                    await connection_handle(websocket, uri_path)
+                    self.websocket = websocket
+                    await self.handle_connection(websocket)
             finally:
+                self.websocket = None
                 self.wait_poster.release()
                 self.connected = False
 
@@ -95,3 +85,42 @@ class WebsocketClient(EventLoopDaemon, TelemetryClient):
                 ensure_future(connect(), loop=self.eloop)
 
         self.function["run_init"] = run_init
+        stopper = self.function["inject_stop"]
+
+        def inject_stop() -> None:
+            """
+            Close the connection (if there is one) so that the server isn't
+            relied on to close it, then stop the event loop.
+            """
+
+            self.close_connection()
+            stopper()
+
+        self.function["inject_stop"] = inject_stop
+
+    async def handle_connection(self, websocket: Any) -> None:
+        """Handle a websocket-client connection."""
+
+        frame_size = new_default("count")
+        assert self.env is not None
+        try:
+            while self.state != DaemonState.STOPPING:
+                self.handle_frames(
+                    self.processor.process(
+                        await websocket.recv(), frame_size, self.mtu
+                    )
+                )
+        except websockets.exceptions.WebSocketException as exc:
+            LOG.error("Exception while awaiting frames: %s.", exc)
+
+    def close_connection(self) -> None:
+        """Close the current connection (if there is one), from any thread."""
+
+        websocket = self.websocket
+        if websocket is not None:
+            try:
+                run_coroutine_threadsafe(websocket.close(), self.eloop).result(
+                    DEFAULT_TIMEOUT
+                )
+            except FutureTimeout:
+                LOG.warning("Timed out closing connection.")
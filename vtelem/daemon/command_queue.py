@@ -5,12 +5,14 @@ vtelem - A module that helps aggregate command-consuming entities and dispatch
 
 # built-in
 from collections import defaultdict
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeout
 import json
 import logging
-from threading import Semaphore
 from typing import Any, Dict, List, Optional, Tuple
 
 # internal
+from vtelem import DEFAULT_TIMEOUT
 from vtelem.classes.metered_queue import create
 from vtelem.daemon.queue import QueueDaemon
 from vtelem.registry import DEFAULT_INDENT
@@ -147,21 +149,32 @@ class CommandQueueDaemon(QueueDaemon):
         """Put a command into our queue."""
         self.queue.put((command, result_cb))
 
-    def execute(self, command: Any) -> Tuple[bool, str]:
-        """Execute a command and block until it's complete."""
+    def execute_async(self, command: Any) -> Future:
+        """
+        Put a command into our queue, return a future that will be completed
+        with the (first) result of executing it.
+        """
 
-        result, msg = False, "Command result not known."
-        signal = Semaphore(0)
+        # a running future can't be cancelled, so it's always safe to set
+        # its result from the queue thread
+        future: Future = Future()
+        assert future.set_running_or_notify_cancel()
 
         def cmd_cb(status: bool, message: str) -> None:
-            """Update the result when we get it."""
+            """Complete the future when we get the result."""
 
-            nonlocal result
-            nonlocal msg
-            result = status
-            msg = message
-            signal.release()
+            if not future.done():
+                future.set_result((status, message))
 
         self.enqueue(command, cmd_cb)
-        in_time = signal.acquire(True, 2)  # pylint:disable=consider-using-with
-        return result and in_time, msg
+        return future
+
+    def execute(
+        self, command: Any, timeout: float = DEFAULT_TIMEOUT
+    ) -> Tuple[bool, str]:
+        """Execute a command and block until it's complete."""
+
+        try:
+            return self.execute_async(command).result(timeout)
+        except FutureTimeout:
+            return False, "Command result not known."
@@ -0,0 +1,391 @@
+"""
+vtelem - A tcp telemetry server that serves all clients from a single thread.
+"""
+
+# built-in
+from collections import deque
+import logging
+from queue import Queue
+import selectors
+import socket
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+# internal
+from vtelem.classes.time_entity import LockEntity
+from vtelem.client.tcp import TcpClient
+from vtelem.daemon import DaemonBase, DaemonState
+from vtelem.mtu import DEFAULT_MTU, Host
+from vtelem.stream.writer import StreamWriter
+from vtelem.telemetry.environment import TelemetryEnvironment
+
+LOG = logging.getLogger(__name__)
+DEFAULT_HIGH_WATER = 2**20
+RECV_SIZE = 4096
+
+
+class Subscriber:
+    """Outgoing frames buffered for a single connection."""
+
+    def __init__(self, sock: socket.socket, addr: Tuple[str, int]) -> None:
+        """Construct a new subscriber for a connected socket."""
+
+        self.sock = sock
+        self.name = f"{addr[0]}:{addr[1]}"
+        self.pending: Deque[memoryview] = deque()
+        self.buffered: int = 0
+        self.waiting = False
+
+    def add(self, payload: bytes) -> None:
+        """Buffer a frame to be sent."""
+
+        self.pending.append(memoryview(payload))
+        self.buffered += len(payload)
+
+    def flush(self) -> bool:
+        """
+        Send as much buffered data as possible without blocking, returns True
+        if nothing remains buffered.
+        """
+
+        while self.pending:
+            data = self.pending[0]
+            try:
+                sent = self.sock.send(data)
+            except BlockingIOError:
+                return False
+
+            self.buffered -= sent
+            if sent < len(data):
+                self.pending[0] = data[sent:]
+                return False
+            self.pending.popleft()
+
+        return True
+
+
+class Inbox(LockEntity):
+    """
+    Frames (and signals) handed to a serving thread from other threads, and a
+    socket pair used to wake the serving thread's selector when there are new
+    ones.
+    """
+
+    def __init__(self) -> None:
+        """Construct a new (closed) inbox."""
+
+        super().__init__()
+        self.items: Deque[Optional[bytes]] = deque()
+        self.signaled = False
+        self.sockets: Optional[Tuple[socket.socket, socket.socket]] = None
+
+    def open(self) -> socket.socket:
+        """Create the wake-up socket pair, returns the end to select on."""
+
+        with self.lock:
+            assert self.sockets is None
+            self.sockets = socket.socketpair()
+            for sock in self.sockets:
+                sock.setblocking(False)
+            self.signaled = False
+            return self.sockets[0]
+
+    def close(self) -> None:
+        """Close the wake-up socket pair and discard any items."""
+
+        with self.lock:
+            if self.sockets is not None:
+                for sock in self.sockets:
+                    sock.close()
+                self.sockets = None
+            self.items.clear()
+
+    def wake(self) -> None:
+        """Wake the serving thread (if it hasn't already been signaled)."""
+
+        with self.lock:
+            if self.signaled or self.sockets is None:
+                return
+            self.signaled = True
+
+            # the socket is only closed with the lock held
+            try:
+                self.sockets[1].send(b"\0")
+            except BlockingIOError:
+                pass
+
+    def put(self, item: Optional[bytes]) -> None:
+        """Add an item, from any thread."""
+
+        self.items.append(item)
+        self.wake()
+
+    def drain(self) -> List[Optional[bytes]]:
+        """Clear the wake-up signal and take all current items."""
+
+        # clear the signal first, so that items added after we've drained
+        # the inbox signal us again
+        with self.lock:
+            self.signaled = False
+            assert self.sockets is not None
+            try:
+                while self.sockets[0].recv(RECV_SIZE):
+                    pass
+            except BlockingIOError:
+                pass
+
+        items = self.items
+        return [items.popleft() for _ in range(len(items))]
+
+
+class SelectorTcpTelemetryDaemon(DaemonBase):
+    """
+    A class for serving telemetry frames to tcp clients, using non-blocking
+    sockets and a selector so that any number of clients are served by one
+    thread (instead of one thread per client).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        writer: StreamWriter,
+        env: TelemetryEnvironment,
+        address: Host = None,
+        time_keeper: Any = None,
+        *,
+        high_water: int = DEFAULT_HIGH_WATER,
+    ) -> None:
+        """
+        Construct a new tcp telemetry daemon. Frames for a client are dropped
+        while more than 'high_water' bytes are buffered for it.
+        """
+
+        if address is None:
+            address = Host()
+
+        super().__init__(name, env, time_keeper)
+        self.writer = writer
+        self.high_water = high_water
+        self.queue_id: Optional[int] = None
+        self.subscribers: Dict[socket.socket, Subscriber] = {}
+        self.inbox = Inbox()
+        self.stopping = False
+
+        # the listener is bound now so that its address is known, it's
+        # re-bound to the same address if the daemon is restarted
+        self.listener = self.listen(address)
+        self.bound: Tuple[str, int] = self.listener.getsockname()
+        self.selector: Optional[selectors.BaseSelector] = None
+
+        self.reset_metric("clients")
+        self.reset_metric("frame_drops")
+
+        def stopper() -> None:
+            """Signal the serving thread to stop."""
+
+            with self.lock:
+                self.stopping = True
+            self.inbox.wake()
+
+        self.function["inject_stop"] = stopper
+
+    @staticmethod
+    def listen(address: Tuple[str, int]) -> socket.socket:
+        """Create a non-blocking, listening socket."""
+
+        listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        listener.bind(address)
+        listener.listen()
+        listener.setblocking(False)
+        return listener
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        """Get this server's bound address."""
+
+        return self.bound
+
+    def client(self, mtu: int = DEFAULT_MTU) -> Tuple[TcpClient, Queue]:
+        """Create a client and output queue for this server."""
+
+        assert self.env is not None
+        queue = self.writer.get_queue()
+        return (
+            TcpClient(
+                Host(*self.address),
+                queue,
+                self.env.channel_registry,
+                self.env.app_id,
+                self.env,
+                mtu,
+            ),
+            queue,
+        )
+
+    def put(self, item: Optional[bytes]) -> None:
+        """
+        Hand a frame (or None, to close all connections) to the serving
+        thread, from any thread.
+        """
+
+        self.inbox.put(item)
+
+    def close_clients(self) -> int:
+        """
+        Signal all connected clients to close, returns the number of clients
+        signaled.
+        """
+
+        result = len(self.subscribers)
+        self.put(None)
+        return result
+
+    def accept(self) -> None:
+        """Accept a new connection."""
+
+        try:
+            sock, addr = self.listener.accept()
+        except BlockingIOError:
+            return
+
+        sock.setblocking(False)
+        subscriber = Subscriber(sock, addr)
+        self.subscribers[sock] = subscriber
+        assert self.selector is not None
+        self.selector.register(sock, selectors.EVENT_READ, subscriber)
+        LOG.info("%s connected", subscriber.name)
+        self.increment_metric("clients")
+
+    def disconnect(self, subscriber: Subscriber) -> None:
+        """Close a connection."""
+
+        if self.subscribers.pop(subscriber.sock, None) is None:
+            return
+
+        assert self.selector is not None
+        self.selector.unregister(subscriber.sock)
+        subscriber.sock.close()
+        LOG.info("%s disconnected", subscriber.name)
+        self.decrement_metric("clients")
+
+    def flush(self, subscriber: Subscriber) -> None:
+        """Write buffered data to a connection."""
+
+        try:
+            done = subscriber.flush()
+        except OSError as exc:
+            LOG.warning("%s: %s", subscriber.name, exc)
+            self.disconnect(subscriber)
+            return
+
+        # only wait for the connection to be writable while it's backed up
+        if subscriber.waiting == done:
+            assert self.selector is not None
+            subscriber.waiting = not done
+            events = selectors.EVENT_READ
+            if subscriber.waiting:
+                events |= selectors.EVENT_WRITE
+            self.selector.modify(subscriber.sock, events, subscriber)
+
+    def receive(self, subscriber: Subscriber) -> None:
+        """Read (and discard) data from a connection, handle it closing."""
+
+        try:
+            data = subscriber.sock.recv(RECV_SIZE)
+        except BlockingIOError:
+            return
+        except OSError:
+            data = b""
+
+        if not data:
+            self.disconnect(subscriber)
+
+    def service_inbox(self) -> None:
+        """Buffer new frames for all connections."""
+
+        to_flush = set()
+        for payload in self.inbox.drain():
+            for subscriber in list(self.subscribers.values()):
+                if payload is None:
+                    self.disconnect(subscriber)
+                    continue
+
+                if subscriber.buffered + len(payload) > self.high_water:
+                    self.increment_metric("frame_drops")
+                    continue
+
+                # connections that aren't backed up are written right away
+                if not subscriber.pending:
+                    to_flush.add(subscriber)
+                subscriber.add(payload)
+
+        for subscriber in to_flush:
+            if subscriber.sock in self.subscribers:
+                self.flush(subscriber)
+
+    def open(self) -> None:
+        """Create the resources used while serving."""
+
+        if self.listener.fileno() == -1:
+            self.listener = self.listen(self.bound)
+        self.selector = selectors.DefaultSelector()
+        self.selector.register(self.listener, selectors.EVENT_READ)
+        self.selector.register(self.inbox.open(), selectors.EVENT_READ)
+
+    def start(self, *args, **kwargs) -> bool:
+        """
+        Attempt to start the daemon, the server is listening once this
+        returns.
+        """
+
+        with self.lock:
+            if self.state != DaemonState.IDLE:
+                return False
+            self.open()
+            return super().start(*args, **kwargs)
+
+    def close(self) -> None:
+        """Disconnect all clients and close the resources used to serve."""
+
+        for subscriber in list(self.subscribers.values()):
+            self.disconnect(subscriber)
+        self.inbox.close()
+        if self.selector is not None:
+            self.selector.close()
+            self.selector = None
+        self.listener.close()
+
+    def run(self, *_, **__) -> None:
+        """Serve clients until signaled to stop."""
+
+        with self.lock:
+            self.stopping = False
+        selector = self.selector
+        assert selector is not None
+        self.queue_id = self.writer.add_queue(self)
+
+        try:
+            stopping = False
+            while not stopping:
+                for key, mask in selector.select():
+                    if key.fileobj is self.listener:
+                        self.accept()
+                    elif key.data is None:
+                        self.service_inbox()
+                    else:
+                        if mask & selectors.EVENT_READ:
+                            self.receive(key.data)
+
+                        # the connection may have closed while reading
+                        if (
+                            mask & selectors.EVENT_WRITE
+                            and key.fileobj in self.subscribers
+                        ):
+                            self.flush(key.data)
+
+                with self.lock:
+                    stopping = self.stopping
+        finally:
+            self.writer.remove_queue(self.queue_id, False)
+            self.queue_id = None
+            self.close()
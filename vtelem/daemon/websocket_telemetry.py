@@ -3,23 +3,33 @@ vtelem - An interface for managing websocket servers that serve telemetry data.
 """
 
 # built-in
+import asyncio
 from queue import Queue
-from typing import Any, Optional, Tuple
+from typing import Any, Optional, Set, Tuple
+from urllib.parse import urlsplit
 
 # third-party
 from websockets.exceptions import WebSocketException
 
 # internal
+from vtelem.channel.subscription import (
+    Subscription,
+    parse_subscription_query,
+    subscription_query,
+)
 from vtelem.client.websocket import WebsocketClient
 from vtelem.daemon.websocket import WebsocketDaemon
-from vtelem.frame.channel import ChannelFrame
 from vtelem.mtu import DEFAULT_MTU, Host
 from vtelem.stream import queue_get
-from vtelem.stream.writer import QueueClientManager, StreamWriter
+from vtelem.stream.broadcast import LoopBroadcaster
+from vtelem.stream.writer import StreamWriter
 from vtelem.telemetry.environment import TelemetryEnvironment
 
+# 'queue_get' is re-exported for existing users of this module
+__all__ = ["WebsocketTelemetryDaemon", "queue_get"]
 
-class WebsocketTelemetryDaemon(QueueClientManager, WebsocketDaemon):
+
+class WebsocketTelemetryDaemon(WebsocketDaemon):
     """A class for creating telemetry-serving websocket servers."""
 
     def __init__(
@@ -32,46 +42,145 @@ class WebsocketTelemetryDaemon(QueueClientManager, WebsocketDaemon):
     ) -> None:
         """Construct a new, telemetry-serving websocket server."""
 
-        QueueClientManager.__init__(self, name, writer)
+        self.writer = writer
+        self.queue_id: Optional[int] = None
+        self.subscriber_ids: Set[int] = set()
+
+        async def send_frames(websocket, frame_queue: asyncio.Queue) -> None:
+            """Send frames to this connection until signaled to stop."""
+
+            frame: Optional[bytes] = await frame_queue.get()
+            while frame is not None:
+                await websocket.send(frame)
+                frame = await frame_queue.get()
 
-        async def telem_handle(websocket, _) -> None:
+        async def telem_handle(websocket, path: str) -> None:
             """
             Write telemetry to this connection, for as long as it's connected.
+            Connections that declare a subscription (in the query string) are
+            only written the frames of subscribed channels.
             """
 
-            queue_id, frame_queue = self.add_client_queue(
-                Host(*websocket.remote_address)
-            )
-            should_continue = True
-
+            sub = parse_subscription_query(urlsplit(path).query)
+            sub_id: Optional[int] = None
+            if sub is None:
+                frame_queue = self.broadcaster.subscribe()
+            else:
+                sub_id, frame_queue = self.subscribe(sub)
+            sender = asyncio.ensure_future(send_frames(websocket, frame_queue))
+            closed = asyncio.ensure_future(websocket.wait_closed())
             try:
-                while should_continue:
-                    try:
-                        frame: Optional[ChannelFrame] = queue_get(frame_queue)
-                        if frame is None:
-                            should_continue = False
-                            break
-
-                        await websocket.send(frame.with_size_header()[0])
-                    except WebSocketException:
-                        should_continue = False
+                await asyncio.wait(
+                    [sender, closed], return_when=asyncio.FIRST_COMPLETED
+                )
+                if sender.done():
+                    sender.result()
+            except WebSocketException:
+                pass
             finally:
-                self.writer.remove_queue(queue_id, False)
+                sender.cancel()
+                closed.cancel()
+                if sub_id is None:
+                    self.broadcaster.unsubscribe(frame_queue)
+                else:
+                    self.unsubscribe(sub_id, False)
 
         WebsocketDaemon.__init__(
             self, name, None, address, env, time_keeper, telem_handle
         )
 
+        # all connections are served frames (from the stream writer's
+        # thread) by a single registered queue
+        self.broadcaster = LoopBroadcaster(
+            self.eloop, on_drop=lambda: self.increment_metric("frame_drops")
+        )
+        self.reset_metric("frame_drops")
+
+        serve = self.function["run_init"]
+        stopper = self.function["inject_stop"]
+
+        def run_init(*args, **kwargs) -> None:
+            """Start serving, then start receiving frames."""
+
+            serve(*args, **kwargs)
+            with self.lock:
+                self.queue_id = self.writer.add_queue(self.broadcaster)
+
+        def inject_stop() -> None:
+            """Stop receiving frames (closing connections), then stop."""
+
+            with self.lock:
+                queue_id = self.queue_id
+                self.queue_id = None
+            if queue_id is not None:
+                self.writer.remove_queue(queue_id)
+            self.close_subscribers()
+            stopper()
+
+        self.function["run_init"] = run_init
+        self.function["inject_stop"] = inject_stop
+
+    def subscribe(self, sub: Subscription) -> Tuple[int, asyncio.Queue]:
+        """
+        Register a connection's subscription with the environment, returns
+        the subscriber's identifier and the queue its frames are delivered
+        to. Must be called from the event loop.
+        """
+
+        assert self.env is not None
+        broadcaster = LoopBroadcaster(
+            self.eloop, on_drop=lambda: self.increment_metric("frame_drops")
+        )
+        frame_queue = broadcaster.subscribe()
+        sub_id = self.env.subscriptions.subscribe(sub, broadcaster)
+        with self.lock:
+            self.subscriber_ids.add(sub_id)
+        return sub_id, frame_queue
+
+    def unsubscribe(self, sub_id: int, inject_none: bool = True) -> bool:
+        """Remove a connection's subscription from the environment."""
+
+        assert self.env is not None
+        with self.lock:
+            self.subscriber_ids.discard(sub_id)
+        return self.env.subscriptions.unsubscribe(sub_id, inject_none)
+
+    def close_subscribers(self) -> int:
+        """
+        Signal all clients with a subscription to close, returns the number
+        of clients signaled.
+        """
+
+        with self.lock:
+            sub_ids = list(self.subscriber_ids)
+        return sum(self.unsubscribe(sub_id) for sub_id in sub_ids)
+
+    def close_clients(self) -> int:
+        """
+        Signal all connected clients to close, returns the number of clients
+        signaled.
+        """
+
+        result = len(self.broadcaster.subscribers)
+        self.broadcaster.put(None)
+        return result + self.close_subscribers()
+
     def client(
         self,
         mtu: int = DEFAULT_MTU,
         uri_path: str = "",
         time_keeper: Any = None,
+        sub: Subscription = None,
     ) -> Tuple[WebsocketClient, Queue]:
-        """Create a connected websocket client from this daemon."""
+        """
+        Create a connected websocket client from this daemon, optionally
+        only receiving the channels of a subscription.
+        """
 
         assert self.env is not None
         queue = self.writer.get_queue()
+        if sub is not None:
+            uri_path = f"{uri_path or '/'}?{subscription_query(sub)}"
         return (
             WebsocketClient(
                 self.address,
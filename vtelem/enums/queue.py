@@ -0,0 +1,15 @@
+"""
+vtelem - Enumeration definitions for queues.
+"""
+
+# built-in
+from enum import IntEnum
+
+
+class OverflowPolicy(IntEnum):
+    """What a queue does with an element when it's full."""
+
+    BLOCK = 0
+    DROP_NEWEST = 1
+    DROP_OLDEST = 2
+    CONFLATE = 3
@@ -3,9 +3,11 @@ vtelem - A module for creating different types of websocket daemons.
 """
 
 # built-in
+import asyncio
 import json
 
 # internal
+from vtelem import DEFAULT_TIMEOUT
 from vtelem.classes.time_keeper import TimeKeeper
 from vtelem.daemon.command_queue import CommandQueueDaemon
 from vtelem.daemon.websocket import WebsocketDaemon
@@ -32,11 +34,15 @@ def commandable_websocket_daemon(
 
         result = {"success": False, "message": "Command result not known."}
 
-        # build command, result callback
+        # wait for the result without blocking the event loop, so that
+        # commands from other connections can be serviced
         try:
-            cmd_result = daemon.execute(json.loads(message))
-            result["success"] = cmd_result[0]
-            result["message"] = cmd_result[1]
+            future = asyncio.wrap_future(
+                daemon.execute_async(json.loads(message))
+            )
+            done, _ = await asyncio.wait([future], timeout=DEFAULT_TIMEOUT)
+            if done:
+                result["success"], result["message"] = future.result()
         except json.decoder.JSONDecodeError as exc:
             result["message"] = str(exc)
 
@@ -4,10 +4,11 @@ vtelem - A module for basic frame interfaces.
 
 # built-in
 import math
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, Optional, Tuple
 
 # internal
 from vtelem.classes.byte_buffer import ByteBuffer
+from vtelem.classes.codec import FRAME_COUNT_OFFSET, FRAME_HEADER, FRAME_SIZE
 from vtelem.classes.type_primitive import TypePrimitive, new_default
 from vtelem.enums.primitive import random_integer
 
@@ -36,32 +37,39 @@ class Frame:
 
         self.mtu = mtu
         self.used: int = 0
-        self.buffer = ByteBuffer(bytearray(self.mtu))
+        self.buffer = ByteBuffer()
+        self.buffer.reserve(self.mtu)
         self.id_primitive = new_default("id")
         self.finalized = False
         self.initialized = False
+        self.cached: Optional[bytes] = None
 
-        # write frame header: (application) id, type, timestamp
-        self.write(frame_id)
-        self.write(frame_type)
-        self.write(timestamp)
-
-        # write frame header: element count (placeholder)
+        # write frame header: (application) id, type, timestamp and element
+        # count (placeholder)
+        self.used += self.buffer.pack(
+            FRAME_HEADER, frame_id.get(), frame_type.get(), timestamp.get(), 0
+        )
         self.count: Dict[str, Any] = {}
         self.count["primitive"] = new_default("count")
-        self.count["position"] = self.buffer.get_pos()
+        self.count["position"] = FRAME_COUNT_OFFSET
         self.count["value"] = 0
-        self.write(self.count["primitive"])
 
         # reserve space for crc
         self.crc = None
         if use_crc:
             self.crc = new_default("crc")
             self.used += self.crc.size()
-        self.overhead = self.used
 
         assert self.space > 0
 
+    @property
+    def overhead(self) -> int:
+        """Get the space used by the frame header and crc."""
+
+        return FRAME_HEADER.size + (
+            self.crc.size() if self.crc is not None else 0
+        )
+
     def write(self, elem: TypePrimitive) -> None:
         """Write a primitive into the buffer."""
 
@@ -91,6 +99,7 @@ class Frame:
         pad_amt = min(num_bytes, self.mtu - self.used)
         self.buffer.append(bytearray(pad_amt), pad_amt)
         self.used += pad_amt
+        self.cached = None
         return pad_amt
 
     def pad_to_mtu(self) -> None:
@@ -103,7 +112,28 @@ class Frame:
         """Obtain the raw buffer, and its size, from this frame."""
 
         assert self.finalized
-        return self.buffer.data, self.used
+
+        # the backing buffer may have been reserved beyond the frame's size
+        data = self.buffer.data
+        if len(data) != self.used:
+            data = data[0 : self.used]
+        return data, self.used
+
+    @property
+    def payload(self) -> bytes:
+        """
+        Get this frame, with the inter-frame size header included, as
+        immutable bytes that are only built once (and can be shared).
+        """
+
+        assert self.finalized
+
+        if self.cached is None:
+            self.cached = (
+                FRAME_SIZE.pack(self.used)
+                + memoryview(self.buffer.data)[0 : self.used]
+            )
+        return self.cached
 
     def with_size_header(
         self, frame_size: TypePrimitive = None
@@ -114,7 +144,7 @@ class Frame:
         """
 
         if frame_size is None:
-            frame_size = new_default("count")
+            return self.payload, len(self.payload)
 
         data, size = self.raw
         assert frame_size.set(size)
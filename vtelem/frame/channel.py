@@ -4,14 +4,16 @@ vtelem - A module that implements storage for channel data, restricted by
 """
 
 # built-in
-from typing import Any
+from typing import Any, Hashable, Optional
 
 # internal
 from vtelem.classes import DEFAULTS, EventType
 from vtelem.classes.byte_buffer import ByteBuffer
-from vtelem.classes.type_primitive import TypePrimitive, new_default
+from vtelem.classes.codec import FRAME_HEADER, FRAME_SIZE, get_event_codec
+from vtelem.classes.type_primitive import TypePrimitive
 from vtelem.enums.primitive import Primitive, get_size
 from vtelem.frame import Frame, time_to_int
+from vtelem.types.frame import FrameType
 
 
 class ChannelFrame(Frame):
@@ -28,7 +30,8 @@ class ChannelFrame(Frame):
         """Construct an empty channel frame."""
 
         super().__init__(mtu, frame_id, frame_type, timestamp, use_crc)
-        self.elem_buffer = ByteBuffer(bytearray(self.mtu))
+        self.elem_buffer = ByteBuffer()
+        self.elem_buffer.reserve(self.mtu - self.overhead)
 
     def finalize_hook(self) -> None:
         """Append the element buffer to the actual frame buffer."""
@@ -46,9 +49,8 @@ class ChannelFrame(Frame):
         """Add event data into this frame."""
 
         # determine if this event element will fit in the current frame
-        space_required = self.id_primitive.size()
-        space_required += 2 * get_size(chan_type)
-        space_required += 2 * get_size(DEFAULTS["timestamp"])
+        codec = get_event_codec(chan_type, self.elem_buffer.order)
+        space_required = self.id_primitive.size() + codec.size
         if (self.used + space_required > self.mtu) or self.finalized:
             return False
 
@@ -56,21 +58,14 @@ class ChannelFrame(Frame):
         assert self.id_primitive.set(chan_id)
         self.used += self.id_primitive.write(self.buffer)
 
-        # write the event data into the element buffer
-        data_prim = TypePrimitive(chan_type)
-        time_prim = new_default("timestamp")
-
-        # write 'prev'
-        data_prim.set(prev[0])
-        self.used += data_prim.write(self.elem_buffer)
-        time_prim.set(time_to_int(prev[1]))
-        self.used += time_prim.write(self.elem_buffer)
-
-        # write 'curr'
-        data_prim.set(curr[0])
-        self.used += data_prim.write(self.elem_buffer)
-        time_prim.set(time_to_int(curr[1]))
-        self.used += time_prim.write(self.elem_buffer)
+        # write the event data ('prev' then 'curr') into the element buffer
+        self.used += self.elem_buffer.pack(
+            codec,
+            prev[0],
+            time_to_int(prev[1]),
+            curr[0],
+            time_to_int(curr[1]),
+        )
 
         self.increment_count()
         return True
@@ -94,3 +89,22 @@ class ChannelFrame(Frame):
 
         self.increment_count()
         return True
+
+
+def conflation_key(payload: Any) -> Optional[Hashable]:
+    """
+    Get a key identifying the channels in a (size-prefixed) data frame,
+    frames with the same key can replace each other when queued.
+    """
+
+    if not isinstance(payload, bytes):
+        return None
+
+    _, frame_type, _, count = FRAME_HEADER.unpack_from(
+        payload, FRAME_SIZE.size
+    )
+    if frame_type != FrameType.DATA:
+        return None
+
+    start = FRAME_SIZE.size + FRAME_HEADER.size
+    return payload[start : start + count * DEFAULTS["id"].value.size]
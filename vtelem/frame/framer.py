@@ -15,12 +15,14 @@ from vtelem.enums.primitive import random_integer
 from vtelem.frame import Frame, time_to_int
 from vtelem.frame.channel import ChannelFrame
 from vtelem.frame.message import MessageFrame
+from vtelem.frame.stream import StreamFrame
 
 LOG = logging.getLogger(__name__)
 FRAME_CLASS_MAP: Dict[str, Type] = defaultdict(lambda: Frame)
 FRAME_CLASS_MAP["data"] = ChannelFrame
 FRAME_CLASS_MAP["event"] = ChannelFrame
 FRAME_CLASS_MAP["message"] = MessageFrame
+FRAME_CLASS_MAP["stream"] = StreamFrame
 
 
 def basis_to_int(basis: float) -> int:
@@ -3,10 +3,11 @@ vtelem - A module providing utilities for parsing frames.
 """
 
 # built-in
-from typing import List, cast
+from typing import Iterator, List, Tuple, Union
 
 # internal
-from vtelem.classes.byte_buffer import ByteBuffer
+from vtelem.classes.codec import FRAME_SIZE, get_codec
+from vtelem.classes.stream_buffer import StreamBuffer
 from vtelem.classes.type_primitive import TypePrimitive
 
 
@@ -19,7 +20,7 @@ class FrameProcessor:
     def __init__(self) -> None:
         """Construct a new message processor."""
 
-        self.buffer = ByteBuffer()
+        self.buffer = StreamBuffer()
         self.size: int = 0
         self.size_stale: bool = True
 
@@ -30,8 +31,9 @@ class FrameProcessor:
         contains enough bytes yet).
         """
 
-        if self.size_stale and self.buffer.can_read(frame_size.type):
-            self.size = cast(int, frame_size.read(self.buffer, chomp=True))
+        codec = get_codec(frame_size.type)
+        if self.size_stale and self.buffer.remaining >= codec.size:
+            self.size = self.buffer.unpack(codec)[0]
             self.size_stale = False
 
         # clear buffer state if we get an unreasonable value
@@ -40,22 +42,45 @@ class FrameProcessor:
             self.size_stale = True
 
     def process(
-        self, data: bytes, frame_size: TypePrimitive, mtu: int
-    ) -> List[bytes]:
+        self,
+        data: Union[bytes, memoryview],
+        frame_size: TypePrimitive,
+        mtu: int,
+    ) -> List[memoryview]:
         """
         Process a new set of bytes and return a list of byte sequences that
-        can be coherently processed as frames.
+        can be coherently processed as frames. The returned sequences are
+        views into the processor's storage and are not copied.
         """
 
-        result: List[bytes] = []
+        result: List[memoryview] = []
         self.buffer.append(data)
 
         self.read_size(frame_size, mtu)
 
         # read the size of the next frame, then the frame-data itself
         while not self.size_stale and self.size <= self.buffer.remaining:
-            result.append(self.buffer.read_bytes(self.size, True))
+            result.append(self.buffer.read(self.size))
             self.size_stale = True
             self.read_size(frame_size, mtu)
 
         return result
+
+
+def walk_frames(
+    data: memoryview, offset: int, mtu: int
+) -> Iterator[Tuple[memoryview, int]]:
+    """
+    Walk the (size-prefixed) frames in a buffer, starting at a given offset,
+    without copying them. Yields each complete frame and the offset of the
+    data following it, stopping at the first incomplete (or invalid) frame.
+    """
+
+    end = len(data)
+    while offset + FRAME_SIZE.size <= end:
+        size = FRAME_SIZE.unpack_from(data, offset)[0]
+        start = offset + FRAME_SIZE.size
+        if size > mtu or start + size > end:
+            break
+        offset = start + size
+        yield data[start:offset], offset
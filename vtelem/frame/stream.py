@@ -0,0 +1,130 @@
+"""
+vtelem - A module implementing stream frames, blocks of consecutive samples
+         for a single channel.
+"""
+
+# built-in
+from array import array
+import sys
+from typing import Any
+
+# internal
+from vtelem.classes import DEFAULTS
+from vtelem.classes.type_primitive import TypePrimitive, new_default
+from vtelem.enums.primitive import Primitive
+from vtelem.frame import Frame
+
+# sample formats that can be copied without conversion, by kind
+FORMAT_KINDS = {
+    **{code: "signed" for code in "bhilqn"},
+    **{code: "unsigned" for code in "BHILQN"},
+    **{code: "float" for code in "efd"},
+    "?": "bool",
+}
+
+# the kinds of samples that can be converted to each kind of primitive type
+CONVERTIBLE_KINDS = {
+    "signed": {"signed", "unsigned", "bool"},
+    "unsigned": {"unsigned", "bool"},
+    "float": {"signed", "unsigned", "float", "bool"},
+    "bool": {"unsigned", "bool"},
+}
+
+
+def array_code(instance: Primitive) -> str:
+    """Get the array type-code for storing samples of a primitive type."""
+
+    code = "B" if instance == Primitive.BOOLEAN else instance.value.fmt
+    if array(code).itemsize != instance.value.size:
+        code = {"i": "l", "I": "L"}[code]
+    assert array(code).itemsize == instance.value.size
+    return code
+
+
+def sample_bytes(samples: Any, instance: Primitive) -> memoryview:
+    """
+    Get the bytes of a block of samples (any buffer-protocol object, such as
+    an 'array.array' or a NumPy array), in network byte order, for a
+    primitive type. Samples that are stored with the same size and kind are
+    converted in bulk, anything else is converted sample by sample. Raises a
+    TypeError for samples that can't be converted (such as floating-point
+    samples for an integer type, signed samples for an unsigned type or
+    samples that don't fit in the type).
+    """
+
+    view = memoryview(samples)
+    fmt = view.format
+    order = fmt[0] if fmt[0] in "@=<>!" else "@"
+    kind = FORMAT_KINDS.get(fmt.lstrip("@=<>!"))
+    target = FORMAT_KINDS[instance.value.fmt]
+    if kind not in CONVERTIBLE_KINDS[target]:
+        raise TypeError(
+            f"samples of format '{fmt}' can't be converted to '{instance}'"
+        )
+
+    # integer samples for a boolean type must be zero or one
+    if target == "bool" and kind != "bool" and set(view.tolist()) - {0, 1}:
+        raise TypeError(f"samples for '{instance}' must be zero or one")
+    code = array_code(instance)
+
+    if view.itemsize == instance.value.size and kind == target:
+        raw = memoryview(view.tobytes()) if not view.c_contiguous else view
+        raw = raw.cast("B")
+        big = order in ">!" or (order in "@=" and sys.byteorder == "big")
+        if big or view.itemsize == 1:
+            return raw
+        data = array(code)
+        data.frombytes(raw)
+    else:
+        try:
+            data = array(code, view.tolist())
+        except OverflowError as exc:
+            raise TypeError(
+                f"samples of format '{fmt}' don't fit in '{instance}'"
+            ) from exc
+        if sys.byteorder == "big" or data.itemsize == 1:
+            return memoryview(data).cast("B")
+
+    data.byteswap()
+    return memoryview(data).cast("B")
+
+
+class StreamFrame(Frame):
+    """
+    An implementation of a stream frame, which holds as many consecutive
+    samples of a channel as fit (and the index of the first one).
+    """
+
+    def initialize(self, chan_id: int, index: int) -> None:
+        """Perform one-time initialization of a stream frame."""
+
+        assert not self.initialized
+
+        chan_prim = new_default("id")
+        assert chan_prim.set(chan_id)
+        self.write(chan_prim)
+        index_prim: TypePrimitive = new_default("count")
+        assert index_prim.set(index)
+        self.write(index_prim)
+        self.initialized = True
+
+    @staticmethod
+    def header_size() -> int:
+        """Get the space required for the channel and index fields."""
+
+        return DEFAULTS["id"].value.size + DEFAULTS["count"].value.size
+
+    def add_samples(self, data: memoryview, sample_size: int) -> int:
+        """
+        Copy as many (whole) samples as fit into this frame, returns the
+        number of samples added.
+        """
+
+        assert self.initialized and not self.finalized
+
+        count = min(len(data), self.space) // sample_size
+        size = count * sample_size
+        self.buffer.append(data, size)
+        self.used += size
+        self.increment_count(count)
+        return count
@@ -26,6 +26,11 @@ def mtu_to_usable(mtu: int, medium_overhead: int = 60 + 8) -> int:
 
 
 DEFAULT_MTU = mtu_to_usable(1500)
+DEFAULT_MULTICAST_TTL = 1
+
+# a fixed port (rather than an ephemeral one) so that publishers and members
+# of a multicast group agree on it without any configuration
+DEFAULT_MULTICAST_PORT = 24680
 
 
 class Host(NamedTuple):
@@ -67,6 +72,59 @@ def create_udp_socket(
     return sock
 
 
+def create_multicast_socket(
+    group: Host,
+    ttl: int = DEFAULT_MULTICAST_TTL,
+    interface_ip: str = None,
+    loop: bool = True,
+) -> socket.SocketType:
+    """
+    Create a UDP socket that sends to a multicast group, datagrams are
+    forwarded by at most 'ttl' hops.
+    """
+
+    sock = create_udp_socket(group)
+    sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, ttl)
+    sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_LOOP, int(loop))
+    if interface_ip is not None:
+        sock.setsockopt(
+            socket.IPPROTO_IP,
+            socket.IP_MULTICAST_IF,
+            socket.inet_aton(interface_ip),
+        )
+    return sock
+
+
+def join_multicast_socket(
+    group: Host, interface_ip: str = "0.0.0.0"
+) -> socket.SocketType:
+    """
+    Create a UDP socket that receives datagrams sent to a multicast group
+    (multiple sockets can join the same group and port).
+    """
+
+    assert sys.platform == "linux"
+
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind(group)
+    sock.setsockopt(
+        socket.IPPROTO_IP,
+        socket.IP_ADD_MEMBERSHIP,
+        socket.inet_aton(group.address) + socket.inet_aton(interface_ip),
+    )
+    return sock
+
+
+def socket_mtu(sock: socket.SocketType) -> int:
+    """
+    Get the (currently known) maximum transmission unit of a connected
+    socket's route, without sending anything.
+    """
+
+    return sock.getsockopt(socket.IPPROTO_IP, SocketConstants.IP_MTU)
+
+
 def discover_mtu(
     sock: socket.SocketType,
     probe_size: int = DEFAULT_MTU,
@@ -101,7 +159,7 @@ def discover_mtu(
         socket.IPPROTO_IP, SocketConstants.IP_MTU_DISCOVER, orig_val
     )
 
-    return sock.getsockopt(socket.IPPROTO_IP, SocketConstants.IP_MTU)
+    return socket_mtu(sock)
 
 
 def get_free_port(
@@ -4,15 +4,14 @@ vtelem - Parsing frames into runtime data.
 
 # built-in
 import logging
-from typing import Optional, Tuple, cast
+from typing import Optional, Tuple, Union, cast
 
 # internal
 from vtelem.channel.registry import ChannelRegistry
-from vtelem.classes import DEFAULTS
 from vtelem.classes.byte_buffer import ByteBuffer
+from vtelem.classes.codec import FRAME_FOOTER, FRAME_HEADER
 from vtelem.classes.type_primitive import TypePrimitive
 from vtelem.enums.frame import PARSERS
-from vtelem.enums.primitive import get_size
 from vtelem.types.frame import FrameFooter, FrameHeader, FrameType, ParsedFrame
 
 LOG = logging.getLogger(__name__)
@@ -24,18 +23,14 @@ def parse_frame_header(
     """Attempt to parse a channel frame from a buffer."""
 
     # read header
-    app_id = buf.read(DEFAULTS["id"])
+    app_id, frame_type, timestamp, count = buf.unpack(FRAME_HEADER)
 
     if expected_id is not None:
         if app_id != expected_id.get():
             return app_id, None
 
     return app_id, FrameHeader(
-        buf.size,
-        app_id,
-        FrameType(buf.read(DEFAULTS["enum"])),
-        buf.read(DEFAULTS["timestamp"]),
-        buf.read(DEFAULTS["count"]),
+        buf.size, app_id, FrameType(frame_type), timestamp, count
     )
 
 
@@ -43,14 +38,14 @@ def parse_frame_footer(buf: ByteBuffer) -> FrameFooter:
     """Attempt to parse a channel fram footer from a buffer."""
 
     crc = None
-    if buf.can_read(DEFAULTS["crc"]):
-        crc = buf.read(DEFAULTS["crc"])
+    if buf.remaining >= FRAME_FOOTER.size:
+        crc = buf.unpack(FRAME_FOOTER)[0]
     return FrameFooter(crc)
 
 
 def decode_frame(
     channel_registry: ChannelRegistry,
-    data: bytes,
+    data: Union[bytes, memoryview],
     size: int,
     expected_id: Optional[TypePrimitive] = None,
 ) -> Optional[ParsedFrame]:
@@ -70,8 +65,7 @@ def decode_frame(
 
     footer = parse_frame_footer(buf)
     if footer.crc is not None:
-        buf.size = buf.get_pos()
-        buf.size -= get_size(DEFAULTS["crc"])
+        buf.size = buf.get_pos() - FRAME_FOOTER.size
         if footer.crc != buf.crc32():
             LOG.error(
                 "invalid crc on frame: %d != %d",
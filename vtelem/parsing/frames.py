@@ -4,11 +4,16 @@ vtelem - Parsing specific frame payloads.
 
 # built-in
 import logging
+from struct import Struct
+from typing import Callable, List
 
 # internal
+from vtelem.channel import Channel
 from vtelem.channel.registry import ChannelRegistry
 from vtelem.classes import DEFAULTS
 from vtelem.classes.byte_buffer import ByteBuffer
+from vtelem.classes.layout_cache import FrameLayout
+from vtelem.enums.primitive import Primitive, get_fstring, get_size
 from vtelem.frame.fields import MESSAGE_FIELDS
 from vtelem.types.frame import FrameHeader
 
@@ -25,6 +30,58 @@ def parse_invalid_frame(
     return {"valid": False}
 
 
+def data_element(inst: Primitive) -> str:
+    """Get the format String for a data-frame element."""
+
+    return get_fstring(inst)
+
+
+def event_element(inst: Primitive) -> str:
+    """Get the format String for an event-frame element."""
+
+    return (get_fstring(inst) + get_fstring(DEFAULTS["timestamp"])) * 2
+
+
+def get_layout(
+    header: FrameHeader,
+    buf: ByteBuffer,
+    registry: ChannelRegistry,
+    element: Callable[[Primitive], str],
+) -> FrameLayout:
+    """
+    Read the channel-identifier block from the buffer and obtain the layout
+    of the element block that follows it (compiling it if this sequence of
+    identifiers hasn't been seen before).
+    """
+
+    id_block = bytes(buf.read_bytes(header.size * get_size(DEFAULTS["id"])))
+    key = (header.type, buf.order, id_block)
+
+    layout = registry.layouts.get(key)
+    if layout is None:
+        ids = list(
+            Struct(
+                buf.order + get_fstring(DEFAULTS["id"]) * header.size
+            ).unpack(id_block)
+        )
+        channels: List[Channel] = []
+        for chan_id in ids:
+            channel = registry.get_item(chan_id)
+            assert channel is not None and not channel.is_stream
+            channels.append(channel)
+        layout = FrameLayout(
+            ids,
+            channels,
+            Struct(
+                buf.order
+                + "".join(element(channel.type) for channel in channels)
+            ),
+        )
+        registry.layouts.put(key, layout)
+
+    return layout
+
+
 def parse_data_frame(
     header: FrameHeader, buf: ByteBuffer, registry: ChannelRegistry
 ) -> dict:
@@ -32,19 +89,16 @@ def parse_data_frame(
     Attempt to parse a data frame from the remaining byte-buffer.
     """
 
-    # read channel IDs
-    obj: dict = {"channels": []}
-    for _ in range(header.size):
-        chan = {"id": buf.read(DEFAULTS["id"])}
-        chan["channel"] = registry.get_item(chan["id"])
-        assert not chan["channel"].is_stream
-        obj["channels"].append(chan)
-
-    # read values
-    for chan in obj["channels"]:
-        chan["value"] = buf.read(chan["channel"].type)
-
-    return obj
+    layout = get_layout(header, buf, registry, data_element)
+    values = buf.unpack(layout.codec)
+    return {
+        "channels": [
+            {"id": chan_id, "channel": channel, "value": value}
+            for chan_id, channel, value in zip(
+                layout.ids, layout.channels, values
+            )
+        ]
+    }
 
 
 def parse_event_frame(
@@ -54,20 +108,21 @@ def parse_event_frame(
     Attempt to parse an event frame from the remaining byte-buffer.
     """
 
-    # read channel IDs
+    layout = get_layout(header, buf, registry, event_element)
+    values = buf.unpack(layout.codec)
+
+    # each event is a (value, time) pair for the previous and current value
     obj: dict = {"events": []}
-    for _ in range(header.size):
-        event = {"id": buf.read(DEFAULTS["id"])}
-        event["channel"] = registry.get_item(event["id"])
-        assert not event["channel"].is_stream
-        obj["events"].append(event)
-
-    # read events
-    for event in obj["events"]:
-        event["previous"] = {"value": buf.read(event["channel"].type)}
-        event["previous"]["time"] = buf.read(DEFAULTS["timestamp"])
-        event["current"] = {"value": buf.read(event["channel"].type)}
-        event["current"]["time"] = buf.read(DEFAULTS["timestamp"])
+    for idx, (chan_id, channel) in enumerate(zip(layout.ids, layout.channels)):
+        prev, prev_time, curr, curr_time = values[idx * 4 : idx * 4 + 4]
+        obj["events"].append(
+            {
+                "id": chan_id,
+                "channel": channel,
+                "previous": {"value": prev, "time": prev_time},
+                "current": {"value": curr, "time": curr_time},
+            }
+        )
 
     return obj
 
@@ -80,7 +135,7 @@ def parse_message_frame(
     """
 
     obj = {field.name: buf.read(field.type) for field in MESSAGE_FIELDS}
-    obj["fragment_bytes"] = buf.read_bytes(header.size)
+    obj["fragment_bytes"] = bytes(buf.read_bytes(header.size))
     return obj
 
 
@@ -95,5 +150,5 @@ def parse_stream_frame(
     obj["channel"] = registry.get_item(obj["id"])
     assert obj["channel"].is_stream
     obj["index"] = buf.read(DEFAULTS["count"])
-    obj["data"] = buf.read_bytes(header.size * obj["channel"].size())
+    obj["data"] = bytes(buf.read_bytes(header.size * obj["channel"].size()))
     return obj
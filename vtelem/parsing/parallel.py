@@ -0,0 +1,127 @@
+"""
+vtelem - Decoding recordings with multiple processes.
+"""
+
+# built-in
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+import logging
+import mmap
+import os
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+# internal
+from vtelem.channel.registry import ChannelRegistry, ChannelSnapshot
+from vtelem.frame.processor import walk_frames
+from vtelem.mtu import DEFAULT_MTU
+from vtelem.parsing.encapsulation import decode_frame
+from vtelem.stream.index import FrameIndex
+from vtelem.types.frame import ParsedFrame
+
+LOG = logging.getLogger(__name__)
+
+
+def frame_channels(frame: ParsedFrame) -> List[dict]:
+    """Get the elements of a parsed frame that reference channels."""
+
+    if "channels" in frame.body:
+        return frame.body["channels"]
+    if "events" in frame.body:
+        return frame.body["events"]
+    if "channel" in frame.body:
+        return [frame.body]
+    return []
+
+
+def unlink_channels(frame: ParsedFrame) -> ParsedFrame:
+    """
+    Remove channel references from a parsed frame (so that it can be sent
+    to another process).
+    """
+
+    for elem in frame_channels(frame):
+        elem["channel"] = None
+    return frame
+
+
+def link_channels(frame: ParsedFrame, registry: ChannelRegistry) -> None:
+    """Restore the channel references in a parsed frame."""
+
+    for elem in frame_channels(frame):
+        elem["channel"] = registry.get_item(elem["id"])
+
+
+def decode_shard(
+    path: Path,
+    start: int,
+    end: int,
+    snapshot: ChannelSnapshot,
+    mtu: int = DEFAULT_MTU,
+) -> List[ParsedFrame]:
+    """Decode the frames in a (frame-aligned) byte range of a recording."""
+
+    registry = ChannelRegistry.from_snapshot(snapshot)
+    result = []
+    with path.open("rb") as stream:
+        data = memoryview(
+            mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+        )
+        for frame, _ in walk_frames(data[:end], start, mtu):
+            parsed = decode_frame(registry, frame, len(frame))
+            if parsed is not None:
+                result.append(unlink_channels(parsed))
+    return result
+
+
+def shard_ranges(path: Path, shards: int) -> List[Tuple[int, int]]:
+    """
+    Split a recording (at frame boundaries) into byte ranges containing a
+    similar number of frames.
+    """
+
+    index = FrameIndex.get(path, create=False)
+    if index is None:
+        index = FrameIndex.scan(path)
+
+    count = len(index)
+    shards = min(shards, count)
+    bounds = [index.offsets[(count * idx) // shards] for idx in range(shards)]
+    bounds.append(path.stat().st_size)
+    return [(bounds[idx], bounds[idx + 1]) for idx in range(shards)]
+
+
+def decode_parallel(
+    path: Path,
+    registry: ChannelRegistry,
+    workers: Optional[int] = None,
+    mtu: int = DEFAULT_MTU,
+) -> List[ParsedFrame]:
+    """
+    Decode an entire recording using a pool of worker processes, return
+    all decoded frames in timestamp order.
+    """
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    ranges = shard_ranges(path, workers)
+    if not ranges:
+        return []
+
+    snapshot = registry.snapshot()
+    LOG.info("%s: decoding %d shard(s)", path.name, len(ranges))
+
+    with ProcessPoolExecutor(max_workers=len(ranges)) as executor:
+        futures = [
+            executor.submit(decode_shard, path, start, end, snapshot, mtu)
+            for start, end in ranges
+        ]
+        shards = [future.result() for future in futures]
+
+    # shards are in file order, so sorting is stable with respect to frames
+    # that have the same timestamp
+    result = sorted(chain(*shards), key=lambda frame: frame.header.timestamp)
+    for frame in result:
+        link_channels(frame, registry)
+    return result
@@ -6,7 +6,16 @@ vtelem - A generic registrar implementation.
 from collections import defaultdict
 import json
 import threading
-from typing import Any, Dict, Generic, List, Optional, Tuple, TypeVar
+from typing import (
+    Any,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
 
 # internal
 from vtelem.classes.serdes import DEFAULT_INDENT
@@ -52,6 +61,14 @@ class Registry(Generic[T]):
             result = self.data[self.type_name][item_id]
         return result
 
+    def get_items(self, item_ids: Iterable[int]) -> List[Optional[T]]:
+        """Obtain many items' data by their integer identifiers."""
+
+        with self.lock:
+            items = self.data[self.type_name]
+            result = [items[item_id] for item_id in item_ids]
+        return result
+
     def get_id(self, name: str) -> Optional[int]:
         """
         Determine the integer identifier for a named type, if it can be found.
@@ -0,0 +1,67 @@
+"""
+vtelem - Fan-out of frames to subscribers on an asyncio event loop.
+"""
+
+# built-in
+import asyncio
+from typing import Any, Callable, Set
+
+# internal
+from vtelem.classes.metered_queue import MAX_SIZE
+
+
+class LoopBroadcaster:
+    """
+    A queue-like object that can be registered with a stream writer, so that
+    frames put from any thread are delivered to subscribers (asyncio queues)
+    on an event loop, without blocking either side.
+    """
+
+    def __init__(
+        self,
+        eloop: asyncio.AbstractEventLoop,
+        maxsize: int = MAX_SIZE,
+        on_drop: Callable[[], None] = None,
+    ) -> None:
+        """Construct a new broadcaster for an event loop."""
+
+        self.eloop = eloop
+        self.maxsize = maxsize
+        self.on_drop = on_drop
+        self.subscribers: Set[asyncio.Queue] = set()
+
+    def put(self, item: Any) -> None:
+        """Hand an element to the event loop, from any thread."""
+
+        if not self.eloop.is_closed():
+            self.eloop.call_soon_threadsafe(self.publish, item)
+
+    def put_nowait(self, item: Any) -> None:
+        """Same as 'put', a broadcaster never blocks (or becomes full)."""
+
+        self.put(item)
+
+    def publish(self, item: Any) -> None:
+        """
+        Deliver an element to all subscribers, subscribers that have fallen
+        behind miss their oldest element. Must be called from the event loop.
+        """
+
+        for queue in self.subscribers:
+            if queue.full():
+                queue.get_nowait()
+                if self.on_drop is not None:
+                    self.on_drop()
+            queue.put_nowait(item)
+
+    def subscribe(self) -> asyncio.Queue:
+        """Add a subscriber. Must be called from the event loop."""
+
+        queue: asyncio.Queue = asyncio.Queue(self.maxsize)
+        self.subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        """Remove a subscriber. Must be called from the event loop."""
+
+        self.subscribers.discard(queue)
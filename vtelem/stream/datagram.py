@@ -0,0 +1,197 @@
+"""
+vtelem - A sender that writes each frame to connected sockets as a datagram.
+"""
+
+# built-in
+from collections import defaultdict
+import logging
+from queue import Empty
+import socket
+import threading
+import time
+from typing import Dict, List, Optional
+
+# internal
+from vtelem import DEFAULT_TIMEOUT
+from vtelem.classes.metered_queue import MAX_SIZE, PolicyQueue
+from vtelem.classes.time_entity import LockEntity
+from vtelem.enums.queue import OverflowPolicy
+from vtelem.stream.writer import StreamWriter
+
+LOG = logging.getLogger(__name__)
+DEFAULT_BATCH = 64
+
+
+class DatagramSender(LockEntity):
+    """
+    Sends every frame produced by a stream writer to a set of connected
+    datagram sockets, exactly one frame per datagram. Frames are drained from
+    the writer in batches by a dedicated thread (that only runs while there
+    are sockets), and sockets are non-blocking so that a slow peer drops
+    frames instead of stalling the others. Datagrams sent, send errors and
+    datagrams dropped for full socket buffers are counted as metrics of the
+    stream writer.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        writer: StreamWriter,
+        *,
+        maxsize: int = MAX_SIZE,
+        batch: int = DEFAULT_BATCH,
+    ) -> None:
+        """Construct a new datagram sender."""
+
+        super().__init__()
+        self.name = name
+        self.writer = writer
+        self.batch = batch
+        self.sockets: Dict[int, socket.SocketType] = {}
+        self.socket_id = 0
+        self.queue_id: Optional[int] = None
+        self.thread: Optional[threading.Thread] = None
+
+        # the writer is never blocked by this sender, the oldest frames are
+        # dropped instead
+        self.queue = PolicyQueue(maxsize, OverflowPolicy.DROP_OLDEST)
+
+        self.writer.reset_metric("datagrams_sent")
+        self.writer.reset_metric("datagram_errors")
+        self.writer.reset_metric("datagrams_blocked")
+
+    @property
+    def dropped(self) -> int:
+        """
+        Get the number of frames dropped, either because this sender fell
+        behind or because a socket's send buffer was full.
+        """
+
+        metrics = self.writer.function["metrics_data"]
+        return self.queue.dropped + metrics["datagrams_blocked"]
+
+    def add_socket(self, sock: socket.SocketType) -> int:
+        """Start sending frames to a connected socket."""
+
+        sock.setblocking(False)
+        with self.lock:
+            result = self.socket_id
+            self.sockets[result] = sock
+            self.socket_id += 1
+
+            # only receive frames while there's somewhere to send them
+            if self.queue_id is None:
+                self.queue_id = self.writer.add_queue(self.queue)
+                self.thread = threading.Thread(
+                    target=self.run, name=self.name, daemon=True
+                )
+                self.thread.start()
+        return result
+
+    def remove_socket(
+        self,
+        sock_id: int,
+        drain: bool = True,
+        timeout: float = DEFAULT_TIMEOUT,
+    ) -> Optional[socket.SocketType]:
+        """
+        Stop sending frames to a socket (optionally, after frames already
+        produced have been sent), returns the socket if it was present.
+        """
+
+        if drain:
+            self.await_empty(timeout)
+
+        with self.lock:
+            sock = self.sockets.pop(sock_id, None)
+            last = not self.sockets
+        if last:
+            self.close(timeout)
+        return sock
+
+    def await_empty(
+        self, timeout: float = DEFAULT_TIMEOUT, interval: float = 0.01
+    ) -> bool:
+        """
+        Wait until all enqueued frames have been sent, via polling. Returns
+        False if that didn't happen in time.
+        """
+
+        deadline = time.monotonic() + timeout
+        while self.queue.unfinished_tasks:
+            if time.monotonic() >= deadline:
+                LOG.warning(
+                    "%s: timed out sending %d frames",
+                    self.name,
+                    self.queue.unfinished_tasks,
+                )
+                return False
+            time.sleep(interval)
+        return True
+
+    def send(self, payload: bytes, counts: Dict[str, int]) -> None:
+        """
+        Send a frame to every socket and count the results. Must be called
+        with the lock held.
+        """
+
+        for sock in self.sockets.values():
+            try:
+                sock.send(payload)
+                counts["datagrams_sent"] += 1
+            except BlockingIOError:
+                counts["datagrams_blocked"] += 1
+            except OSError as exc:
+                # errors (e.g. nobody listening at the peer) are reported
+                # asynchronously for datagram sockets, so the socket is kept
+                counts["datagram_errors"] += 1
+                LOG.debug("%s: %s", self.name, exc)
+
+    def run(self) -> None:
+        """Send frames in batches until signaled to stop."""
+
+        running = True
+        while running:
+            # block for the first frame, then take whatever else is ready
+            batch: List[Optional[bytes]] = [self.queue.get()]
+            while len(batch) < self.batch:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except Empty:
+                    break
+
+            counts: Dict[str, int] = defaultdict(int)
+            with self.lock:
+                for payload in batch:
+                    if payload is None:
+                        running = False
+                    else:
+                        self.send(payload, counts)
+
+            # metrics are updated once per batch
+            for name, count in counts.items():
+                self.writer.increment_metric(name, count)
+            for _ in batch:
+                self.queue.task_done()
+
+    def close(self, timeout: float = DEFAULT_TIMEOUT) -> bool:
+        """
+        Stop receiving frames and stop this sender's thread (if it's running)
+        once it's sent what's already been received. Returns False if the
+        thread didn't stop in time.
+        """
+
+        with self.lock:
+            if self.queue_id is not None:
+                self.writer.remove_queue(self.queue_id, False)
+                self.queue_id = None
+            thread = self.thread
+            self.thread = None
+
+        if thread is None:
+            return True
+
+        # the thread takes the lock to send, so it's joined without it
+        self.queue.put(None)
+        thread.join(timeout)
+        return not thread.is_alive()
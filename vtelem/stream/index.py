@@ -0,0 +1,195 @@
+"""
+vtelem - An index of frame offsets, types and timestamps for recordings.
+"""
+
+# built-in
+from bisect import bisect_left, bisect_right
+import logging
+from pathlib import Path
+from typing import BinaryIO, List, NamedTuple, Optional, Tuple
+
+# internal
+from vtelem.classes import DEFAULTS
+from vtelem.classes.codec import FRAME_HEADER, FRAME_SIZE, fields_codec
+from vtelem.enums.primitive import Primitive
+from vtelem.frame import time_to_int
+
+LOG = logging.getLogger(__name__)
+INDEX_SUFFIX = ".idx"
+
+# index record: (byte) offset, frame type, frame timestamp
+INDEX_RECORD = fields_codec(
+    Primitive.UINT64, DEFAULTS["enum"], DEFAULTS["timestamp"]
+)
+
+# the portion of a (size-prefixed) frame needed to build its index record
+INDEXED_SIZE = FRAME_SIZE.size + FRAME_HEADER.size
+
+
+def index_path(path: Path) -> Path:
+    """Get the path to the index sidecar for a recording."""
+
+    return path.with_name(path.name + INDEX_SUFFIX)
+
+
+def index_record(offset: int, data: bytes) -> bytes:
+    """
+    Build an index record for a frame (with its size header) written at a
+    given offset.
+    """
+
+    _, frame_type, timestamp, _ = FRAME_HEADER.unpack_from(
+        data, FRAME_SIZE.size
+    )
+    return INDEX_RECORD.pack(offset, frame_type, timestamp)
+
+
+class IndexEntry(NamedTuple):
+    """Attributes of a single indexed frame."""
+
+    offset: int
+    type: int
+    timestamp: int
+
+
+class FrameIndex:
+    """
+    An in-memory index of a recording that supports seeking to a specific
+    frame, or to a frame timestamp, without decoding frames.
+    """
+
+    def __init__(self) -> None:
+        """Construct an empty index."""
+
+        self.offsets: List[int] = []
+        self.types: List[int] = []
+        self.timestamps: List[int] = []
+
+    def __len__(self) -> int:
+        """Get the number of indexed frames."""
+
+        return len(self.offsets)
+
+    def add(self, offset: int, frame_type: int, timestamp: int) -> None:
+        """Add a frame to the index."""
+
+        self.offsets.append(offset)
+        self.types.append(frame_type)
+        self.timestamps.append(timestamp)
+
+    def entry(self, frame: int) -> IndexEntry:
+        """Get the indexed attributes of a specific frame."""
+
+        return IndexEntry(
+            self.offsets[frame], self.types[frame], self.timestamps[frame]
+        )
+
+    def frame_range(
+        self, start: Optional[float] = None, end: Optional[float] = None
+    ) -> Tuple[int, int]:
+        """
+        Find the (half-open) range of frames with timestamps in a given
+        (inclusive) time window. Frame timestamps are expected to be
+        non-decreasing, as they are when written by a single environment.
+        """
+
+        first = 0
+        if start is not None:
+            first = bisect_left(self.timestamps, time_to_int(start))
+        last = len(self)
+        if end is not None:
+            last = bisect_right(self.timestamps, time_to_int(end))
+        return first, max(first, last)
+
+    def write(self, stream: BinaryIO) -> int:
+        """Write this index to a stream, return the number of bytes written."""
+
+        result = 0
+        for offset, frame_type, timestamp in zip(
+            self.offsets, self.types, self.timestamps
+        ):
+            result += stream.write(
+                INDEX_RECORD.pack(offset, frame_type, timestamp)
+            )
+        return result
+
+    @staticmethod
+    def load(path: Path) -> "FrameIndex":
+        """Load an index from an index sidecar."""
+
+        result = FrameIndex()
+        data = path.read_bytes()
+        usable = len(data) - (len(data) % INDEX_RECORD.size)
+        if usable != len(data):
+            LOG.warning("'%s': ignoring partial index record", path)
+        for record in INDEX_RECORD.iter_unpack(memoryview(data)[:usable]):
+            result.add(*record)
+        return result
+
+    @staticmethod
+    def scan(path: Path) -> "FrameIndex":
+        """
+        Build an index for a recording by reading only the size and header
+        of each frame.
+        """
+
+        result = FrameIndex()
+        with path.open("rb") as stream:
+            offset = 0
+            data = stream.read(INDEXED_SIZE)
+            while len(data) == INDEXED_SIZE:
+                result.add(*INDEX_RECORD.unpack(index_record(offset, data)))
+                offset += FRAME_SIZE.size + FRAME_SIZE.unpack_from(data)[0]
+                stream.seek(offset)
+                data = stream.read(INDEXED_SIZE)
+        return result
+
+    @staticmethod
+    def get(path: Path, create: bool = True) -> Optional["FrameIndex"]:
+        """
+        Get the index for a recording from its sidecar, optionally building
+        (and writing) the sidecar if it doesn't exist.
+        """
+
+        sidecar = index_path(path)
+        if sidecar.is_file():
+            return FrameIndex.load(sidecar)
+        if not create or not path.is_file():
+            return None
+
+        LOG.info("'%s': building index", path)
+        result = FrameIndex.scan(path)
+        with sidecar.open("wb") as stream:
+            result.write(stream)
+        return result
+
+
+class IndexedStream:
+    """
+    A wrapper for a recording's stream that maintains the recording's index
+    sidecar as frames are written to it.
+    """
+
+    def __init__(
+        self, stream: BinaryIO, index: BinaryIO, offset: int = 0
+    ) -> None:
+        """Construct a new indexed stream."""
+
+        self.stream = stream
+        self.index = index
+        self.offset = offset
+        self.name = stream.name
+
+    def write(self, data: bytes) -> int:
+        """Write a (size-prefixed) frame to the stream and index it."""
+
+        result = self.stream.write(data)
+        self.index.write(index_record(self.offset, data))
+        self.offset += result
+        return result
+
+    def flush(self) -> None:
+        """Flush the stream and its index."""
+
+        self.stream.flush()
+        self.index.flush()
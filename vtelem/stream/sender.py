@@ -0,0 +1,125 @@
+"""
+vtelem - A per-stream sender that writes frames from a dedicated thread.
+"""
+
+# built-in
+from io import BytesIO
+import logging
+from queue import Empty, Queue
+import threading
+from typing import BinaryIO, Callable, Optional, Union
+
+# internal
+from vtelem import DEFAULT_TIMEOUT
+
+LOG = logging.getLogger(__name__)
+Stream = Union[BinaryIO, BytesIO]
+
+
+class StreamSender:
+    """
+    Buffers outgoing frames for a single stream and writes them from a
+    dedicated thread, so that a slow (or blocked) stream doesn't stall
+    delivery to any other output.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        stream: Stream,
+        max_size: int,
+        *,
+        on_write: Callable[[int], None],
+        on_error: Callable[[Exception], None],
+        flush: bool = False,
+    ) -> None:
+        """Construct a new sender and start its thread."""
+
+        self.name = name
+        self.stream = stream
+        self.max_size = max_size
+        self.flush = flush
+        self.on_write = on_write
+        self.on_error = on_error
+        self.failed = False
+
+        # the queue is unbounded, the buffer limit is enforced when sending
+        # so that the stop signal can always be enqueued
+        self.queue: Queue = Queue()
+        self.thread = threading.Thread(
+            target=self.run, name=self.name, daemon=True
+        )
+        self.thread.start()
+
+    @property
+    def lag(self) -> int:
+        """Get the number of frames that haven't been written yet."""
+
+        return self.queue.unfinished_tasks
+
+    def send(self, data: bytes) -> bool:
+        """
+        Buffer a frame to be written, returns False (and drops the frame) if
+        the buffer is full.
+        """
+
+        if self.lag >= self.max_size:
+            return False
+        self.queue.put_nowait(data)
+        return True
+
+    def discard(self) -> int:
+        """Discard all buffered frames, returns the number discarded."""
+
+        count = 0
+        while True:
+            try:
+                self.queue.get_nowait()
+            except Empty:
+                return count
+            self.queue.task_done()
+            count += 1
+
+    def run(self) -> None:
+        """Write buffered frames until signaled to stop."""
+
+        data: Optional[bytes] = self.queue.get()
+        while data is not None:
+            try:
+                if not self.failed:
+                    self.stream.write(data)
+                    if self.flush:
+                        self.stream.flush()
+                    self.on_write(len(data))
+            except (OSError, ValueError) as exc:
+                # writing to a stream that's been closed raises a ValueError
+                self.failed = True
+                self.on_error(exc)
+            finally:
+                self.queue.task_done()
+            data = self.queue.get()
+        self.queue.task_done()
+
+    def close(
+        self, drain: bool = True, timeout: float = DEFAULT_TIMEOUT
+    ) -> bool:
+        """
+        Signal this sender to stop once its buffered frames are written and
+        wait for that to happen, or (if not draining) discard the buffered
+        frames so that nothing else is written. Returns False if the sender
+        didn't stop in time.
+        """
+
+        if not drain:
+            self.discard()
+        self.queue.put_nowait(None)
+        if not drain or threading.current_thread() is self.thread:
+            return True
+
+        self.thread.join(timeout)
+        result = not self.thread.is_alive()
+        if not result:
+            LOG.warning(
+                "%s: timed out draining %d frames", self.name, self.lag
+            )
+        return result
@@ -5,7 +5,6 @@ vtelem - Uses daemon machinery to build the task that can consume outgoing
 
 # built-in
 from contextlib import contextmanager
-from io import BytesIO
 import logging
 from pathlib import Path
 from queue import Queue
@@ -14,28 +13,40 @@ from typing import (
     Any,
     BinaryIO,
     Callable,
-    DefaultDict,
     Dict,
     Iterator,
     List,
     Optional,
     Tuple,
-    Union,
     cast,
 )
 
+# third-party
+from typing_extensions import Protocol
+
 # internal
 from vtelem.classes import DEFAULTS
 from vtelem.classes.metered_queue import MAX_SIZE, create
 from vtelem.classes.time_entity import LockEntity
-from vtelem.classes.type_primitive import new_default
 from vtelem.daemon.queue import QueueDaemon
-from vtelem.frame.channel import ChannelFrame
+from vtelem.enums.queue import OverflowPolicy
+from vtelem.frame.channel import ChannelFrame, conflation_key
 from vtelem.mtu import Host
+from vtelem.stream.index import FrameIndex, IndexedStream, index_path
+from vtelem.stream.sender import Stream, StreamSender
 from vtelem.telemetry.environment import TelemetryEnvironment
 
 LOG = logging.getLogger(__name__)
-Stream = Union[BinaryIO, BytesIO]
+
+
+class PayloadSink(Protocol):  # pylint: disable=too-few-public-methods
+    """
+    Anything that (size-prefixed) frame payloads can be put into, such as a
+    queue. None is put when no more payloads will follow.
+    """
+
+    def put(self, item: Optional[bytes]) -> None:
+        """Put a payload into this sink."""
 
 
 class StreamWriter(QueueDaemon):
@@ -51,71 +62,69 @@ class StreamWriter(QueueDaemon):
         error_handle: Callable[[int], None] = None,
         env: TelemetryEnvironment = None,
         time_keeper: Any = None,
+        *,
+        stream_buffer: int = MAX_SIZE,
+        max_lag: int = None,
     ) -> None:
-        """Construct a new stream-writer daemon."""
+        """
+        Construct a new stream-writer daemon. Each stream buffers (up to
+        'stream_buffer') frames that haven't been written yet, streams that
+        fall more than 'max_lag' frames behind are removed. Frames are dropped
+        once the buffer is full, so a stream can only fall 'stream_buffer'
+        frames behind and 'max_lag' must be less than that.
+        """
+
+        assert max_lag is None or max_lag < stream_buffer
 
         self.curr_id: int = 0
         self.queue_id: int = 0
         self.streams: Dict[int, Stream] = {}
-        self.stream_attrs: Dict[int, Dict[str, bool]] = DefaultDict(
-            lambda: DefaultDict(bool)
-        )
+        self.senders: Dict[int, StreamSender] = {}
         self.stream_closers: Dict[int, Optional[Callable]] = {}
-        self.queues: Dict[int, Queue] = {}
+        self.queues: Dict[int, PayloadSink] = {}
         self.error_handle = error_handle
-
-        frame_size = new_default("count")
+        self.stream_buffer = stream_buffer
+        self.max_lag = max_lag
 
         def frame_handle(frame: Optional[ChannelFrame]) -> None:
-            """Write this frame to all registered streams."""
+            """
+            Buffer this frame for all registered streams and queues, the
+            same (size-prefixed) payload is shared by all of them.
+            """
 
             if frame is not None:
-                array, size = frame.with_size_header(frame_size)
+                payload = frame.payload
 
                 with self.lock:
                     queues = list(self.queues.values())
-                    streams = self.streams.copy()
+                    senders = self.senders.copy()
 
+                # streams are written from their own threads, remove streams
+                # that have fallen too far behind
                 to_remove = []
-                for stream_id, stream in streams.items():
-                    try:
-                        assert stream.write(array) == size
-                        if self.stream_attrs[stream_id]["flush"]:
-                            stream.flush()
-                        self.increment_metric("stream_writes")
-                        self.increment_metric("bytes_written", size)
-                    except OSError as exc:
-                        msg = (
-                            "stream '%s' (%d) error writing %d "
-                            + "bytes: %s (%d)"
-                        )
-                        LOG.error(
-                            msg,
-                            stream.name,
+                max_lag = 0
+                for stream_id, sender in senders.items():
+                    lag = sender.lag
+                    max_lag = max(max_lag, lag)
+                    if self.max_lag is not None and lag > self.max_lag:
+                        LOG.warning(
+                            "stream '%s' (%d) is %d frames behind",
+                            sender.stream.name,
                             stream_id,
-                            len(array),
-                            exc.strerror,
-                            exc.errno,
+                            lag,
                         )
-                        to_remove.append((stream_id, stream))
+                        self.increment_metric("stream_lag_disconnects")
+                        to_remove.append(stream_id)
+                    elif not sender.send(payload):
+                        self.increment_metric("stream_drops")
+                self.reset_metric("max_stream_lag", max_lag)
 
-                # remove streams that errored when writing
-                for stream_id, stream in to_remove:
-                    LOG.warning(
-                        "removing stream '%s' (%d) errors writing",
-                        stream.name,
-                        stream_id,
-                    )
-
-                    # signal parent that their stream may be broken
-                    if self.error_handle is not None:
-                        self.error_handle(stream_id)
-
-                    assert self.remove_stream(stream_id)
+                for stream_id in to_remove:
+                    self.stream_error(stream_id)
 
             # add to queues
             for queue in queues:
-                queue.put(frame)
+                queue.put(payload)
             self.increment_metric("queue_writes", len(queues))
 
         super().__init__(name, frame_queue, frame_handle, env, time_keeper)
@@ -125,6 +134,56 @@ class StreamWriter(QueueDaemon):
         self.reset_metric("stream_count")
         self.reset_metric("queue_writes")
         self.reset_metric("queue_count")
+        self.reset_metric("stream_drops")
+        self.reset_metric("stream_lag_disconnects")
+        self.reset_metric("max_stream_lag")
+
+    def await_empty(self, interval: float = 0.1) -> None:
+        """
+        Wait until this daemon's queue is empty, and all buffered frames have
+        been written to streams, via polling.
+        """
+
+        # frames that have been de-queued may not have been buffered yet
+        while self.queue.unfinished_tasks or any(
+            sender.lag for sender in self.get_senders()
+        ):
+            self.function["sleep"](interval)
+
+    def get_senders(self) -> List[StreamSender]:
+        """Get all current stream senders."""
+
+        with self.lock:
+            result = list(self.senders.values())
+        return result
+
+    def stream_lag(self) -> Dict[int, int]:
+        """Get the number of frames each stream is behind by."""
+
+        with self.lock:
+            result = {
+                stream_id: sender.lag
+                for stream_id, sender in self.senders.items()
+            }
+        return result
+
+    def stream_error(self, stream_id: int) -> None:
+        """Remove a stream that can't be written to (if it's still present)."""
+
+        with self.lock:
+            stream = self.streams.get(stream_id)
+        if stream is None:
+            return
+
+        LOG.warning(
+            "removing stream '%s' (%d) errors writing", stream.name, stream_id
+        )
+
+        # signal parent that their stream may be broken
+        if self.error_handle is not None:
+            self.error_handle(stream_id)
+
+        self.remove_stream(stream_id, drain=False)
 
     @property
     def overhead(self) -> int:
@@ -132,16 +191,27 @@ class StreamWriter(QueueDaemon):
 
         return DEFAULTS["count"].value.size
 
-    def get_queue(self, name: str = None, maxsize: int = MAX_SIZE) -> Queue:
-        """Get a default queue."""
+    def get_queue(
+        self,
+        name: str = None,
+        maxsize: int = MAX_SIZE,
+        policy: OverflowPolicy = OverflowPolicy.BLOCK,
+    ) -> Queue:
+        """
+        Get a default queue. The overflow policy determines what happens to
+        frames written to the queue when it's full.
+        """
 
         env: Any = None
         if name is not None:
             env = self.env
-        return create(name, env, maxsize)
+        return create(name, env, maxsize, policy, conflation_key)
 
-    def add_queue(self, queue: Queue) -> int:
-        """Add a queue and return its integer identifier."""
+    def add_queue(self, queue: PayloadSink) -> int:
+        """
+        Add a queue (or any other payload sink) and return its integer
+        identifier.
+        """
 
         with self.lock:
             result = self.queue_id
@@ -154,10 +224,14 @@ class StreamWriter(QueueDaemon):
         self,
         name: str = None,
         maxsize: int = MAX_SIZE,
+        policy: OverflowPolicy = OverflowPolicy.BLOCK,
     ) -> Tuple[int, Queue]:
-        """Construct a default queue, register it and return the result."""
+        """
+        Construct a default queue, register it and return the result. The
+        queue receives each frame as (size-prefixed) bytes.
+        """
 
-        queue = self.get_queue(name, maxsize)
+        queue = self.get_queue(name, maxsize, policy)
         return self.add_queue(queue), queue
 
     def add_stream(
@@ -170,9 +244,34 @@ class StreamWriter(QueueDaemon):
 
         with self.lock:
             result = self.curr_id
+
+            def on_write(size: int) -> None:
+                """Update metrics when a frame is written."""
+
+                self.increment_metric("stream_writes")
+                self.increment_metric("bytes_written", size)
+
+            def on_error(exc: Exception) -> None:
+                """Handle an error writing to the stream."""
+
+                LOG.error(
+                    "stream '%s' (%d) error writing: %s",
+                    stream.name,
+                    result,
+                    exc,
+                )
+                self.stream_error(result)
+
             self.streams[result] = stream
+            self.senders[result] = StreamSender(
+                f"{self.name}.stream{result}",
+                stream,
+                self.stream_buffer,
+                on_write=on_write,
+                on_error=on_error,
+                flush=flush,
+            )
             self.stream_closers[result] = stream_closer
-            self.stream_attrs[result]["flush"] = flush
             self.curr_id += 1
         self.increment_metric("stream_count")
         return result
@@ -194,15 +293,38 @@ class StreamWriter(QueueDaemon):
 
     @contextmanager
     def add_file(
-        self, path: Path, flush: bool = False, append: bool = True
+        self,
+        path: Path,
+        flush: bool = False,
+        append: bool = True,
+        index: bool = False,
     ) -> Iterator[None]:
-        """Add a file as an output."""
+        """
+        Add a file as an output, optionally maintaining an index sidecar for
+        it.
+        """
 
         mode = f"{'a' if append else 'w'}b"
         with path.open(mode) as stream:
-            with self.stream_added(cast(BinaryIO, stream), flush=flush):
-                yield
-            stream.flush()
+            if not index:
+                with self.stream_added(cast(BinaryIO, stream), flush=flush):
+                    yield
+                stream.flush()
+                return
+
+            # make sure any existing frames are indexed before appending
+            if append:
+                FrameIndex.get(path)
+
+            with index_path(path).open(mode) as index_stream:
+                output = IndexedStream(
+                    cast(BinaryIO, stream),
+                    cast(BinaryIO, index_stream),
+                    stream.tell(),
+                )
+                with self.stream_added(cast(BinaryIO, output), flush=flush):
+                    yield
+                output.flush()
 
     def add_semaphore_stream(self, stream: Stream) -> Tuple[int, Semaphore]:
         """
@@ -212,16 +334,25 @@ class StreamWriter(QueueDaemon):
         sem = Semaphore(0)
         return self.add_stream(stream, sem.release), sem
 
-    def remove_stream(self, stream_id: int, call_closer: bool = True) -> bool:
-        """Remove a stream, if one is present with this identifier."""
+    def remove_stream(
+        self, stream_id: int, call_closer: bool = True, drain: bool = True
+    ) -> bool:
+        """
+        Remove a stream, if one is present with this identifier. Optionally
+        wait for frames already buffered for the stream to be written.
+        """
 
         closer = None
+        sender = None
         with self.lock:
             result = stream_id in self.streams
             if result:
                 del self.streams[stream_id]
+                sender = self.senders.pop(stream_id)
                 closer = self.stream_closers[stream_id]
                 del self.stream_closers[stream_id]
+        if sender is not None:
+            sender.close(drain)
         if closer is not None and call_closer:
             closer()
         if result:
@@ -250,12 +381,21 @@ class QueueClientManager(LockEntity):
     A class for exposing common stream-writer queue registration operations.
     """
 
-    def __init__(self, name: str, writer: StreamWriter) -> None:
-        """Construct a new queue-client manager."""
+    def __init__(
+        self,
+        name: str,
+        writer: StreamWriter,
+        policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+    ) -> None:
+        """
+        Construct a new queue-client manager. Client queues don't block the
+        stream writer by default, slow clients miss the oldest frames.
+        """
 
         LockEntity.__init__(self)
         self.name = name
         self.writer = writer
+        self.policy = policy
         self.active_client_queues: List[int] = []
 
     def add_client_queue(self, addr: Host = None) -> Tuple[int, Queue]:
@@ -264,7 +404,9 @@ class QueueClientManager(LockEntity):
         name = None
         if addr is not None:
             name = f"{self.name}.{addr.address}:{addr.port}"
-        queue_id, frame_queue = self.writer.registered_queue(name)
+        queue_id, frame_queue = self.writer.registered_queue(
+            name, policy=self.policy
+        )
         with self.lock:
             self.active_client_queues.append(queue_id)
         return queue_id, frame_queue
@@ -5,12 +5,13 @@ vtelem - An environment that supports management of telemetry.
 # built-in
 from collections import defaultdict
 from enum import IntEnum
-from typing import Dict, List, Optional, Tuple, Type
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type
 
 # internal
 from vtelem.channel import Channel
 from vtelem.channel.environment import ChannelEnvironment
 from vtelem.classes import DEFAULTS
+from vtelem.classes.event_queue import DEFAULT_CAPACITY
 from vtelem.classes.user_enum import UserEnum, from_enum
 from vtelem.enums.primitive import Primitive
 from vtelem.registry.enum import EnumRegistry
@@ -33,6 +34,8 @@ class TelemetryEnvironment(ChannelEnvironment):
         initial_enums: List[UserEnum] = None,
         app_id_basis: float = None,
         use_crc: bool = True,
+        *,
+        event_capacity: int = DEFAULT_CAPACITY,
     ) -> None:
         """Construct a new telemetry environment."""
 
@@ -43,6 +46,7 @@ class TelemetryEnvironment(ChannelEnvironment):
             init_time,
             app_id_basis,
             use_crc,
+            event_capacity=event_capacity,
         )
         self.enum_registry = EnumRegistry(initial_enums)
         self.type_registry = get_default()
@@ -89,6 +93,28 @@ class TelemetryEnvironment(ChannelEnvironment):
 
         return self.enum_channel_types[chan_id] != -1
 
+    def set_many(
+        self, ids: Sequence[int], values: Sequence[Any], time: float = None
+    ) -> int:
+        """
+        Set many channels at once, returns the number of channels that were
+        set. Enum channels can be set with the String value.
+        """
+
+        if any(isinstance(value, str) for value in values):
+            values = list(values)
+            for idx, chan_id in enumerate(ids):
+                if isinstance(values[idx], str) and self.is_enum_channel(
+                    chan_id
+                ):
+                    enum_def = self.enum_registry.get_item(
+                        self.enum_channel_types[chan_id]
+                    )
+                    assert enum_def is not None
+                    values[idx] = enum_def.get_value(values[idx])
+
+        return super().set_many(ids, values, time)
+
     def add_enum_channel(
         self,
         name: str,
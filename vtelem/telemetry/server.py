@@ -156,6 +156,14 @@ class TelemetryServer(HttpDaemon):
             services.udp if services.udp is not None else []
         )
 
+        # add the multicast publisher
+        if services.multicast is not None and services.multicast.enabled:
+            self.udp_clients.add_multicast(
+                services.multicast.host,
+                services.multicast.ttl,
+                services.multicast.interface_ip,
+            )
+
     def register_application(
         self, name: str, rate: float, setup: AppSetup, loop: AppLoop
     ) -> bool:
@@ -219,7 +227,7 @@ class TelemetryServer(HttpDaemon):
             assert self.perform(DaemonOperation.STOP)
         self.close()
 
-        self.udp_clients.remove_all()
+        self.udp_clients.close()
         self.state_sem.release()
 
     @contextmanager
@@ -7,7 +7,7 @@ from typing import Any, Callable, Dict, List, NamedTuple, Optional
 
 # internal
 from vtelem.channel.group_registry import ChannelGroupRegistry
-from vtelem.mtu import Host
+from vtelem.mtu import DEFAULT_MULTICAST_TTL, Host
 
 AppSetup = Callable[[ChannelGroupRegistry, Dict[str, Any]], None]
 AppLoop = Callable[[ChannelGroupRegistry, Dict[str, Any]], None]
@@ -21,6 +21,16 @@ class Service(NamedTuple):
     enabled: bool = True
 
 
+class MulticastService(NamedTuple):
+    """A definition for a multicast telemetry publisher."""
+
+    name: str
+    host: Host
+    ttl: int = DEFAULT_MULTICAST_TTL
+    interface_ip: Optional[str] = None
+    enabled: bool = True
+
+
 class TelemetryServices(NamedTuple):
     """
     A container for all possible telemetry services that can be configured.
@@ -31,6 +41,7 @@ class TelemetryServices(NamedTuple):
     websocket_tlm: Service
     tcp_tlm: Service
     udp: Optional[List[Host]] = None
+    multicast: Optional[MulticastService] = None
 
 
 def default_services(**kwargs: Service) -> TelemetryServices: